@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Time type checking functions with many branches that narrow types.
+
+Usage:
+
+  python3 misc/binder_benchmark.py [NUM_BRANCHES]
+
+This generates two functions with NUM_BRANCHES (500 by default) branches
+each: one where the branches are nested in each other, and one with a
+long if/elif chain. The branches narrow a union with isinstance checks and
+assign to variables in loops, so the conditional type binder pushes and
+pops a frame for each of them. Only the time spent type checking the
+generated module is reported.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mypy import build
+from mypy.checker import TypeChecker
+from mypy.options import Options
+
+
+FIXTURE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                       'test-data', 'unit', 'fixtures', 'isinstance.py')
+
+HEADER = """\
+from typing import Union
+
+def f(x: Union[int, str], z: bool) -> int:
+    y = 0  # type: int
+    a = 0  # type: int
+"""
+
+
+def nested_source(num_branches: int) -> str:
+    lines = [HEADER]
+    indent = '    '
+    for i in range(num_branches):
+        if i % 2 == 0:
+            lines.append(indent + 'if isinstance(x, int):\n')
+            lines.append(indent + '    y = x + y\n')
+        else:
+            lines.append(indent + 'while z:\n')
+            lines.append(indent + '    a = y + a\n')
+            lines.append(indent + '    x = a\n')
+        indent += '    '
+    lines.append('    return y\n')
+    return ''.join(lines)
+
+
+def chain_source(num_branches: int) -> str:
+    lines = [HEADER]
+    for i in range(num_branches):
+        lines.append('    if z:\n' if i == 0 else '    elif z:\n')
+        if i % 2 == 0:
+            lines.append('        if isinstance(x, int):\n')
+            lines.append('            y = x + y\n')
+            lines.append('        else:\n')
+            lines.append('            x = 1\n')
+        else:
+            lines.append('        while z:\n')
+            lines.append('            a = y + a\n')
+            lines.append('            x = a\n')
+    lines.append('    return y\n')
+    return ''.join(lines)
+
+
+def measure(name: str, source: str, lib_path: str, repeat: int = 3) -> None:
+    orig_visit_file = TypeChecker.visit_file
+    elapsed = [0.0]
+
+    def visit_file(self: TypeChecker, *args: object) -> None:
+        t0 = time.time()
+        orig_visit_file(self, *args)
+        elapsed[0] += time.time() - t0
+
+    best = None
+    TypeChecker.visit_file = visit_file  # type: ignore
+    try:
+        for i in range(repeat):
+            options = Options()
+            options.use_builtins_fixtures = True
+            elapsed[0] = 0.0
+            result = build.build([build.BuildSource(None, 'main', source)], options,
+                                 alt_lib_path=lib_path)
+            assert not result.errors, result.errors[:5]
+            if best is None or elapsed[0] < best:
+                best = elapsed[0]
+    finally:
+        TypeChecker.visit_file = orig_visit_file  # type: ignore
+    print('%-40s %8.2f ms' % (name, best * 1000))
+
+
+def main() -> None:
+    num_branches = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    # The parser and the checker recurse once per nested block.
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 40 * num_branches))
+    lib_path = tempfile.mkdtemp()
+    try:
+        shutil.copy(FIXTURE, os.path.join(lib_path, 'builtins.py'))
+        print('%d branches' % num_branches)
+        measure('nested branches', nested_source(num_branches), lib_path)
+        measure('if/elif chain', chain_source(num_branches), lib_path)
+    finally:
+        shutil.rmtree(lib_path)
+
+
+if __name__ == '__main__':
+    main()
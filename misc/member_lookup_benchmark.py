@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Time looking up members of classes in a deep class hierarchy.
+
+Usage:
+
+  python3 misc/member_lookup_benchmark.py [DEPTH [NUM_MEMBERS]]
+
+This builds a chain of DEPTH (15 by default) classes, each deriving from
+the previous one and defining NUM_MEMBERS (10 by default) attributes and
+methods, and looks up members of the most derived class: ones defined in
+the root class, ones defined in the class itself and names that are not
+defined anywhere.
+"""
+
+import os
+import sys
+import time
+from typing import Callable, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mypy.nodes import Block, FuncDef, MDEF, SymbolTableNode, TypeInfo, Var
+from mypy.typefixture import TypeFixture
+
+
+def measure(name: str, func: Callable[[], object], repeat: int = 3) -> None:
+    best = None
+    for i in range(repeat):
+        t0 = time.time()
+        func()
+        elapsed = time.time() - t0
+        if best is None or elapsed < best:
+            best = elapsed
+    print('%-40s %8.2f ms' % (name, best * 1000))
+
+
+def main() -> None:
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+    num_members = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    fx = TypeFixture()
+    mro = [fx.oi]  # type: List[TypeInfo]
+    for i in range(depth):
+        info = fx.make_type_info('C%d' % i, mro=mro)
+        for j in range(num_members):
+            info.names['a%d_%d' % (i, j)] = SymbolTableNode(MDEF, Var('a%d_%d' % (i, j)))
+            info.names['m%d_%d' % (i, j)] = SymbolTableNode(
+                MDEF, FuncDef('m%d_%d' % (i, j), [], Block([])))
+        mro = [info] + mro
+    leaf = mro[0]
+    root_names = ['a0_%d' % j for j in range(num_members)]
+    leaf_names = ['m%d_%d' % (depth - 1, j) for j in range(num_members)]
+    missing_names = ['x%d' % j for j in range(num_members)]
+
+    def lookup(names: List[str]) -> Callable[[], None]:
+        def run() -> None:
+            for i in range(10000):
+                for name in names:
+                    leaf.get(name)
+        return run
+
+    print('%d classes, %d members each' % (depth, 2 * num_members))
+    measure('get() member of root class x%d' % (10000 * num_members), lookup(root_names))
+    measure('get() member of leaf class x%d' % (10000 * num_members), lookup(leaf_names))
+    measure('get() missing member x%d' % (10000 * num_members), lookup(missing_names))
+
+
+if __name__ == '__main__':
+    main()
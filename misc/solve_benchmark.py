@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Time type argument inference for calls with many arguments.
+
+Usage:
+
+  python3 misc/solve_benchmark.py [NUM_ARGS [NUM_VARS]]
+
+This infers and solves the constraints for a call to a generic function
+with NUM_ARGS (50 by default) arguments and NUM_VARS (10 by default) type
+variables. Each argument has type G[G[T]] for one of the type variables T,
+and the actual arguments alternate between G[G[A]], G[G[B]] and G[G[C]],
+so that the solver sees many duplicate constraints. Memoized results are
+discarded before each run.
+"""
+
+import os
+import sys
+import time
+from typing import Callable, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mypy.constraints import infer_constraints_for_callable
+from mypy.infer import infer_function_type_arguments
+from mypy.nodes import ARG_POS
+from mypy.solve import solve_constraints
+from mypy.typefixture import TypeFixture
+from mypy.types import CallableType, Instance, Type, TypeVarDef, TypeVarId, TypeVarType
+from mypy.util import memo_tables
+
+
+def measure(name: str, func: Callable[[], object], repeat: int = 3) -> None:
+    best = None
+    for i in range(repeat):
+        for table in memo_tables:
+            table.clear()
+        t0 = time.time()
+        func()
+        elapsed = time.time() - t0
+        if best is None or elapsed < best:
+            best = elapsed
+    print('%-40s %8.2f ms' % (name, best * 1000))
+
+
+def main() -> None:
+    num_args = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    num_vars = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    fx = TypeFixture()
+    tvars = [TypeVarDef('T%d' % i, -1 - i, [], fx.o) for i in range(num_vars)]
+    formals = [Instance(fx.gi, [Instance(fx.gi, [TypeVarType(tvars[i % num_vars])])])
+               for i in range(num_args)]  # type: List[Type]
+    callee = CallableType(formals, [ARG_POS] * num_args, [None] * num_args,
+                          fx.o, fx.function, variables=tvars)
+    classes = [fx.a, fx.b, fx.c]
+    actuals = [Instance(fx.gi, [Instance(fx.gi, [classes[i % len(classes)]])])
+               for i in range(num_args)]  # type: List[Type]
+    formal_to_actual = [[i] for i in range(num_args)]
+    var_ids = [TypeVarId(tv.id.raw_id) for tv in tvars]
+    constraints = infer_constraints_for_callable(callee, actuals, [ARG_POS] * num_args,
+                                                 formal_to_actual)
+
+    def infer() -> None:
+        for i in range(100):
+            infer_function_type_arguments(callee, actuals, [ARG_POS] * num_args,
+                                          formal_to_actual)
+
+    def solve() -> None:
+        for i in range(100):
+            solve_constraints(var_ids, constraints)
+
+    print('%d arguments, %d type variables, %d constraints' % (
+        num_args, num_vars, len(constraints)))
+    measure('infer_function_type_arguments x100', infer)
+    measure('solve_constraints x100', solve)
+
+
+if __name__ == '__main__':
+    main()
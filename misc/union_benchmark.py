@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Time operations on large union types.
+
+Usage:
+
+  python3 misc/union_benchmark.py [NUM_ITEMS]
+
+This builds unions of instances of NUM_ITEMS (200 by default) unrelated
+classes, plus None, and times simplifying them, subtype checks between
+them and removing items from them, both all at once and one item at a time
+like a chain of isinstance checks would. Memoized results are discarded before each run.
+"""
+
+import os
+import sys
+import time
+from typing import Callable, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mypy.subtypes import is_subtype, restrict_subtype_away
+from mypy.typefixture import TypeFixture
+from mypy.types import Instance, NoneTyp, Type, UnionType
+from mypy.util import memo_tables
+
+
+def measure(name: str, func: Callable[[], object], repeat: int = 3) -> None:
+    best = None
+    for i in range(repeat):
+        for table in memo_tables:
+            table.clear()
+        t0 = time.time()
+        func()
+        elapsed = time.time() - t0
+        if best is None or elapsed < best:
+            best = elapsed
+    print('%-40s %8.2f ms' % (name, best * 1000))
+
+
+def main() -> None:
+    num_items = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    fx = TypeFixture()
+    items = [Instance(fx.make_type_info('C%d' % i), [])
+             for i in range(num_items)]  # type: List[Type]
+    items.append(NoneTyp())
+    union = UnionType(items)
+
+    def simplify() -> None:
+        UnionType.make_simplified_union(items + items)
+
+    def subtype() -> None:
+        is_subtype(union, UnionType(list(reversed(items))))
+
+    def restrict() -> None:
+        restrict_subtype_away(union, UnionType(items[::2]))
+
+    def narrow() -> None:
+        t = union  # type: Type
+        for item in items[:-1]:
+            t = restrict_subtype_away(t, item)
+
+    print('%d items' % len(items))
+    measure('make_simplified_union', simplify)
+    measure('is_subtype(Union, Union)', subtype)
+    measure('restrict_subtype_away(Union, Union)', restrict)
+    measure('restrict_subtype_away chain', narrow)
+
+
+if __name__ == '__main__':
+    main()
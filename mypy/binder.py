@@ -1,4 +1,4 @@
-from typing import (Any, Dict, List, Set, Iterator)
+from typing import (Any, Dict, List, Set, Iterator, Tuple)
 from contextlib import contextmanager
 
 from mypy.types import Type, AnyType, PartialType
@@ -44,6 +44,11 @@ class ConditionalTypeBinder:
         # to types.
         self.frames = [Frame()]
 
+        # Maps each key in the frames to the indexes of the frames that
+        # contain it and the types there, innermost last.  This lets us find
+        # the type of a key without walking through all the frames.
+        self.bindings = {}  # type: Dict[Key, List[Tuple[int, Type]]]
+
         # For frames higher in the stack, we record the set of
         # Frames that can escape there
         self.options_on_return = []  # type: List[List[Frame]]
@@ -86,14 +91,24 @@ class ConditionalTypeBinder:
         return f
 
     def _push(self, key: Key, type: Type, index: int=-1) -> None:
+        if index < 0:
+            index += len(self.frames)
         self.frames[index][key] = type
+        bindings = self.bindings.setdefault(key, [])
+        i = len(bindings)
+        while i > 0 and bindings[i - 1][0] > index:
+            i -= 1
+        if i > 0 and bindings[i - 1][0] == index:
+            bindings[i - 1] = (index, type)
+        else:
+            bindings.insert(i, (index, type))
 
     def _get(self, key: Key, index: int=-1) -> Type:
         if index < 0:
             index += len(self.frames)
-        for i in range(index, -1, -1):
-            if key in self.frames[i]:
-                return self.frames[i][key]
+        for i, type in reversed(self.bindings.get(key, ())):
+            if i <= index:
+                return type
         return None
 
     def push(self, expr: Node, typ: Type) -> None:
@@ -114,9 +129,8 @@ class ConditionalTypeBinder:
 
     def _cleanse_key(self, key: Key) -> None:
         """Remove all references to a key from the binder."""
-        for frame in self.frames:
-            if key in frame:
-                del frame[key]
+        for i, type in self.bindings.pop(key, ()):
+            del self.frames[i][key]
 
     def update_from_options(self, frames: List[Frame]) -> bool:
         """Update the frame to reflect that each key will be updated
@@ -135,6 +149,9 @@ class ConditionalTypeBinder:
             if any(x is None for x in resulting_values):
                 continue
 
+            if all(t is current_value for t in resulting_values):
+                # No option changed the type.
+                continue
             if isinstance(self.declarations.get(key), AnyType):
                 type = resulting_values[0]
                 if not all(is_same_type(type, t) for t in resulting_values[1:]):
@@ -158,6 +175,10 @@ class ConditionalTypeBinder:
             self.allow_jump(-fall_through)
 
         result = self.frames.pop()
+        for key in result:
+            self.bindings[key].pop()
+            if not self.bindings[key]:
+                del self.bindings[key]
         options = self.options_on_return.pop()
 
         self.last_pop_changed = self.update_from_options(options)
@@ -226,11 +247,10 @@ class ConditionalTypeBinder:
     def most_recent_enclosing_type(self, expr: Node, type: Type) -> Type:
         if isinstance(type, AnyType):
             return self.get_declaration(expr)
-        key = expr.literal_hash
-        enclosers = ([self.get_declaration(expr)] +
-                     [f[key] for f in self.frames
-                      if key in f and is_subtype(type, f[key])])
-        return enclosers[-1]
+        for i, enclosing_type in reversed(self.bindings.get(expr.literal_hash, ())):
+            if is_subtype(type, enclosing_type):
+                return enclosing_type
+        return self.get_declaration(expr)
 
     def allow_jump(self, index: int) -> None:
         # self.frames and self.options_on_return have different lengths
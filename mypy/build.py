@@ -12,8 +12,10 @@ The function build() is the main interface to this module.
 
 import binascii
 import collections
+import concurrent.futures
 import contextlib
 import json
+import mmap
 import os
 import os.path
 import sys
@@ -24,11 +26,12 @@ from typing import (AbstractSet, Dict, Iterable, Iterator, List,
                     NamedTuple, Optional, Set, Tuple, Union, Mapping)
 
 from mypy.types import Type
-from mypy.nodes import (MypyFile, Node, Import, ImportFrom, ImportAll,
+from mypy.nodes import (MypyFile, Node, ImportBase, Import, ImportFrom, ImportAll,
                         SymbolTableNode, MODULE_REF)
 from mypy.semanal import FirstPass, SemanticAnalyzer, ThirdPass
 from mypy.checker import TypeChecker
 from mypy.errors import Errors, CompileError, DecodeError, report_internal_error
+from mypy import checkmember
 from mypy import fixup
 from mypy.report import Reports
 from mypy import defaults
@@ -37,6 +40,7 @@ from mypy import util
 from mypy.fixup import fixup_module_pass_one, fixup_module_pass_two
 from mypy.options import Options
 from mypy.parse import parse
+from mypy.importscan import scan_imports
 from mypy.stats import dump_type_stats
 from mypy.version import __version__
 
@@ -174,6 +178,11 @@ def build(sources: List[BuildSource],
                            reports=reports,
                            options=options)
 
+    # Cached results refer to the classes of a single build.
+    for table in util.memo_tables:
+        table.clear()
+        table.reset_stats()
+
     try:
         dispatch(sources, manager)
         return BuildResult(manager)
@@ -182,6 +191,10 @@ def build(sources: List[BuildSource],
                     (len(manager.modules),
                      len(manager.type_checker.type_map),
                      manager.errors.num_messages()))
+        for table in util.memo_tables:
+            if table.hits or table.misses:
+                manager.log(table.stats())
+        manager.source_prefetcher.shutdown()
         # Finish the HTML or XML reports even if CompileError was raised.
         reports.finish()
 
@@ -342,6 +355,7 @@ class BuildManager:
         self.type_checker = TypeChecker(self.errors, self.modules, options=options)
         self.missing_modules = set()  # type: Set[str]
         self.stale_modules = set()  # type: Set[str]
+        self.source_prefetcher = SourcePrefetcher(options.python_version)
 
     def all_imported_modules_in_file(self,
                                      file: MypyFile) -> List[Tuple[int, str, int]]:
@@ -350,14 +364,19 @@ class BuildManager:
         Return list of tuples (priority, module id, import line number)
         for all modules imported in file; lower numbers == higher priority.
         """
+        return self.all_imported_modules(file.fullname(), file.path, file.imports)
+
+    def all_imported_modules(self, module_id: str, path: str,
+                             imports: List[ImportBase]) -> List[Tuple[int, str, int]]:
+        """Like all_imported_modules_in_file(), but take the module id, path and imports."""
 
         def correct_rel_imp(imp: Union[ImportFrom, ImportAll]) -> str:
             """Function to correct for relative imports."""
-            file_id = file.fullname()
             rel = imp.relative
             if rel == 0:
                 return imp.id
-            if os.path.basename(file.path).startswith('__init__.'):
+            file_id = module_id
+            if os.path.basename(path).startswith('__init__.'):
                 rel -= 1
             if rel != 0:
                 file_id = ".".join(file_id.split(".")[:-rel])
@@ -366,7 +385,7 @@ class BuildManager:
             return new_id
 
         res = []  # type: List[Tuple[int, str, int]]
-        for imp in file.imports:
+        for imp in imports:
             if not imp.is_unreachable:
                 if isinstance(imp, Import):
                     pri = PRI_MED if imp.is_top_level else PRI_LOW
@@ -407,6 +426,16 @@ class BuildManager:
         """Is there a file in the file system corresponding to module id?"""
         return find_module(id, self.lib_path) is not None
 
+    def prefetch_modules(self, ids: Iterable[str]) -> None:
+        """Start reading the source files of modules that will be parsed soon."""
+        for id in ids:
+            if id == 'builtins' and self.options.python_version[0] == 2:
+                id = '__builtin__'
+            path = find_module(id, self.lib_path)
+            # Modules skipped by --silent-imports are never read.
+            if path and not (self.options.silent_imports and path.endswith('.py')):
+                self.source_prefetcher.prefetch(path)
+
     def parse_file(self, id: str, path: str, source: str) -> MypyFile:
         """Parse the source of a file with the given name.
 
@@ -630,33 +659,86 @@ def verify_module(id: str, path: str) -> bool:
     return True
 
 
+# Source files at least this large are memory-mapped rather than read into
+# a bytes object before decoding.
+MMAP_THRESHOLD = 64 * 1024
+
+
 def read_with_python_encoding(path: str, pyversion: Tuple[int, int]) -> str:
     """Read the Python file with while obeying PEP-263 encoding detection"""
-    source_bytearray = bytearray()
-    encoding = 'utf8' if pyversion[0] >= 3 else 'ascii'
-
     with open(path, 'rb') as f:
-        # read first two lines and check if PEP-263 coding is present
-        source_bytearray.extend(f.readline())
-        source_bytearray.extend(f.readline())
-
-        # check for BOM UTF-8 encoding and strip it out if present
-        if source_bytearray.startswith(b'\xef\xbb\xbf'):
-            encoding = 'utf8'
-            source_bytearray = source_bytearray[3:]
-        else:
-            _encoding, _ = util.find_python_encoding(source_bytearray, pyversion)
-            # check that the coding isn't mypy. We skip it since
-            # registering may not have happened yet
-            if _encoding != 'mypy':
-                encoding = _encoding
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_THRESHOLD:
+            return decode_python_source(f.read(), pyversion)
+        with contextlib.closing(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)) as data:
+            with memoryview(data) as view:
+                return decode_python_source(view, pyversion)
 
-        source_bytearray.extend(f.read())
-        try:
-            source_bytearray.decode(encoding)
-        except LookupError as lookuperr:
-            raise DecodeError(str(lookuperr))
-        return source_bytearray.decode(encoding)
+
+class SourcePrefetcher:
+    """Read and decode module source files on a thread pool.
+
+    load_graph() asks for the sources of newly discovered modules before it
+    parses them, so that reading files overlaps with parsing. Sources that
+    were not prefetched are read synchronously.
+    """
+
+    def __init__(self, pyversion: Tuple[int, int], max_workers: int = 4) -> None:
+        self.pyversion = pyversion
+        self.max_workers = max_workers
+        # Created on first use, since many builds only have a handful of files.
+        self.executor = None  # type: concurrent.futures.ThreadPoolExecutor
+        self.pending = {}  # type: Dict[str, concurrent.futures.Future[str]]
+
+    def prefetch(self, path: str) -> None:
+        if path in self.pending:
+            return
+        if self.executor is None:
+            self.executor = concurrent.futures.ThreadPoolExecutor(self.max_workers)
+        self.pending[path] = self.executor.submit(read_with_python_encoding,
+                                                  path, self.pyversion)
+
+    def read(self, path: str) -> str:
+        """Return the decoded source of a file.
+
+        Raise the same exceptions as read_with_python_encoding().
+        """
+        future = self.pending.pop(path, None)
+        if future is None:
+            return read_with_python_encoding(path, self.pyversion)
+        return future.result()
+
+    def shutdown(self) -> None:
+        for future in self.pending.values():
+            future.cancel()
+        self.pending.clear()
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+
+def decode_python_source(data: Union[bytes, memoryview], pyversion: Tuple[int, int]) -> str:
+    """Decode the contents of a Python file, detecting the encoding only once.
+
+    A UTF-8 byte order mark is stripped. Raise DecodeError if the encoding
+    is unknown and UnicodeDecodeError if the contents can't be decoded.
+    """
+    encoding = 'utf8' if pyversion[0] >= 3 else 'ascii'
+    start = 0
+    # check for BOM UTF-8 encoding and strip it out if present
+    if bytes(data[:3]) == b'\xef\xbb\xbf':
+        encoding = 'utf8'
+        start = 3
+    else:
+        _encoding, _ = util.find_python_encoding(data, pyversion)
+        # check that the coding isn't mypy. We skip it since
+        # registering may not have happened yet
+        if _encoding != 'mypy':
+            encoding = _encoding
+    try:
+        return str(data[start:], encoding)
+    except LookupError as lookuperr:
+        raise DecodeError(str(lookuperr))
 
 
 def get_cache_names(id: str, path: str, cache_dir: str,
@@ -999,6 +1081,9 @@ class State:
     # The State from which this module was imported, if any
     caller_state = None  # type: Optional[State]
 
+    # Were the dependencies predicted by the import scanner (--scan-imports)?
+    scanned = False
+
     # If caller_state is set, the line number in the caller where the import occurred
     caller_line = 0
 
@@ -1042,10 +1127,7 @@ class State:
                         path.endswith('.py') and (caller_state or ancestor_for)):
                     # (Never silence builtins, even if it's a .py file;
                     # this can happen in tests!)
-                    if (id != 'builtins' and
-                        not ((caller_state and
-                              caller_state.tree and
-                              caller_state.tree.is_stub))):
+                    if id != 'builtins' and not (caller_state and caller_state.is_stub()):
                         if manager.options.almost_silent:
                             if ancestor_for:
                                 self.skipping_ancestor(id, path, ancestor_for)
@@ -1093,8 +1175,12 @@ class State:
             self.child_modules = set(self.meta.child_modules)
             self.dep_line_map = {}
         else:
-            # Parse the file (and then some) to get the dependencies.
-            self.parse_file()
+            if manager.options.scan_imports:
+                # Predict the dependencies; the file is parsed later.
+                self.scan_file()
+            else:
+                # Parse the file (and then some) to get the dependencies.
+                self.parse_file()
             self.suppressed = []
             self.child_modules = set()
 
@@ -1151,6 +1237,16 @@ class State:
         """Return if this module has new submodules after being loaded from a warm cache."""
         return self.meta is not None and self.child_modules != set(self.meta.child_modules)
 
+    def is_stub(self) -> bool:
+        """Is this a stub file?
+
+        For a module loaded from the cache, this is only known once the
+        tree has been loaded.
+        """
+        if self.tree is not None:
+            return self.tree.is_stub
+        return self.scanned and self.xpath.endswith('.pyi')
+
     def mark_stale(self) -> None:
         """Throw away the cache data for this file, marking it as stale."""
         self.meta = None
@@ -1192,6 +1288,43 @@ class State:
 
     # Methods for processing modules from source code.
 
+    def read_source(self) -> str:
+        """Return the source of the module, reading it from the file if needed."""
+        source = self.source
+        self.source = None  # We won't need it again.
+        if self.path and source is None:
+            try:
+                source = self.manager.source_prefetcher.read(self.path)
+            except IOError as ioerr:
+                raise CompileError([
+                    "mypy: can't read file '{}': {}".format(self.path, ioerr.strerror)])
+            except (UnicodeDecodeError, DecodeError) as decodeerr:
+                raise CompileError([
+                    "mypy: can't decode file '{}': {}".format(self.path, str(decodeerr))])
+        return source
+
+    def scan_file(self) -> None:
+        """Find the dependencies of the module using the import scanner.
+
+        This is much faster than parsing; parse_file() later computes the
+        actual dependencies.
+        """
+        manager = self.manager
+        manager.log("Scanning imports of %s (%s)" % (self.xpath, self.id))
+        with self.wrap_context():
+            self.source = self.read_source()
+            imports, ignored_lines = scan_imports(self.source, manager.options.python_version,
+                                                  manager.options.custom_typing_module)
+        self.scanned = True
+        # Ignore errors about missing modules on '# type: ignore' lines until
+        # the file is parsed.
+        manager.errors.set_file_ignored_lines(self.xpath, ignored_lines)
+        # Errors about relative imports are reported when the file is parsed.
+        self.compute_dependencies([(pri, id, line)
+                                   for pri, id, line in manager.all_imported_modules(
+                                       self.id, self.xpath, imports)
+                                   if id != ''])
+
     def parse_file(self) -> None:
         if self.tree is not None:
             # The file was already parsed (in __init__()).
@@ -1202,17 +1335,7 @@ class State:
         manager.log("Parsing %s (%s)" % (self.xpath, self.id))
 
         with self.wrap_context():
-            source = self.source
-            self.source = None  # We won't need it again.
-            if self.path and source is None:
-                try:
-                    source = read_with_python_encoding(self.path, manager.options.python_version)
-                except IOError as ioerr:
-                    raise CompileError([
-                        "mypy: can't read file '{}': {}".format(self.path, ioerr.strerror)])
-                except (UnicodeDecodeError, DecodeError) as decodeerr:
-                    raise CompileError([
-                        "mypy: can't decode file '{}': {}".format(self.path, str(decodeerr))])
+            source = self.read_source()
             self.tree = manager.parse_file(self.id, self.xpath, source)
 
         modules[self.id] = self.tree
@@ -1231,12 +1354,19 @@ class State:
 
         # Compute (direct) dependencies.
         # Add all direct imports (this is why we needed the first pass).
-        # Also keep track of each dependency's source line.
+        self.compute_dependencies(manager.all_imported_modules_in_file(self.tree))
+
+    def compute_dependencies(self, imported: List[Tuple[int, str, int]]) -> None:
+        """Compute dependencies from (priority, module id, line) tuples of imports.
+
+        Also keep track of each dependency's source line.
+        """
+        manager = self.manager
         dependencies = []
         suppressed = []
         priorities = {}  # type: Dict[str, int]  # id -> priority
         dep_line_map = {}  # type: Dict[str, int]  # id -> line
-        for pri, id, line in manager.all_imported_modules_in_file(self.tree):
+        for pri, id, line in imported:
             priorities[id] = min(pri, priorities.get(id, PRI_ALL))
             if id == self.id:
                 continue
@@ -1346,9 +1476,26 @@ def load_graph(sources: List[BuildSource], manager: BuildManager) -> Graph:
             manager.errors.raise_error()
         graph[st.id] = st
         new.append(st)
+    load_dependencies(graph, new, manager)
+    if manager.options.scan_imports:
+        parse_scanned_modules(graph, manager)
+    for id, g in graph.items():
+        if g.has_new_submodules():
+            g.parse_file()
+    return graph
+
+
+def load_dependencies(graph: Graph, new: 'collections.deque[State]',
+                      manager: BuildManager) -> None:
+    """Add the modules imported by the states in new to graph, recursively."""
     # Collect dependencies.  We go breadth-first.
     while new:
         st = new.popleft()
+        if not manager.options.incremental:
+            # With incremental mode most modules are loaded from the cache
+            # and never read, so only prefetch in a full build.
+            manager.prefetch_modules(dep for dep in st.ancestors + st.dependencies
+                                     if dep not in graph)
         for dep in st.ancestors + st.dependencies:
             if dep not in graph:
                 try:
@@ -1370,10 +1517,28 @@ def load_graph(sources: List[BuildSource], manager: BuildManager) -> Graph:
                     new.append(newst)
             if dep in st.ancestors and dep in graph:
                 graph[dep].child_modules.add(st.id)
-    for id, g in graph.items():
-        if g.has_new_submodules():
-            g.parse_file()
-    return graph
+
+
+def parse_scanned_modules(graph: Graph, manager: BuildManager) -> None:
+    """Parse the modules whose dependencies were found by the import scanner.
+
+    Modules are parsed in dependency order. Parsing computes the actual
+    dependencies; if the scanner missed any, load (and parse) them as well.
+    """
+    while True:
+        unparsed = {id for id, st in graph.items() if st.scanned and st.tree is None}
+        if not unparsed:
+            break
+        for ascc in sorted_components(graph, unparsed):
+            for id in order_ascc(graph, ascc):
+                st = graph[id]
+                # Keep the dependencies found missing while loading the graph,
+                # as well as any missing imports the scanner didn't find.
+                suppressed = st.suppressed
+                st.parse_file()
+                st.suppressed = suppressed + [id for id in st.suppressed
+                                              if id not in suppressed]
+        load_dependencies(graph, collections.deque(graph[id] for id in unparsed), manager)
 
 
 def process_graph(graph: Graph, manager: BuildManager) -> None:
@@ -1541,6 +1706,8 @@ def process_stale_scc(graph: Graph, scc: List[str]) -> None:
         graph[id].semantic_analysis()
     for id in scc:
         graph[id].semantic_analysis_pass_three()
+    # Only keep bound methods around while they are likely to be reused.
+    checkmember.bound_method_cache.clear()
     for id in scc:
         graph[id].type_check()
         graph[id].write_cache()
@@ -6,7 +6,7 @@ import os
 import os.path
 
 from typing import (
-    Any, Dict, Set, List, cast, Tuple, TypeVar, Union, Optional, NamedTuple
+    Any, Dict, Set, List, cast, Tuple, TypeVar, Union, Optional, NamedTuple, Iterator
 )
 
 from mypy.errors import Errors, report_internal_error
@@ -25,19 +25,20 @@ from mypy.nodes import (
     YieldFromExpr, NamedTupleExpr, SetComprehension,
     DictionaryComprehension, ComplexExpr, EllipsisExpr, TypeAliasExpr,
     RefExpr, YieldExpr, BackquoteExpr, ImportFrom, ImportAll, ImportBase,
-    CONTRAVARIANT, COVARIANT
+    GlobalDecl, NonlocalDecl, CONTRAVARIANT, COVARIANT
 )
 from mypy.nodes import function_type, method_type, method_type_with_fallback
 from mypy import nodes
 from mypy.types import (
     Type, AnyType, CallableType, Void, FunctionLike, Overloaded, TupleType,
     Instance, NoneTyp, ErrorType, strip_type, LiteralType,
-    UnionType, TypeVarId, TypeVarType, PartialType, DeletedType, UninhabitedType
+    UnionType, TypeVarId, TypeVarType, PartialType, DeletedType, UninhabitedType,
+    intern_type
 )
 from mypy.sametypes import is_same_type
-from mypy.messages import MessageBuilder
+from mypy.messages import MessageBuilder, TypeMessage
 import mypy.checkexpr
-from mypy.checkmember import map_type_from_supertype
+from mypy.checkmember import map_type_from_supertype, bound_method_cache
 from mypy import defaults
 from mypy import messages
 from mypy.subtypes import (
@@ -50,7 +51,7 @@ from mypy.erasetype import erase_typevars
 from mypy.expandtype import expand_type_by_instance, expand_type
 from mypy.visitor import NodeVisitor
 from mypy.join import join_types
-from mypy.treetransform import TransformVisitor
+from mypy.traverser import TraverserVisitor
 from mypy.meet import meet_simple, nearest_builtin_ancestor, is_overlapping_types
 from mypy.binder import ConditionalTypeBinder
 from mypy.options import Options
@@ -110,8 +111,11 @@ class TypeChecker(NodeVisitor[Type]):
     # Type checking pass number (0 = first pass)
     pass_num = 0
     # Have we deferred the current function? If yes, don't infer additional
-    # types during this pass within the function.
+    # types during this pass within the function, and skip the rest of its body.
     current_node_deferred = False
+    # Stack of functions whose bodies are being checked with type variables
+    # expanded in place
+    expanded_funcs = None  # type: List[FuncItem]
     is_typeshed_stub = False
     options = None  # type: Options
 
@@ -131,6 +135,7 @@ class TypeChecker(NodeVisitor[Type]):
         self.type_context = []
         self.dynamic_funcs = []
         self.function_stack = []
+        self.expanded_funcs = []
         self.weak_opts = set()  # type: Set[str]
         self.partial_types = []
         self.deferred_nodes = []
@@ -179,16 +184,25 @@ class TypeChecker(NodeVisitor[Type]):
 
     def handle_cannot_determine_type(self, name: str, context: Context) -> None:
         if self.pass_num == 0 and self.function_stack:
-            # Don't report an error yet. Just defer.
-            node = self.function_stack[-1]
+            # Don't report an error yet. Just defer. The body of a function with
+            # type variables expanded in place is only valid during the expansion,
+            # so defer the whole expanded function instead of a function within it.
+            if self.expanded_funcs:
+                node = self.expanded_funcs[0]
+            else:
+                node = self.function_stack[-1]
             if self.errors.type_name:
                 type_name = self.errors.type_name[-1]
             else:
                 type_name = None
-            self.deferred_nodes.append(DeferredNode(node, type_name))
+            # The second pass checks the whole function again, so defer each
+            # function only once.
+            if not any(deferred.node is node for deferred in self.deferred_nodes):
+                self.deferred_nodes.append(DeferredNode(node, type_name))
             # Set a marker so that we won't infer additional types in this
             # function. Any inferred types could be bogus, because there's at
-            # least one type that we don't know.
+            # least one type that we don't know. The remaining statements of the
+            # function are only checked during the second pass.
             self.current_node_deferred = True
         else:
             self.msg.cannot_determine_type(name, context)
@@ -401,8 +415,6 @@ class TypeChecker(NodeVisitor[Type]):
             old_binder = self.binder
             self.binder = ConditionalTypeBinder()
             with self.binder.frame_context():
-                defn.expanded.append(item)
-
                 # We may be checking a function definition or an anonymous
                 # function. In the first case, set up another reference with the
                 # precise type.
@@ -486,13 +498,32 @@ class TypeChecker(NodeVisitor[Type]):
                         self.accept(init)
 
             # Type check body in a new scope.
-            with self.binder.frame_context():
-                self.accept(item.body)
+            if not self.skip_untyped_body(item):
+                with self.binder.frame_context():
+                    self.accept(item.body)
 
             self.return_types.pop()
 
             self.binder = old_binder
 
+    def skip_untyped_body(self, defn: FuncItem) -> bool:
+        """Skip the body of a function without annotations if nothing in it is reported.
+
+        The body still has to be checked if it contains reveal_type(), annotated
+        functions or other constructs with effects outside the body. Attributes
+        defined in a skipped body get the type they would have been inferred to have.
+        """
+        if not self.options.skip_untyped_bodies or not self.typing_mode_none():
+            return False
+        scanner = UntypedBodyScanner()
+        defn.body.accept(scanner)
+        if scanner.must_check:
+            return False
+        for var in scanner.attributes:
+            if var.type is None:
+                var.type = AnyType()
+        return True
+
     def check_reverse_op_method(self, defn: FuncItem, typ: CallableType,
                                 method: str) -> None:
         """Check a reverse operator method such as __radd__."""
@@ -650,8 +681,16 @@ class TypeChecker(NodeVisitor[Type]):
             self.msg.invalid_signature(typ, context)
 
     def expand_typevars(self, defn: FuncItem,
-                        typ: CallableType) -> List[Tuple[FuncItem, CallableType]]:
-        # TODO use generator
+                        typ: CallableType) -> Iterator[Tuple[FuncItem, CallableType]]:
+        """Generate the variants of a function with type variables expanded.
+
+        Type variables with value restrictions are expanded to each combination
+        of values. Instead of copying the function, the types within its body
+        are expanded in place while the caller checks a variant, and restored
+        before the next one. Each variant also gets its own innermost scope for
+        partial types. The enclosing scopes stay visible, so that a variant can
+        complete the partial type of a global variable, for example.
+        """
         subst = []  # type: List[List[Tuple[TypeVarId, Type]]]
         tvars = typ.variables or []
         tvars = tvars[:]
@@ -663,14 +702,24 @@ class TypeChecker(NodeVisitor[Type]):
                 subst.append([(tvar.id, value)
                               for value in tvar.values])
         if subst:
-            result = []  # type: List[Tuple[FuncItem, CallableType]]
-            for substitutions in itertools.product(*subst):
-                mapping = dict(substitutions)
-                expanded = cast(CallableType, expand_type(typ, mapping))
-                result.append((expand_func(defn, mapping), expanded))
-            return result
+            body = FuncBodyExpander(defn)
+            num_partial_types = len(self.partial_types)
+            self.expanded_funcs.append(defn)
+            try:
+                for substitutions in itertools.product(*subst):
+                    mapping = dict(substitutions)
+                    body.expand(mapping)
+                    self.enter_partial_types()
+                    try:
+                        yield defn, cast(CallableType, expand_type(typ, mapping))
+                        self.leave_partial_types()
+                    finally:
+                        body.restore()
+            finally:
+                del self.partial_types[num_partial_types:]
+                self.expanded_funcs.pop()
         else:
-            return [(defn, typ)]
+            yield defn, typ
 
     def check_method_override(self, defn: FuncBase) -> None:
         """Check if function definition is compatible with base classes."""
@@ -893,7 +942,7 @@ class TypeChecker(NodeVisitor[Type]):
             return None
         for s in b.body:
             self.accept(s)
-            if self.binder.breaking_out:
+            if self.binder.breaking_out or self.current_node_deferred:
                 break
 
     def visit_assignment_stmt(self, s: AssignmentStmt) -> Type:
@@ -969,6 +1018,10 @@ class TypeChecker(NodeVisitor[Type]):
                 self.infer_variable_type(inferred, lvalue, self.accept(rvalue),
                                          rvalue)
 
+            if isinstance(lvalue, MemberExpr):
+                # The assignment may have inferred or completed the type of the attribute.
+                self.expr_checker.invalidate_member_types()
+
     def check_assignment_to_multiple_lvalues(self, lvalues: List[Node], rvalue: Node,
                                              context: Context,
                                              infer_lvalue_type: bool = True) -> None:
@@ -1927,16 +1980,20 @@ class TypeChecker(NodeVisitor[Type]):
             if isinstance(subtype, Void):
                 self.msg.does_not_return_value(subtype, context)
             else:
+                # Format the types only if the message is rendered.
+                subtype_str, supertype_str = self.msg.lazy_format_distinctly(subtype, supertype)
                 extra_info = []  # type: List[str]
-                if subtype_label is not None or supertype_label is not None:
-                    subtype_str, supertype_str = self.msg.format_distinctly(subtype, supertype)
-                    if subtype_label is not None:
-                        extra_info.append(subtype_label + ' ' + subtype_str)
-                    if supertype_label is not None:
-                        extra_info.append(supertype_label + ' ' + supertype_str)
+                args = [msg]  # type: List[Any]
+                if subtype_label is not None:
+                    extra_info.append('{} {}')
+                    args += [subtype_label, subtype_str]
+                if supertype_label is not None:
+                    extra_info.append('{} {}')
+                    args += [supertype_label, supertype_str]
+                template = '{}'
                 if extra_info:
-                    msg += ' (' + ', '.join(extra_info) + ')'
-                self.fail(msg, context)
+                    template += ' (' + ', '.join(extra_info) + ')'
+                self.fail(TypeMessage(self.msg, template, *args), context)
 
     def named_type(self, name: str) -> Instance:
         """Return an instance type with type given by the name and no
@@ -1945,7 +2002,7 @@ class TypeChecker(NodeVisitor[Type]):
         """
         # Assume that the name refers to a type.
         sym = self.lookup_qualified(name)
-        return Instance(cast(TypeInfo, sym.node), [])
+        return intern_type(Instance(cast(TypeInfo, sym.node), []))
 
     def named_generic_type(self, name: str, args: List[Type]) -> Instance:
         """Return an instance with the given name and type arguments.
@@ -1953,7 +2010,7 @@ class TypeChecker(NodeVisitor[Type]):
         Assume that the number of arguments is correct.  Assume that
         the name refers to a compatible generic type.
         """
-        return Instance(self.lookup_typeinfo(name), args)
+        return intern_type(Instance(self.lookup_typeinfo(name), args))
 
     def lookup_typeinfo(self, fullname: str) -> TypeInfo:
         # Assume that the name refers to a class.
@@ -2084,7 +2141,7 @@ class TypeChecker(NodeVisitor[Type]):
             temp.set_line(context.get_line())
         return temp
 
-    def fail(self, msg: str, context: Context) -> None:
+    def fail(self, msg: Union[str, TypeMessage], context: Context) -> None:
         """Produce an error message."""
         self.msg.fail(msg, context)
 
@@ -2315,22 +2372,139 @@ def get_isinstance_type(node: Node, type_map: Dict[Node, Type]) -> Type:
         return UnionType(types)
 
 
-def expand_node(defn: Node, map: Dict[TypeVarId, Type]) -> Node:
-    visitor = TypeTransformVisitor(map)
-    return defn.accept(visitor)
-
+class FuncBodyExpander(TraverserVisitor):
+    """Expand type variables within the body of a function in place.
 
-def expand_func(defn: FuncItem, map: Dict[TypeVarId, Type]) -> FuncItem:
-    return cast(FuncItem, expand_node(defn, map))
-
-
-class TypeTransformVisitor(TransformVisitor):
-    def __init__(self, map: Dict[TypeVarId, Type]) -> None:
-        super().__init__()
-        self.map = map
+    The types in the body and the variables defined in it (including the
+    arguments and the attributes assigned in it) are collected once. Like a
+    copy of the function, each expansion starts from the state of these
+    variables at the time the expander was created. Variables defined outside
+    the body, such as globals, keep the types inferred while checking it.
+    """
 
-    def type(self, type: Type) -> Type:
-        return expand_type(type, self.map)
+    def __init__(self, defn: FuncItem) -> None:
+        self.defn = defn
+        # Original type and readiness of each variable defined in the body
+        self.vars = {}  # type: Dict[Var, Tuple[Type, bool]]
+        # Nodes with types, the attribute with the type and its original value
+        self.types = []  # type: List[Tuple[Node, str, Any]]
+        defn.accept(self)
+
+    def expand(self, map: Dict[TypeVarId, Type]) -> None:
+        # Method signatures in the body change, but the cache keys don't.
+        bound_method_cache.clear()
+        for var, (typ, is_ready) in self.vars.items():
+            if typ is not None:
+                var.type = expand_type(typ, map)
+        for node, attr, value in self.types:
+            if isinstance(value, list):
+                setattr(node, attr, [expand_type(t, map) for t in value])
+            else:
+                setattr(node, attr, expand_type(value, map))
+
+    def restore(self) -> None:
+        bound_method_cache.clear()
+        for var, (typ, is_ready) in self.vars.items():
+            var.type = typ
+            var.is_ready = is_ready
+        for node, attr, value in self.types:
+            setattr(node, attr, value)
+
+    def add_type(self, node: Node, attr: str) -> None:
+        value = getattr(node, attr)
+        if value is not None:
+            self.types.append((node, attr, value))
+
+    def visit_var(self, var: Var) -> None:
+        if var not in self.vars:
+            self.vars[var] = (var.type, var.is_ready)
+
+    def visit_func_def(self, o: FuncDef) -> None:
+        if o is not self.defn:
+            # The type of the expanded function itself is expanded by the caller.
+            self.add_type(o, 'type')
+        super().visit_func_def(o)
+
+    def visit_func_expr(self, o: FuncExpr) -> None:
+        if o is not self.defn:
+            self.add_type(o, 'type')
+        super().visit_func_expr(o)
+
+    def visit_overloaded_func_def(self, o: OverloadedFuncDef) -> None:
+        self.add_type(o, 'type')
+        super().visit_overloaded_func_def(o)
+
+    def visit_assignment_stmt(self, o: AssignmentStmt) -> None:
+        self.add_type(o, 'type')
+        super().visit_assignment_stmt(o)
+
+    def visit_try_stmt(self, o: TryStmt) -> None:
+        for var in o.vars:
+            if var is not None:
+                var.accept(self)
+        super().visit_try_stmt(o)
+
+    def visit_name_expr(self, o: NameExpr) -> None:
+        if o.is_def and isinstance(o.node, Var):
+            self.visit_var(o.node)
+
+    def visit_member_expr(self, o: MemberExpr) -> None:
+        if o.def_var is not None:
+            self.visit_var(o.def_var)
+        super().visit_member_expr(o)
+
+    def visit_cast_expr(self, o: CastExpr) -> None:
+        self.add_type(o, 'type')
+        super().visit_cast_expr(o)
+
+    def visit_type_application(self, o: TypeApplication) -> None:
+        self.add_type(o, 'types')
+        super().visit_type_application(o)
+
+    def visit_temp_node(self, o: TempNode) -> None:
+        self.add_type(o, 'type')
+
+
+class UntypedBodyScanner(TraverserVisitor):
+    """Find what matters in the body of a function that is not type checked."""
+
+    def __init__(self) -> None:
+        # Does the body contain something that has to be type checked?
+        self.must_check = False
+        # Variables of attributes defined in the body
+        self.attributes = []  # type: List[Var]
+
+    def visit_func_def(self, o: FuncDef) -> None:
+        if not o.is_dynamic():
+            self.must_check = True
+        super().visit_func_def(o)
+
+    def visit_func_expr(self, o: FuncExpr) -> None:
+        if not o.is_dynamic():
+            self.must_check = True
+        super().visit_func_expr(o)
+
+    def visit_class_def(self, o: ClassDef) -> None:
+        self.must_check = True
+
+    def visit_global_decl(self, o: GlobalDecl) -> None:
+        self.must_check = True
+
+    def visit_nonlocal_decl(self, o: NonlocalDecl) -> None:
+        self.must_check = True
+
+    def visit_reveal_type_expr(self, o: RevealTypeExpr) -> None:
+        self.must_check = True
+
+    def visit_name_expr(self, o: NameExpr) -> None:
+        # The body could complete a partial type of an enclosing scope.
+        if isinstance(o.node, Var) and isinstance(o.node.type, PartialType):
+            self.must_check = True
+
+    def visit_member_expr(self, o: MemberExpr) -> None:
+        if o.is_def and o.def_var is not None:
+            self.attributes.append(o.def_var)
+        super().visit_member_expr(o)
 
 
 def is_unsafe_overlapping_signatures(signature: Type, other: Type) -> bool:
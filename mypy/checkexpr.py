@@ -1,11 +1,12 @@
 """Expression type checker. This file is conceptually part of TypeChecker."""
 
-from typing import cast, Dict, List, Tuple, Callable, Union, Optional
+from typing import cast, Any, Dict, List, Tuple, Callable, Union, Optional
 
 from mypy.types import (
     Type, AnyType, CallableType, Overloaded, NoneTyp, Void, TypeVarDef,
     TupleType, Instance, TypeVarId, TypeVarType, ErasedType, UnionType,
-    LiteralType, PartialType, DeletedType, UnboundType, UninhabitedType, TypeType
+    LiteralType, PartialType, DeletedType, UnboundType, UninhabitedType, TypeType,
+    ErrorType
 )
 from mypy.nodes import (
     Argument, NameExpr, RefExpr, Var, FuncDef, OverloadedFuncDef, TypeInfo, CallExpr,
@@ -32,6 +33,7 @@ from mypy.subtypes import is_subtype, is_equivalent
 from mypy import applytype
 from mypy import erasetype
 from mypy.checkmember import analyze_member_access, type_object_type
+from mypy.binder import ConditionalTypeBinder
 from mypy.semanal import self_type
 from mypy.constraints import get_actual_type
 from mypy.checkstrformat import StringFormatterChecker
@@ -63,6 +65,13 @@ class ExpressionChecker:
 
     strfrm_checker = None  # type: mypy.checkstrformat.StringFormatterChecker
 
+    # Types of attribute references such as self.x.y in the current function, by
+    # literal hash of the expression, together with the type of the base expression
+    # (self.x) they were computed from
+    member_types = None  # type: Dict[Any, Tuple[Type, Type]]
+    # The binder of the function that member_types belongs to
+    member_types_binder = None  # type: ConditionalTypeBinder
+
     def __init__(self,
                  chk: 'mypy.checker.TypeChecker',
                  msg: MessageBuilder) -> None:
@@ -70,6 +79,8 @@ class ExpressionChecker:
         self.chk = chk
         self.msg = msg
         self.strfrm_checker = mypy.checkexpr.StringFormatterChecker(self, self.chk, self.msg)
+        self.member_types = {}
+        self.member_types_binder = None
 
     def visit_name_expr(self, e: NameExpr) -> Type:
         """Type check a name expression.
@@ -721,7 +732,7 @@ class ExpressionChecker:
 
         messages = messages or self.msg  # type: MessageBuilder
         # There should be an actual expression backing the condition if the condition exists.
-        print(condition.__dict__)
+        print(condition)
         assert condition.initializer is not None
         condition_expr = condition.initializer  # type: Expr
 
@@ -767,8 +778,7 @@ class ExpressionChecker:
         #       result than 'Any'.
         match = []  # type: List[CallableType]
         best_match = 0
-        for typ in overload.items():
-            print("Call target {}".format(overload.__dict__))
+        for typ in self.overload_candidates(arg_types, arg_kinds, arg_names, overload):
             similarity = self.erased_signature_similarity(arg_types, arg_kinds, arg_names,
                                                           typ, context=context)
             if similarity > 0 and similarity >= best_match:
@@ -814,6 +824,62 @@ class ExpressionChecker:
                         return m
                 return match[0]
 
+    def overload_candidates(self, arg_types: List[Type], arg_kinds: List[int],
+                            arg_names: List[str], overload: Overloaded) -> List[CallableType]:
+        """Return the overload items that could match a call, in the original order.
+
+        Only calls with positional and keyword arguments are indexed. The items
+        that are left out would have similarity 0 in erased_signature_similarity:
+        either the number or the names of the arguments don't fit, or the first
+        argument is an instance of a class that is unrelated to the formal type.
+        The candidates are stored in the overloaded type, keyed by the argument
+        kinds and names and the class of the first argument.
+        """
+        items = overload.items()
+        if any(kind not in (ARG_POS, ARG_NAMED) for kind in arg_kinds):
+            return items
+        first_info = None  # type: TypeInfo
+        if arg_kinds and arg_kinds[0] == ARG_POS and isinstance(arg_types[0], Instance):
+            first_info = cast(Instance, arg_types[0]).type
+        key = (tuple(arg_kinds), tuple(arg_names or ()), first_info)
+        candidates = overload.dispatch_index.get(key)
+        if candidates is None:
+            candidates = [item for item in items
+                          if self.could_match_overload_item(arg_kinds, arg_names, first_info,
+                                                            item)]
+            overload.dispatch_index[key] = candidates
+        return candidates
+
+    def could_match_overload_item(self, arg_kinds: List[int], arg_names: List[str],
+                                  first_info: Optional[TypeInfo], item: CallableType) -> bool:
+        """Could a call with positional and keyword arguments match an overload item?
+
+        Don't use the argument types apart from the class of the first argument
+        (first_info), so that the result can be reused for other calls.
+        """
+        arg_types = [AnyType() for kind in arg_kinds]  # type: List[Type]
+        formal_to_actual = map_actuals_to_formals(arg_kinds, arg_names,
+                                                  item.arg_kinds, item.arg_names,
+                                                  lambda i: arg_types[i])
+        if any(is_duplicate_mapping(actuals, arg_kinds) for actuals in formal_to_actual):
+            # Whether duplicate values are allowed depends on the typing mode.
+            return True
+        if not self.check_argument_count(item, arg_types, arg_kinds, arg_names,
+                                         formal_to_actual, None, None):
+            return False
+        if first_info is None or first_info.fallback_to_any or first_info._promote:
+            return True
+        if item.has_condition:
+            # The condition is checked before the argument types.
+            return True
+        for i, actuals in enumerate(formal_to_actual):
+            if 0 in actuals:
+                formal = item.arg_types[i]
+                if isinstance(formal, Instance):
+                    # See overload_arg_similarity.
+                    return formal.type in first_info.mro
+        return True
+
     def erased_signature_similarity(self, arg_types: List[Type], arg_kinds: List[int],
                                     arg_names: List[str], callee: CallableType,
                                     context: Context) -> int:
@@ -827,7 +893,6 @@ class ExpressionChecker:
                                                   callee.arg_kinds,
                                                   callee.arg_names,
                                                   lambda i: arg_types[i])
-        print("FTA: {}".format(formal_to_actual))
         if not self.check_argument_count(callee, arg_types, arg_kinds, arg_names,
                                          formal_to_actual, None, None):
             # Too few or many arguments -> no match.
@@ -914,9 +979,40 @@ class ExpressionChecker:
             return self.analyze_ref_expr(e)
         else:
             # This is a reference to a non-module attribute.
-            return analyze_member_access(e.name, self.accept(e.expr), e,
-                                         is_lvalue, False, False,
-                                         self.named_type, self.not_ready_callback, self.msg)
+            base_type = self.accept(e.expr)
+            if is_lvalue or e.literal < nodes.LITERAL_TYPE:
+                return analyze_member_access(e.name, base_type, e,
+                                             is_lvalue, False, False,
+                                             self.named_type, self.not_ready_callback,
+                                             self.msg)
+            return self.analyze_member_access_cached(e, base_type)
+
+    def analyze_member_access_cached(self, e: MemberExpr, base_type: Type) -> Type:
+        """Analyse an attribute reference such as self.x.y that may repeat in a function.
+
+        The result is reused for the same expression as long as the type of the base
+        expression is the same object; narrowing the base through the binder gives it
+        a different type. Assignments to attributes, which may change the declared
+        types of attributes, discard all results (see invalidate_member_types).
+        Results that generate messages or defer the function are not stored.
+        """
+        if self.member_types_binder is not self.chk.binder:
+            self.member_types = {}
+            self.member_types_binder = self.chk.binder
+        cached = self.member_types.get(e.literal_hash)
+        if cached is not None and cached[0] is base_type:
+            return cached[1]
+        num_reports = self.msg.num_reports
+        result = analyze_member_access(e.name, base_type, e, False, False, False,
+                                       self.named_type, self.not_ready_callback, self.msg)
+        if (self.msg.num_reports == num_reports and not self.chk.current_node_deferred
+                and result is not None and not isinstance(result, PartialType)):
+            self.member_types[e.literal_hash] = (base_type, result)
+        return result
+
+    def invalidate_member_types(self) -> None:
+        """Discard the types of attribute references stored for the current function."""
+        self.member_types = {}
 
     def analyze_external_member_access(self, member: str, base_type: Type,
                                        context: Context) -> Type:
@@ -1341,14 +1437,19 @@ class ExpressionChecker:
 
     def check_list_or_set_expr(self, items: List[Node], fullname: str,
                                tag: str, context: Context) -> Type:
-        # Translate into type checking a generic function call.
         tvdef = TypeVarDef('T', -1, [], self.chk.object_type())
         tv = TypeVarType(tvdef)
+        ret_type = self.chk.named_generic_type(fullname, [tv])
+        if self.can_join_item_types(items):
+            item_type = self.join_item_types(items, [self.accept(item) for item in items])
+            if item_type:
+                return expand_type(ret_type, {tv.id: item_type})
+        # Translate into type checking a generic function call.
         constructor = CallableType(
             [tv],
             [nodes.ARG_STAR],
             [None],
-            self.chk.named_generic_type(fullname, [tv]),
+            ret_type,
             self.named_type('builtins.function'),
             name=tag,
             variables=[tvdef])
@@ -1379,11 +1480,22 @@ class ExpressionChecker:
         return TupleType(items, self.chk.named_generic_type('builtins.tuple', [fallback_item]))
 
     def visit_dict_expr(self, e: DictExpr) -> Type:
-        # Translate into type checking a generic function call.
         ktdef = TypeVarDef('KT', -1, [], self.chk.object_type())
         vtdef = TypeVarDef('VT', -2, [], self.chk.object_type())
         kt = TypeVarType(ktdef)
         vt = TypeVarType(vtdef)
+        ret_type = self.chk.named_generic_type('builtins.dict', [kt, vt])
+        if self.can_join_item_types([item for entry in e.items for item in entry]):
+            key_types = []  # type: List[Type]
+            value_types = []  # type: List[Type]
+            for key, value in e.items:
+                key_types.append(self.accept(key))
+                value_types.append(self.accept(value))
+            key_type = self.join_item_types([key for key, _ in e.items], key_types)
+            value_type = self.join_item_types([value for _, value in e.items], value_types)
+            if key_type and value_type:
+                return expand_type(ret_type, {kt.id: key_type, vt.id: value_type})
+        # Translate into type checking a generic function call.
         # The callable type represents a function like this:
         #
         #   def <unnamed>(*v: Tuple[kt, vt]) -> Dict[kt, vt]: ...
@@ -1391,7 +1503,7 @@ class ExpressionChecker:
             [TupleType([kt, vt], self.named_type('builtins.tuple'))],
             [nodes.ARG_STAR],
             [None],
-            self.chk.named_generic_type('builtins.dict', [kt, vt]),
+            ret_type,
             self.named_type('builtins.function'),
             name='<list>',
             variables=[ktdef, vtdef])
@@ -1403,6 +1515,39 @@ class ExpressionChecker:
                                args,
                                [nodes.ARG_POS] * len(args), e)[0]
 
+    def can_join_item_types(self, items: List[Node]) -> bool:
+        """Can the type of a container display with these items be inferred by a join?
+
+        This is a shortcut for large literal displays. Type checking a display
+        as a call to a generic function checks each item twice and builds and
+        solves a constraint for each item. If there is no type context and the
+        items are literals, their types don't depend on context and the item
+        type can be inferred by joining the item types directly.
+        """
+        return (bool(items) and self.chk.type_context[-1] is None
+                and not self.chk.typing_mode_none()
+                and all(is_literal_display_item(item) for item in items))
+
+    def join_item_types(self, items: List[Node], types: List[Type]) -> Optional[Type]:
+        """Return the inferred item type of a display with the given items.
+
+        The items have already been type checked and their types are given.
+        Return None if the types can't be joined without errors. The caller
+        should then fall back to type checking the display as a call.
+        """
+        joined = join.join_type_list(types)
+        if isinstance(joined, ErrorType) or has_erased_component(joined):
+            return None
+        if not all(is_subtype(t, joined) for t in types):
+            return None
+        for item, typ in zip(items, types):
+            if isinstance(item, (TupleExpr, ListExpr, SetExpr, DictExpr)):
+                # Nested displays would be checked again using the item type as
+                # context. This only makes a difference if the type is different.
+                if not is_same_type(typ, joined):
+                    self.accept(item, joined)
+        return joined
+
     def visit_func_expr(self, e: FuncExpr) -> Type:
         """Type check lambda expression."""
         inferred_type = self.infer_lambda_type_using_context(e)
@@ -1747,6 +1892,21 @@ def map_actuals_to_formals(caller_kinds: List[int],
     return map
 
 
+def is_literal_display_item(e: Node) -> bool:
+    """Is e a literal, or a non-empty display with literal items?"""
+    if isinstance(e, (IntExpr, StrExpr, BytesExpr, UnicodeExpr, FloatExpr, ComplexExpr)):
+        return True
+    elif isinstance(e, TupleExpr):
+        return all(is_literal_display_item(item) for item in e.items)
+    elif isinstance(e, (ListExpr, SetExpr)):
+        return bool(e.items) and all(is_literal_display_item(item) for item in e.items)
+    elif isinstance(e, DictExpr):
+        return bool(e.items) and all(is_literal_display_item(key) and
+                                     is_literal_display_item(value)
+                                     for key, value in e.items)
+    return False
+
+
 def is_empty_tuple(t: Type) -> bool:
     return isinstance(t, TupleType) and not t.items
 
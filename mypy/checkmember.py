@@ -1,11 +1,11 @@
 """Type checking of attribute access"""
 
-from typing import cast, Callable, List, Dict, Optional
+from typing import cast, Any, Callable, List, Dict, Optional, Tuple
 
 from mypy.types import (
     Type, Instance, AnyType, TupleType, CallableType, FunctionLike, TypeVarId, TypeVarDef,
     Overloaded, TypeVarType, TypeTranslator, UnionType, PartialType, LiteralType,
-    DeletedType, NoneTyp, TypeType
+    DeletedType, NoneTyp, TypeType, type_key
 )
 from mypy.nodes import TypeInfo, FuncBase, Var, FuncDef, SymbolNode, Context
 from mypy.nodes import ARG_POS, ARG_STAR, ARG_STAR2, OpExpr, ComparisonExpr
@@ -17,6 +17,12 @@ from mypy.nodes import method_type, method_type_with_fallback
 from mypy.semanal import self_type
 from mypy import messages
 from mypy import subtypes
+from mypy.util import MemoTable
+
+
+# Types of methods bound to instances, by instance type, class and method name.
+# The build empties this before type checking each SCC.
+bound_method_cache = MemoTable('Bound method', 10000)  # type: MemoTable[Tuple[Any, ...], Type]
 
 
 def analyze_member_access(name: str,
@@ -61,14 +67,15 @@ def analyze_member_access(name: str,
                                    not_ready_callback)
             if is_lvalue:
                 msg.cant_assign_to_method(node)
-            typ = map_instance_to_supertype(typ, method.info)
-            if name == '__new__':
-                # __new__ is special and behaves like a static method -- don't strip
-                # the first argument.
-                signature = function_type(method, builtin_type('builtins.function'))
-            else:
-                signature = method_type_with_fallback(method, builtin_type('builtins.function'))
-            return expand_type_by_instance(signature, typ)
+            instance_key = type_key(typ)
+            if instance_key is not None:
+                key = (instance_key, info, name)
+                result = bound_method_cache.get(key)
+                if result is None:
+                    result = analyze_method_access(name, method, typ, builtin_type)
+                    bound_method_cache.put(key, result)
+                return result
+            return analyze_method_access(name, method, typ, builtin_type)
         else:
             # Not a method.
             return analyze_member_var_access(name, typ, info, node,
@@ -162,6 +169,19 @@ def analyze_member_access(name: str,
     return msg.has_no_attr(report_type, name, node)
 
 
+def analyze_method_access(name: str, method: FuncBase, itype: Instance,
+                          builtin_type: Callable[[str], Instance]) -> Type:
+    """Return the type of a method bound to an instance of type itype."""
+    itype = map_instance_to_supertype(itype, method.info)
+    if name == '__new__':
+        # __new__ is special and behaves like a static method -- don't strip
+        # the first argument.
+        signature = function_type(method, builtin_type('builtins.function'))
+    else:
+        signature = method_type_with_fallback(method, builtin_type('builtins.function'))
+    return expand_type_by_instance(signature, itype)
+
+
 def analyze_member_var_access(name: str, itype: Instance, info: TypeInfo,
                               node: Context, is_lvalue: bool, is_super: bool,
                               builtin_type: Callable[[str], Instance],
@@ -0,0 +1,68 @@
+"""Compare the decoding throughput of the mypy codec transforms.
+
+Usage (in Python 2):
+
+  python -m mypy.codec.benchmark [FILE_OR_DIR ...]
+
+This times the single pass transform used by the codec against the
+tokenize/untokenize round trip it replaced (mypy.codec.tokenizer), without
+the transform cache. By default, the mypy sources are used as input.
+"""
+
+from __future__ import absolute_import, print_function
+
+import os
+import sys
+import time
+from io import BytesIO
+
+from .tokenizer import mypy_tokenize, mypy_untokenize
+from .transform import strip_annotations
+
+
+def tokenizer_transform(source):
+    return mypy_untokenize(mypy_tokenize(BytesIO(source).readline))
+
+
+def find_sources(paths):
+    sources = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                for name in sorted(files):
+                    if name.endswith('.py'):
+                        sources.extend(find_sources([os.path.join(root, name)]))
+        else:
+            with open(path, 'rb') as f:
+                sources.append(f.read())
+    return sources
+
+
+def measure(transform, sources, repeat=3):
+    """Return the best throughput of transform over sources, in MB/s."""
+    size = sum(len(source) for source in sources)
+    best = None
+    for i in range(repeat):
+        t0 = time.time()
+        for source in sources:
+            transform(source)
+        elapsed = time.time() - t0
+        if best is None or elapsed < best:
+            best = elapsed
+    return size / best / 1e6
+
+
+def main():
+    if sys.version_info[0] != 2:
+        sys.exit('The mypy codec only transforms sources in Python 2')
+    paths = sys.argv[1:] or [os.path.dirname(os.path.dirname(os.path.abspath(__file__)))]
+    sources = find_sources(paths)
+    print('%d files, %d bytes' % (len(sources), sum(len(source) for source in sources)))
+    old = measure(tokenizer_transform, sources)
+    new = measure(strip_annotations, sources)
+    print('tokenize/untokenize: %.2f MB/s' % old)
+    print('single pass:         %.2f MB/s (%.1fx)' % (new, new / old))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,27 +1,39 @@
 from __future__ import absolute_import
 
 import codecs
+import hashlib
 import traceback
 from encodings import utf_8
 from io import BytesIO
 
-from .tokenizer import mypy_tokenize, mypy_untokenize
+from .transform import strip_annotations
 
+# Transformed sources by the SHA-1 hash of the original source. The same file
+# is often decoded more than once (for example, when it's imported and later
+# when a traceback is formatted).
+transform_cache = {}
+TRANSFORM_CACHE_SIZE = 256
 
-def mypy_transform(stream):
-    try:
-        output = mypy_untokenize(mypy_tokenize(stream.readline))
-    except Exception as ex:
-        print(ex)
-        traceback.print_exc()
-        raise
 
-    return output
+def mypy_transform(stream):
+    return mypy_transform_string(stream.read())
 
 
 def mypy_transform_string(text):
-    stream = BytesIO(text)
-    return mypy_transform(stream)
+    text = bytes(text)
+    key = hashlib.sha1(text).digest()
+    output = transform_cache.get(key)
+    if output is None:
+        try:
+            output = strip_annotations(text)
+        except Exception as ex:
+            print(ex)
+            traceback.print_exc()
+            raise
+        if len(transform_cache) >= TRANSFORM_CACHE_SIZE:
+            transform_cache.clear()
+        transform_cache[key] = output
+    return output
 
 
 def mypy_decode(input, errors='strict'):
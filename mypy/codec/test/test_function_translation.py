@@ -65,6 +65,32 @@ def f(x     , y     ='abc')\\
 ''',
 
 
+# test lambdas and dict literals in default values
+b'''\
+def f(x: int = 1, key=lambda y: y, d: Dict[str, int] = {'a': 1}) -> None:
+    return x
+''',
+b'''\
+def f(x      = 1, key=lambda y: y, d                 = {'a': 1})        :
+    return x
+''',
+
+# test indentation with tabs
+b'''\
+class C:
+\tdef f(self, x: int):
+\t\treturn x
+\tdef g(self):
+\t\treturn 1
+''',
+b'''\
+class C:
+\tdef f(self, x     ):
+\t\treturn x
+\tdef g(self):
+\t\treturn 1
+''',
+
 # test unrelated continuations
 b'''\
 x = 1 + \
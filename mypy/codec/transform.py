@@ -0,0 +1,150 @@
+"""Strip function annotations from Python source code in a single pass.
+
+This is used by the mypy codec instead of a full tokenize/untokenize
+round trip. A compiled regular expression finds the tokens that matter
+for locating annotations (strings and comments, so that they can be
+skipped, brackets, names and a few operators); everything else is copied
+to the output unchanged.
+
+Annotations are replaced by whitespace so that the line and column of
+every remaining token stays the same:
+
+  def f(x: int, y: str = 'abc') -> str:
+
+becomes
+
+  def f(x     , y      = 'abc')       :
+
+If a return type annotation spans multiple lines, the line breaks are
+replaced by explicit line continuations.
+
+The source is processed as bytes (a str in Python 2).
+"""
+
+from __future__ import absolute_import
+
+import re
+
+string_pattern = br'''
+    [uUbB]?[rR]?
+    (?:\'\'\'(?:[^\\]|\\.)*?(?:\'\'\'|\Z)
+      |"""(?:[^\\]|\\.)*?(?:"""|\Z)
+      |'(?:[^'\\\r\n]|\\.)*'?
+      |"(?:[^"\\\r\n]|\\.)*"?)
+'''
+
+# Finds the next def statement, skipping strings and comments.
+def_re = re.compile(br'''
+    (?P<string>%s)
+  | (?P<comment>\#[^\r\n]*)
+  | (?P<def>(?<![a-zA-Z0-9_.])def(?![a-zA-Z0-9_]))
+''' % string_pattern, re.VERBOSE | re.DOTALL)
+
+# Tokens that matter within a def header.
+token_re = re.compile(br'''
+    (?P<string>%s)
+  | (?P<comment>\#[^\r\n]*)
+  | (?P<name>[a-zA-Z_][a-zA-Z0-9_]*)
+  | (?P<number>[0-9][a-zA-Z0-9_.]*)
+  | (?P<open>[(\[{])
+  | (?P<close>[)\]}])
+  | (?P<op>->|==|!=|<=|>=|[:=,])
+''' % string_pattern, re.VERBOSE | re.DOTALL)
+
+newline_re = re.compile(br'\r\n|\r|\n')
+non_newline_re = re.compile(br'[^\r\n]')
+
+
+def blank(text):
+    """Replace everything except line breaks with spaces."""
+    return non_newline_re.sub(b' ', text)
+
+
+def blank_return_annotation(text):
+    """Blank out the text between ')' and ':' that contains a return annotation.
+
+    The result must stay on the logical line of the function definition, so
+    line breaks become explicit continuations.
+    """
+    breaks = list(newline_re.finditer(text))
+    if not breaks:
+        return b' ' * len(text)
+    return b'\\\n' * len(breaks) + b' ' * (len(text) - breaks[-1].end())
+
+
+def strip_annotations(source):
+    """Return the source with function annotations replaced by whitespace."""
+    parts = []
+    copied = 0  # Everything before this position is in parts
+    pos = 0
+    while True:
+        for m in def_re.finditer(source, pos):
+            if m.lastgroup == 'def':
+                break
+        else:
+            break
+        pos, copied = strip_def_header(source, m.end(), parts, copied)
+    parts.append(source[copied:])
+    return b''.join(parts)
+
+
+def strip_def_header(source, pos, parts, copied):
+    """Strip the annotations of the def header that starts at pos.
+
+    Append the source up to the last annotation to parts. Return the
+    position after the header and the new value of copied.
+    """
+    depth = 0  # Bracket nesting depth
+    in_params = False  # Within the parameter list?
+    lambdas = []  # Bracket depths of the lambdas with pending ':'
+    annotation_start = None  # Start of the current parameter annotation
+    return_start = None  # End of the parameter list
+    has_return_annotation = False
+
+    for m in token_re.finditer(source, pos):
+        kind = m.lastgroup
+        if kind == 'open':
+            depth += 1
+            if depth == 1 and return_start is None:
+                in_params = True
+        elif kind == 'close':
+            if annotation_start is not None and depth == 1:
+                # The annotation of the last parameter.
+                parts.append(source[copied:annotation_start])
+                parts.append(blank(source[annotation_start:m.start()]))
+                copied = m.start()
+                annotation_start = None
+            if depth > 0:
+                depth -= 1
+            if lambdas and lambdas[-1] > depth:
+                lambdas.pop()
+            if depth == 0 and in_params:
+                in_params = False
+                return_start = m.end()
+        elif kind == 'name':
+            if m.group() == b'lambda' and annotation_start is None:
+                lambdas.append(depth)
+        elif kind == 'op':
+            token = m.group()
+            if token == b':':
+                if lambdas and lambdas[-1] == depth:
+                    lambdas.pop()
+                elif depth == 0:
+                    # End of the header.
+                    if has_return_annotation:
+                        parts.append(source[copied:return_start])
+                        parts.append(blank_return_annotation(source[return_start:m.start()]))
+                        copied = m.start()
+                    return m.end(), copied
+                elif in_params and depth == 1 and annotation_start is None:
+                    annotation_start = m.start()
+            elif token == b'->':
+                if return_start is not None and depth == 0:
+                    has_return_annotation = True
+            elif token in (b'=', b','):
+                if annotation_start is not None and depth == 1:
+                    parts.append(source[copied:annotation_start])
+                    parts.append(blank(source[annotation_start:m.start()]))
+                    copied = m.start()
+                    annotation_start = None
+    return len(source), copied
@@ -4,7 +4,7 @@ import sys
 import traceback
 from collections import OrderedDict, defaultdict
 
-from typing import Tuple, List, TypeVar, Set, Dict, Optional
+from typing import Any, Tuple, List, TypeVar, Set, Dict, Optional
 
 
 T = TypeVar('T')
@@ -32,8 +32,9 @@ class ErrorInfo:
     # Either 'error' or 'note'.
     severity = ''
 
-    # The error message.
-    message = ''
+    # The error message. This can also be an object that is converted to the
+    # message string when messages are rendered (see mypy.messages.TypeMessage).
+    message = ''  # type: Any
 
     # If True, we should halt build after the file that generated this error.
     blocker = False
@@ -42,7 +43,7 @@ class ErrorInfo:
     only_once = False
 
     def __init__(self, import_ctx: List[Tuple[str, int]], file: str, typ: str,
-                 function_or_member: str, line: int, severity: str, message: str,
+                 function_or_member: str, line: int, severity: str, message: Any,
                  blocker: bool, only_once: bool) -> None:
         self.import_ctx = import_ctx
         self.file = file
@@ -169,13 +170,14 @@ class Errors:
         """Replace the entire import context with a new value."""
         self.import_ctx = ctx[:]
 
-    def report(self, line: int, message: str, blocker: bool = False,
+    def report(self, line: int, message: Any, blocker: bool = False,
                severity: str = 'error', file: str = None, only_once: bool = False) -> None:
         """Report message at the given line using the current error context.
 
         Args:
             line: line number of error
-            message: message to report
+            message: message to report (a string, or an object that is converted to one
+                when messages are rendered)
             blocker: if True, don't continue analysis after this error
             severity: 'error', 'note' or 'warning'
             file: if non-None, override current file as context
@@ -199,9 +201,10 @@ class Errors:
             self.used_ignored_lines[info.file].add(info.line)
             return
         if info.only_once:
-            if info.message in self.only_once_messages:
+            message = str(info.message)
+            if message in self.only_once_messages:
                 return
-            self.only_once_messages.add(info.message)
+            self.only_once_messages.add(message)
         self.error_info.append(info)
 
     def generate_unused_ignore_notes(self) -> None:
@@ -322,7 +325,7 @@ class Errors:
                     result.append((file, -1, 'note',
                                    'In class "{}":'.format(e.type)))
 
-            result.append((file, e.line, e.severity, e.message))
+            result.append((file, e.line, e.severity, str(e.message)))
 
             prev_import_context = e.import_ctx
             prev_function_or_member = e.function_or_member
@@ -11,7 +11,8 @@ def expand_type(typ: Type, env: Dict[TypeVarId, Type]) -> Type:
     """Substitute any type variable references in a type given by a type
     environment.
     """
-
+    if expands_to_self(typ):
+        return typ
     return typ.accept(ExpandTypeVisitor(env))
 
 
@@ -28,6 +29,34 @@ def expand_type_by_instance(typ: Type, instance: Instance) -> Type:
         return expand_type(typ, variables)
 
 
+def expands_to_self(t: Type) -> bool:
+    """Does expanding type variables in t always return t itself?
+
+    This is true for types without type variables, except for those that
+    expansion normalizes: unions are simplified, instances lose the erased
+    flag, and literal types and implicit tuple types are rebuilt without
+    some of their attributes. The result is cached in the type.
+    """
+    result = t.expands_to_self
+    if result is None:
+        if isinstance(t, Instance):
+            result = not t.erased and all(expands_to_self(arg) for arg in t.args)
+        elif isinstance(t, CallableType):
+            result = (all(expands_to_self(arg) for arg in t.arg_types)
+                      and expands_to_self(t.ret_type))
+        elif isinstance(t, Overloaded):
+            result = all(expands_to_self(item) for item in t.items())
+        elif isinstance(t, TupleType):
+            result = not t.implicit and all(expands_to_self(item) for item in t.items)
+        elif isinstance(t, TypeType):
+            result = expands_to_self(t.item)
+        else:
+            result = not isinstance(t, (TypeVarType, UnionType, LiteralType, ErasedType,
+                                        TypeList))
+        t.expands_to_self = result
+    return result
+
+
 class ExpandTypeVisitor(TypeVisitor[Type]):
     """Visitor that substitutes type variables with values."""
 
@@ -79,12 +108,12 @@ class ExpandTypeVisitor(TypeVisitor[Type]):
 
     def visit_callable_type(self, t: CallableType) -> Type:
         return t.copy_modified(arg_types=self.expand_types(t.arg_types),
-                               ret_type=t.ret_type.accept(self))
+                               ret_type=self.expand(t.ret_type))
 
     def visit_overloaded(self, t: Overloaded) -> Type:
         items = []  # type: List[CallableType]
         for item in t.items():
-            items.append(cast(CallableType, item.accept(self)))
+            items.append(cast(CallableType, self.expand(item)))
         return Overloaded(items)
 
     def visit_tuple_type(self, t: TupleType) -> Type:
@@ -96,7 +125,7 @@ class ExpandTypeVisitor(TypeVisitor[Type]):
         return UnionType.make_simplified_union(self.expand_types(t.items), t.line)
 
     def visit_literal_type(self, t: LiteralType) -> Type:
-        return LiteralType(t.base.accept(self), line=t.line)
+        return LiteralType(self.expand(t.base), line=t.line)
 
     def visit_partial_type(self, t: PartialType) -> Type:
         return t
@@ -105,11 +134,17 @@ class ExpandTypeVisitor(TypeVisitor[Type]):
         # TODO: Verify that the new item type is valid (instance or
         # union of instances or Any).  Sadly we can't report errors
         # here yet.
-        item = t.item.accept(self)
+        item = self.expand(t.item)
         return TypeType(item)
 
+    def expand(self, t: Type) -> Type:
+        # Check the cached flag first to avoid a call in the common case.
+        if t.expands_to_self or (t.expands_to_self is None and expands_to_self(t)):
+            return t
+        return t.accept(self)
+
     def expand_types(self, types: List[Type]) -> List[Type]:
         a = []  # type: List[Type]
         for t in types:
-            a.append(t.accept(self))
+            a.append(self.expand(t))
         return a
@@ -17,6 +17,7 @@ from mypy.nodes import (
     ARG_POS, ARG_OPT, ARG_STAR, ARG_NAMED, ARG_STAR2
 )
 from mypy.types import Type, CallableType, AnyType, UnboundType, TupleType, TypeList, EllipsisType
+from mypy.parsetype import cached_type_parse
 from mypy import defaults
 from mypy import experiments
 from mypy.errors import Errors
@@ -84,6 +85,11 @@ def parse(source: Union[str, bytes], fnam: str = None, errors: Errors = None,
 
 
 def parse_type_comment(type_comment: str, line: int) -> Type:
+    return cached_type_parse('fast', type_comment, line,
+                             lambda: _parse_type_comment(type_comment, line))
+
+
+def _parse_type_comment(type_comment: str, line: int) -> Type:
     try:
         typ = ast35.parse(type_comment, '<type_comment>', 'eval')
     except SyntaxError:
@@ -139,7 +139,7 @@ class TypeFixer(TypeVisitor[None]):
         type_ref = inst.type_ref
         if type_ref is None:
             return  # We've already been here.
-        del inst.type_ref
+        inst.type_ref = None
         node = lookup_qualified(self.modules, type_ref)
         if isinstance(node, TypeInfo):
             inst.type = node
@@ -0,0 +1,311 @@
+"""Fast scanner for the import statements of a module.
+
+Find the import statements of a source file without lexing and parsing
+all of it. This is used to discover the module dependency graph (and the
+order in which modules should be processed) before any module is fully
+parsed.
+
+The scanner only looks at statement boundaries: string literals, comments
+and brackets are recognized so that they can be skipped, and logical lines
+that start with 'import' or 'from' are parsed. It mirrors what the first
+pass of semantic analysis infers about each import:
+
+ * is_top_level is set for imports that are not within a function or a
+   class body
+ * is_unreachable is set for imports within blocks that are skipped based
+   on PY2/PY3/MYPY conditions (see semanal.infer_if_condition_value)
+
+The result is a prediction only: after a module has been parsed, its
+dependencies are always recomputed from the parse tree.
+"""
+
+import re
+
+from typing import List, Optional, Set, Tuple
+
+from mypy.nodes import ImportBase, Import, ImportFrom, ImportAll
+from mypy.semanal import ALWAYS_TRUE, ALWAYS_FALSE, TRUTH_VALUE_UNKNOWN
+
+
+# Things that affect where statements begin and end. Everything else
+# (names, operators, numbers) is skipped by the regular expression engine.
+token_re = re.compile(r'''
+    (?P<string>(?:[rRbBuU]{1,2})?
+        (?:\'\'\'(?:[^\\]|\\.)*?\'\'\'
+          |"""(?:[^\\]|\\.)*?"""
+          |'(?:[^'\\\r\n]|\\.)*'
+          |"(?:[^"\\\r\n]|\\.)*"))
+  | (?P<comment>\#[^\r\n]*)
+  | (?P<newline>\r\n|\r|\n)
+  | (?P<continuation>\\(?:\r\n|\r|\n))
+  | (?P<open>[(\[{])
+  | (?P<close>[)\]}])
+  | (?P<sep>[:;])
+''', re.VERBOSE | re.DOTALL)
+
+newline_re = re.compile(r'\r\n|\r|\n')
+comment_re = re.compile(r'#[^\r\n]*')
+indent_re = re.compile(r'[ \t\x0c]*')
+keyword_re = re.compile(r'[a-zA-Z_][a-zA-Z0-9_]*')
+type_ignore_re = re.compile(r'#[ \t]*type:[ \t]*ignore\b')
+
+# Statements that introduce a block (when followed by a colon).
+compound_keywords = {'if', 'elif', 'else', 'while', 'for', 'try', 'except',
+                     'finally', 'with', 'def', 'class', 'async'}
+
+import_re = re.compile(r'import\s+(.*)$', re.DOTALL)
+from_re = re.compile(r'from\s*((?:\.\s*)*)([a-zA-Z_][\w.\s]*?)?\s*\bimport\b\s*(.*)$',
+                     re.DOTALL)
+as_clause_re = re.compile(r'\s*(.*?)\s+as\s+(\w+)\s*$', re.DOTALL)
+dotted_name_re = re.compile(r'[a-zA-Z_]\w*(?:\s*\.\s*[a-zA-Z_]\w*)*$')
+whitespace_re = re.compile(r'\s+')
+
+
+class Block:
+    """An open block of statements."""
+
+    def __init__(self, indent: int, in_def: bool, unreachable: bool,
+                 reachability: bool) -> None:
+        # Indentation of the statement that introduced the block.
+        self.indent = indent
+        # Within a function or class body?
+        self.in_def = in_def
+        self.unreachable = unreachable
+        # Are if statements in this block visited by the first pass (and thus
+        # used to infer reachability)?
+        self.reachability = reachability
+        # State of the most recent if statement directly within this block:
+        # None if the previous statement was not an if/elif, otherwise a
+        # flag telling whether one of the conditions was always true.
+        self.if_chain = None  # type: Optional[List[bool]]
+
+
+class ImportScanner:
+    """Find the import statements of a single module."""
+
+    def __init__(self, text: str, pyversion: Tuple[int, int],
+                 custom_typing_module: str = None) -> None:
+        self.text = text
+        self.pyversion = pyversion
+        self.custom_typing_module = custom_typing_module
+        self.imports = []  # type: List[ImportBase]
+        self.ignored_lines = set()  # type: Set[int]
+        self.line_starts = [0] + [m.end() for m in newline_re.finditer(text)]
+        self.blocks = [Block(-1, False, False, True)]
+        # Block introduced by the previous compound statement header, if its
+        # body hasn't started yet.
+        self.pending = None  # type: Block
+
+    def scan(self) -> List[ImportBase]:
+        text = self.text
+        depth = 0
+        start = 0  # Start of the current logical line
+        seps = []  # type: List[int]  # Positions of ':' and ';' outside brackets
+        for m in token_re.finditer(text):
+            kind = m.lastgroup
+            if kind == 'newline':
+                if depth == 0:
+                    self.logical_line(start, m.start(), seps)
+                    start = m.end()
+                    seps = []
+            elif kind == 'open':
+                depth += 1
+            elif kind == 'close':
+                if depth > 0:
+                    depth -= 1
+            elif kind == 'sep':
+                if depth == 0:
+                    seps.append(m.start())
+            elif kind == 'comment':
+                if type_ignore_re.match(m.group()):
+                    self.ignored_lines.add(self.line_of(m.start()))
+        self.logical_line(start, len(text), seps)
+        return self.imports
+
+    def line_of(self, pos: int) -> int:
+        lo, hi = 0, len(self.line_starts)
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if self.line_starts[mid] <= pos:
+                lo = mid
+            else:
+                hi = mid
+        return lo + 1
+
+    def logical_line(self, start: int, end: int, seps: List[int]) -> None:
+        text = self.text
+        m = indent_re.match(text, start)
+        pos = m.end()
+        if pos >= end or text[pos] in '#\r\n':
+            # Blank line or comment only.
+            return
+        indent = len(m.group().expandtabs(8))
+        if self.pending is not None:
+            if indent > self.pending.indent:
+                self.blocks.append(self.pending)
+            self.pending = None
+        while indent <= self.blocks[-1].indent:
+            self.blocks.pop()
+        block = self.blocks[-1]
+        seps = [p for p in seps if p > pos]
+        # Process the simple statements on the line (separated by ';'), and
+        # the header of a compound statement (terminated by ':').
+        while True:
+            word = keyword_re.match(text, pos)
+            keyword = word.group() if word else ''
+            if keyword in compound_keywords and seps and text[seps[0]] == ':':
+                colon = seps.pop(0)
+                body = self.compound_header(block, keyword, pos, colon, indent)
+                body_start = indent_re.match(text, colon + 1).end()
+                if body_start < end and text[body_start] != '#':
+                    # Statements on the same line as the header.
+                    block = body
+                    pos = body_start
+                    continue
+                self.pending = body
+                return
+            stmt_end = end
+            while seps:
+                sep = seps.pop(0)
+                if text[sep] == ';':
+                    stmt_end = sep
+                    break
+            self.simple_statement(block, keyword, pos, stmt_end)
+            block.if_chain = None
+            if stmt_end == end:
+                return
+            pos = indent_re.match(text, stmt_end + 1).end()
+            if pos >= end or text[pos] == '#':
+                return
+
+    def compound_header(self, block: Block, keyword: str, pos: int, colon: int,
+                        indent: int) -> Block:
+        """Process a compound statement header and return the new block."""
+        unreachable = block.unreachable
+        if keyword in ('if', 'elif', 'else') and block.reachability:
+            if keyword == 'if':
+                block.if_chain = [False]
+            chain = block.if_chain
+            if chain is not None:
+                if chain[0]:
+                    # An earlier condition was always true.
+                    unreachable = True
+                elif keyword != 'else':
+                    value = self.condition_value(text=self.text[pos + len(keyword):colon])
+                    if value == ALWAYS_FALSE:
+                        unreachable = True
+                    elif value == ALWAYS_TRUE:
+                        chain[0] = True
+        else:
+            block.if_chain = None
+        in_def = block.in_def or keyword in ('def', 'class', 'async')
+        return Block(indent, in_def, unreachable, not in_def)
+
+    def condition_value(self, text: str) -> int:
+        """Infer the truth value of an if condition, like the first pass does."""
+        expr = text.strip()
+        negated = False
+        if expr.startswith('not') and not keyword_re.match(expr[3:4]):
+            expr = expr[3:].strip()
+            negated = True
+        while expr.startswith('(') and expr.endswith(')'):
+            expr = expr[1:-1].strip()
+        if not dotted_name_re.match(expr):
+            return TRUTH_VALUE_UNKNOWN
+        name = expr.split('.')[-1].strip()
+        result = TRUTH_VALUE_UNKNOWN
+        if name == 'PY2':
+            result = ALWAYS_TRUE if self.pyversion[0] == 2 else ALWAYS_FALSE
+        elif name == 'PY3':
+            result = ALWAYS_TRUE if self.pyversion[0] == 3 else ALWAYS_FALSE
+        elif name == 'MYPY':
+            result = ALWAYS_TRUE
+        if negated:
+            if result == ALWAYS_TRUE:
+                result = ALWAYS_FALSE
+            elif result == ALWAYS_FALSE:
+                result = ALWAYS_TRUE
+        return result
+
+    def simple_statement(self, block: Block, keyword: str, pos: int, end: int) -> None:
+        if keyword not in ('import', 'from'):
+            return
+        stmt = comment_re.sub('', self.text[pos:end]).replace('\\', ' ')
+        node = self.parse_import(stmt)
+        if node is None:
+            return
+        node.set_line(self.line_of(pos))
+        node.is_top_level = not block.in_def
+        node.is_unreachable = block.unreachable
+        self.imports.append(node)
+
+    def parse_import(self, stmt: str) -> Optional[ImportBase]:
+        """Parse an import statement; return None if it's not a valid import."""
+        m = import_re.match(stmt)
+        if m:
+            ids = []  # type: List[Tuple[str, Optional[str]]]
+            for item in m.group(1).split(','):
+                id, as_id = parse_as_clause(item)
+                if id is None:
+                    return None
+                translated = self.translate_module_id(id)
+                if as_id is None and translated != id:
+                    as_id = id
+                ids.append((translated, as_id))
+            return Import(ids)
+        m = from_re.match(stmt)
+        if m:
+            relative = m.group(1).count('.')
+            id = self.translate_module_id(whitespace_re.sub('', m.group(2) or ''))
+            if not relative and not id:
+                return None
+            names_text = m.group(3).strip()
+            if names_text == '*':
+                return ImportAll(id, relative)
+            if names_text.startswith('(') and names_text.endswith(')'):
+                names_text = names_text[1:-1]
+            names = []  # type: List[Tuple[str, Optional[str]]]
+            for item in names_text.split(','):
+                if not item.strip() and names:
+                    # Trailing comma
+                    continue
+                name, as_name = parse_as_clause(item)
+                if name is None or '.' in name:
+                    return None
+                if '%s.%s' % (id, name) == self.custom_typing_module:
+                    return Import([('typing', as_name)])
+                names.append((name, as_name))
+            return ImportFrom(id, relative, names)
+        return None
+
+    def translate_module_id(self, id: str) -> str:
+        """Translate a module id like the parser does (see Parser.translate_module_id)."""
+        if id == self.custom_typing_module:
+            return 'typing'
+        elif id == '__builtin__' and self.pyversion[0] == 2:
+            return 'builtins'
+        return id
+
+
+def parse_as_clause(item: str) -> Tuple[Optional[str], Optional[str]]:
+    """Parse 'name [as name]'; return (None, None) if it's not valid."""
+    m = as_clause_re.match(item)
+    if m:
+        name, as_name = m.group(1), m.group(2)  # type: str, Optional[str]
+    else:
+        name, as_name = item, None
+    name = whitespace_re.sub('', name)
+    if not dotted_name_re.match(name):
+        return None, None
+    return name, as_name
+
+
+def scan_imports(text: str, pyversion: Tuple[int, int],
+                 custom_typing_module: str = None) -> Tuple[List[ImportBase], Set[int]]:
+    """Find the import statements in the source code of a module.
+
+    Return the imports and the lines with '# type: ignore' comments.
+    """
+    scanner = ImportScanner(text, pyversion, custom_typing_module)
+    imports = scanner.scan()
+    return imports, scanner.ignored_lines
@@ -1,19 +1,25 @@
 """Calculation of the least upper bound types (joins)."""
 
-from typing import cast, List
+from typing import cast, Any, List, Optional, Tuple
 
+import mypy.nodes
 from mypy.types import (
     Type, AnyType, NoneTyp, Void, TypeVisitor, Instance, UnboundType,
     ErrorType, TypeVarType, CallableType, TupleType, ErasedType, TypeList,
     LiteralType, UnionType, FunctionLike, Overloaded, PartialType, DeletedType,
-    UninhabitedType, TypeType
+    UninhabitedType, TypeType, intern_type_var_free
 )
 from mypy.maptype import map_instance_to_supertype
 from mypy.subtypes import is_subtype, is_equivalent, is_subtype_ignoring_tvars
+from mypy.util import MemoTable
 
 from mypy import experiments
 
 
+# Results of join_types for types without type variables (see type_pair_key).
+join_cache = MemoTable('Join', 10000)  # type: MemoTable[Tuple[Any, ...], Type]
+
+
 def join_simple(declaration: Type, s: Type, t: Type) -> Type:
     """Return a simple least upper bound given the declared type."""
 
@@ -38,7 +44,7 @@ def join_simple(declaration: Type, s: Type, t: Type) -> Type:
     if isinstance(s, UninhabitedType) and not isinstance(t, UninhabitedType):
         s, t = t, s
 
-    value = t.accept(TypeJoinVisitor(s))
+    value = join_types(s, t)
 
     if value is None:
         # XXX this code path probably should be avoided.
@@ -69,8 +75,37 @@ def join_types(s: Type, t: Type) -> Type:
     if isinstance(s, NoneTyp) and not isinstance(t, NoneTyp):
         s, t = t, s
 
-    # Use a visitor to handle non-trivial cases.
-    return t.accept(TypeJoinVisitor(s))
+    key = type_pair_key(s, t, join_cache)
+    if key is None:
+        # Use a visitor to handle non-trivial cases.
+        return t.accept(TypeJoinVisitor(s))
+    result = join_cache.get(key)
+    if result is None:
+        result = t.accept(TypeJoinVisitor(s))
+        join_cache.put(key, result)
+    return result
+
+
+def type_pair_key(s: Type, t: Type, cache: MemoTable[Tuple[Any, ...], Type]
+                  ) -> Optional[Tuple[Any, ...]]:
+    """Return the key of an operation on s and t in a join or meet cache.
+
+    Return None if the result shouldn't be cached. Only operations on
+    compound types without type variables are cached, and the key consists
+    of the interned operands. Results depend on the class hierarchy, so the
+    cache is emptied whenever the MRO of any class changes.
+    """
+    if not (isinstance(s, (Instance, TupleType, UnionType, CallableType, TypeType)) and
+            isinstance(t, (Instance, TupleType, UnionType, CallableType, TypeType))):
+        return None
+    cache.validate(mypy.nodes.mro_generation)
+    s = intern_type_var_free(s)
+    if s is None:
+        return None
+    t = intern_type_var_free(t)
+    if t is None:
+        return None
+    return (s, t, experiments.STRICT_OPTIONAL)
 
 
 class TypeJoinVisitor(TypeVisitor[Type]):
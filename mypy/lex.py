@@ -7,6 +7,7 @@ This module can be run as a script (lex.py FILE).
 """
 
 import re
+import sys
 
 from mypy.util import short_type, find_python_encoding
 from mypy import defaults
@@ -16,6 +17,10 @@ from typing import List, Callable, Dict, Any, Match, Pattern, Set, Union, Tuple
 class Token:
     """Base class for all tokens."""
 
+    # Tokens are by far the most numerous objects created during parsing, so
+    # avoid a per-instance __dict__. Subclasses must also define __slots__.
+    __slots__ = ('string', 'pre', 'line')
+
     def __init__(self, string: str, pre: str = '') -> None:
         """Initialize a token.
 
@@ -50,18 +55,26 @@ class Token:
 class Break(Token):
     """Statement break (line break or semicolon)"""
 
+    __slots__ = ()
+
 
 class Indent(Token):
     """Increase block indent level."""
 
+    __slots__ = ()
+
 
 class Dedent(Token):
     """Decrease block indent level."""
 
+    __slots__ = ()
+
 
 class Eof(Token):
     """End of file"""
 
+    __slots__ = ()
+
 
 class Keyword(Token):
     """Reserved word (other than keyword operators; they use Op).
@@ -69,18 +82,26 @@ class Keyword(Token):
     Examples: if, class, while, def.
     """
 
+    __slots__ = ()
+
 
 class Name(Token):
     """An alphanumeric identifier"""
 
+    __slots__ = ()
+
 
 class IntLit(Token):
     """Integer literal"""
 
+    __slots__ = ()
+
 
 class StrLit(Token):
     """String literal"""
 
+    __slots__ = ()
+
     def parsed(self) -> str:
         """Return the parsed contents of the literal."""
         return _parse_str_literal(self.string)
@@ -89,6 +110,8 @@ class StrLit(Token):
 class BytesLit(Token):
     """Bytes literal"""
 
+    __slots__ = ()
+
     def parsed(self) -> str:
         """Return the parsed contents of the literal."""
         return _parse_str_literal(self.string)
@@ -97,6 +120,8 @@ class BytesLit(Token):
 class UnicodeLit(Token):
     """Unicode literal (Python 2.x)"""
 
+    __slots__ = ()
+
     def parsed(self) -> str:
         """Return the parsed contents of the literal."""
         return _parse_str_literal(self.string)
@@ -105,34 +130,46 @@ class UnicodeLit(Token):
 class FloatLit(Token):
     """Float literal"""
 
+    __slots__ = ()
+
 
 class ComplexLit(Token):
     """Complex literal"""
 
+    __slots__ = ()
+
 
 class Punct(Token):
     """Punctuator (e.g. comma, '(' or '=')"""
 
+    __slots__ = ()
+
 
 class Colon(Token):
-    pass
+    __slots__ = ()
 
 
 class EllipsisToken(Token):
-    pass
+    __slots__ = ()
 
 
 class Op(Token):
     """Operator (e.g. '+' or 'in')"""
 
+    __slots__ = ()
+
 
 class Bom(Token):
     """Byte order mark (at the start of a file)"""
 
+    __slots__ = ()
+
 
 class LexError(Token):
     """Lexer error token"""
 
+    __slots__ = ('type', 'message')
+
     def __init__(self, string: str, type: int, message: str = None) -> None:
         """Initialize token.
 
@@ -503,7 +540,9 @@ class Lexer:
         A name can be an identifier, a keyword or an alphabetical operator.
         Also deal with prefixed string literals such as r'...'.
         """
-        s = self.match(self.name_exp)
+        # Identifiers and keywords repeat a lot; share a single string object
+        # for each distinct name.
+        s = sys.intern(self.match(self.name_exp))
         if s in self.keywords:
             self.add_token(Keyword(s))
         elif s in alpha_operators:
@@ -879,7 +918,6 @@ class Lexer:
 
 if __name__ == '__main__':
     # Lexically analyze a file and dump the tokens to stdout.
-    import sys
     if len(sys.argv) != 2:
         print('Usage: lex.py FILE', file=sys.stderr)
         sys.exit(2)
@@ -167,6 +167,11 @@ def process_options(args: List[str]) -> Tuple[List[BuildSource], Options]:
                         help="Suppress context notes before errors")
     parser.add_argument('--fast-parser', action='store_true',
                         help="enable experimental fast parser")
+    parser.add_argument('--scan-imports', action='store_true',
+                        help="enable experimental import scanning before parsing")
+    parser.add_argument('--skip-untyped-bodies', action='store_true',
+                        help="enable experimental skipping of the interior of functions"
+                        " without type annotations")
     parser.add_argument('-i', '--incremental', action='store_true',
                         help="enable experimental module cache")
     parser.add_argument('--cache-dir', action='store', metavar='DIR',
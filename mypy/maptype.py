@@ -1,6 +1,7 @@
-from typing import Dict, List, cast
+from typing import Dict, cast
 
-from mypy.expandtype import expand_type
+import mypy.nodes
+from mypy.expandtype import expand_type, ExpandTypeVisitor
 from mypy.nodes import TypeInfo
 from mypy.types import Type, TypeVarId, Instance, AnyType
 
@@ -20,66 +21,52 @@ def map_instance_to_supertype(instance: Instance,
         # Fast path: `superclass` has no type variables to map to.
         return Instance(superclass, [])
 
-    return map_instance_to_supertypes(instance, superclass)[0]
-
-
-def map_instance_to_supertypes(instance: Instance,
-                               supertype: TypeInfo) -> List[Instance]:
-    # FIX: Currently we should only have one supertype per interface, so no
-    #      need to return an array
-    result = []  # type: List[Instance]
-    for path in class_derivation_paths(instance.type, supertype):
-        types = [instance]
-        for sup in path:
-            a = []  # type: List[Instance]
-            for t in types:
-                a.extend(map_instance_to_direct_supertypes(t, sup))
-            types = a
-        result.extend(types)
-    return result
-
-
-def class_derivation_paths(typ: TypeInfo,
-                           supertype: TypeInfo) -> List[List[TypeInfo]]:
-    """Return an array of non-empty paths of direct base classes from
-    type to supertype.  Return [] if no such path could be found.
-
-      InterfaceImplementationPaths(A, B) == [[B]] if A inherits B
-      InterfaceImplementationPaths(A, C) == [[B, C]] if A inherits B and
-                                                        B inherits C
-    """
-    # FIX: Currently we might only ever have a single path, so this could be
-    #      simplified
-    result = []  # type: List[List[TypeInfo]]
-
-    for base in typ.bases:
-        if base.type == supertype:
-            result.append([base.type])
-        else:
-            # Try constructing a longer path via the base class.
-            for path in class_derivation_paths(base.type, supertype):
-                result.append([base.type] + path)
-
-    return result
-
-
-def map_instance_to_direct_supertypes(instance: Instance,
-                                      supertype: TypeInfo) -> List[Instance]:
-    # FIX: There should only be one supertypes, always.
-    typ = instance.type
-    result = []  # type: List[Instance]
-
-    for b in typ.bases:
-        if b.type == supertype:
-            env = instance_to_type_environment(instance)
-            result.append(cast(Instance, expand_type(b, env)))
-
-    if result:
-        return result
-    else:
+    template = supertype_templates(instance.type).get(superclass)
+    if template is None:
         # Relationship with the supertype not specified explicitly. Use dynamic
         # type arguments implicitly.
-        return [Instance(supertype, [AnyType()] * len(supertype.type_vars))]
+        return Instance(superclass, [AnyType()] * len(superclass.type_vars))
+    return expand_template(template, instance_to_type_environment(instance))
+
+
+def supertype_templates(typ: TypeInfo) -> Dict[TypeInfo, Instance]:
+    """Return the table of base class instances of a class (see TypeInfo.supertype_templates).
+
+    If there are several paths of base classes from typ to a base class, the
+    first one (in depth-first order of the bases) is used.
+    """
+    if (typ.supertype_templates is not None
+            and typ.supertype_templates_generation == mypy.nodes.mro_generation):
+        return typ.supertype_templates
+    templates = {}  # type: Dict[TypeInfo, Instance]
+    for base in typ.bases:
+        base = cast(Instance, expand_type(base, {}))
+        if base.type not in templates:
+            templates[base.type] = base
+        # Map the templates of the base class to the type variables of typ.
+        env = instance_to_type_environment(base)
+        for supertype, template in supertype_templates(base.type).items():
+            if supertype not in templates:
+                templates[supertype] = expand_template(template, env)
+    typ.supertype_templates = templates
+    typ.supertype_templates_generation = mypy.nodes.mro_generation
+    return templates
+
+
+def expand_template(template: Instance, env: Dict[TypeVarId, Type]) -> Instance:
+    return cast(Instance, template.accept(TemplateExpander(env)))
+
+
+class TemplateExpander(ExpandTypeVisitor):
+    """Substitute type variables in a supertype template.
+
+    Instances in templates may already have been substituted for type
+    variables (when mapping through an intermediate base class), so their
+    erased flags are kept.
+    """
+
+    def visit_instance(self, t: Instance) -> Type:
+        return Instance(t.type, self.expand_types(t.args), t.line, t.erased)
 
 
 def instance_to_type_environment(instance: Instance) -> Dict[TypeVarId, Type]:
@@ -1,6 +1,6 @@
-from typing import cast, List
+from typing import cast, Any, List, Tuple
 
-from mypy.join import is_similar_callables, combine_similar_callables
+from mypy.join import is_similar_callables, combine_similar_callables, type_pair_key
 from mypy.types import (
     Type, AnyType, TypeVisitor, UnboundType, Void, ErrorType, NoneTyp, TypeVarType,
     Instance, CallableType, TupleType, ErasedType, TypeList, UnionType, PartialType,
@@ -8,12 +8,17 @@ from mypy.types import (
 )
 from mypy.subtypes import is_subtype
 from mypy.nodes import TypeInfo
+from mypy.util import MemoTable
 
 from mypy import experiments
 
 # TODO Describe this module.
 
 
+# Results of meet_types for types without type variables (see join.type_pair_key).
+meet_cache = MemoTable('Meet', 10000)  # type: MemoTable[Tuple[Any, ...], Type]
+
+
 def meet_types(s: Type, t: Type) -> Type:
     """Return the greatest lower bound of two types."""
     if isinstance(s, ErasedType):
@@ -22,7 +27,14 @@ def meet_types(s: Type, t: Type) -> Type:
         return t
     if isinstance(s, UnionType) and not isinstance(t, UnionType):
         s, t = t, s
-    return t.accept(TypeMeetVisitor(s))
+    key = type_pair_key(s, t, meet_cache)
+    if key is None:
+        return t.accept(TypeMeetVisitor(s))
+    result = meet_cache.get(key)
+    if result is None:
+        result = t.accept(TypeMeetVisitor(s))
+        meet_cache.put(key, result)
+    return result
 
 
 def meet_simple(s: Type, t: Type, default_right: bool = True) -> Type:
@@ -6,7 +6,7 @@ improve code clarity and to simplify localization (in the future)."""
 import re
 import difflib
 
-from typing import cast, List, Dict, Any, Sequence, Iterable, Tuple
+from typing import cast, List, Dict, Any, Sequence, Iterable, Tuple, Union, Callable
 
 from mypy.errors import Errors
 from mypy.types import (
@@ -84,6 +84,37 @@ KEYWORD_ARGUMENT_REQUIRES_STR_KEY_TYPE = \
 ALL_MUST_BE_SEQ_STR = 'Type of __all__ must be {}, not {}'
 
 
+class TypeMessage:
+    """An error message that refers to types.
+
+    The message is a format string and its arguments. Arguments that are types
+    are formatted using MessageBuilder.format and callable arguments are
+    replaced with their return values, but only when the message is converted
+    to a string, which usually happens in Errors.messages. Many messages are
+    reported to disabled message builders or to copies that are discarded
+    (for example, when matching overload items), and formatting the types
+    would be most of the cost of reporting them.
+    """
+
+    def __init__(self, builder: 'MessageBuilder', template: str, *args: Any) -> None:
+        self.builder = builder
+        self.template = template
+        self.args = args
+        self.text = None  # type: str
+
+    def __str__(self) -> str:
+        if self.text is None:
+            args = []  # type: List[Any]
+            for arg in self.args:
+                if isinstance(arg, Type):
+                    arg = self.builder.format(arg)
+                elif callable(arg):
+                    arg = arg()
+                args.append(arg)
+            self.text = self.template.format(*args).strip()
+        return self.text
+
+
 class MessageBuilder:
     """Helper class for reporting type checker error messages with parameters.
 
@@ -107,11 +138,15 @@ class MessageBuilder:
     # Hack to deduplicate error messages from union types
     disable_type_names = 0
 
+    # Number of messages reported so far, including disabled and ignored ones
+    num_reports = 0
+
     def __init__(self, errors: Errors, modules: Dict[str, MypyFile]) -> None:
         self.errors = errors
         self.modules = modules
         self.disable_count = 0
         self.disable_type_names = 0
+        self.num_reports = 0
 
     #
     # Helpers
@@ -138,17 +173,21 @@ class MessageBuilder:
     def is_errors(self) -> bool:
         return self.errors.is_errors()
 
-    def report(self, msg: str, context: Context, severity: str, file: str = None) -> None:
+    def report(self, msg: Union[str, TypeMessage], context: Context, severity: str,
+               file: str = None) -> None:
         """Report an error or note (unless disabled)."""
+        self.num_reports += 1
         if self.disable_count <= 0:
+            if isinstance(msg, str):
+                msg = msg.strip()
             self.errors.report(context.get_line() if context else -1,
-                               msg.strip(), severity=severity, file=file)
+                               msg, severity=severity, file=file)
 
-    def fail(self, msg: str, context: Context, file: str = None) -> None:
+    def fail(self, msg: Union[str, TypeMessage], context: Context, file: str = None) -> None:
         """Report an error message (unless disabled)."""
         self.report(msg, context, 'error', file=file)
 
-    def note(self, msg: str, context: Context, file: str = None) -> None:
+    def note(self, msg: Union[str, TypeMessage], context: Context, file: str = None) -> None:
         """Report an error message (unless disabled)."""
         self.report(msg, context, 'note', file=file)
 
@@ -298,6 +337,20 @@ class MessageBuilder:
                 return (str1, str2)
         return (str1, str2)
 
+    def lazy_format_distinctly(self, type1: Type,
+                               type2: Type) -> Tuple[Callable[[], str], Callable[[], str]]:
+        """Like format_distinctly, but return functions that produce the strings.
+
+        Use these as TypeMessage arguments.
+        """
+        result = []  # type: List[Tuple[str, str]]
+
+        def formatted(i: int) -> str:
+            if not result:
+                result.append(self.format_distinctly(type1, type2))
+            return result[0][i]
+        return (lambda: formatted(0)), (lambda: formatted(1))
+
     #
     # Specific operations
     #
@@ -319,8 +372,8 @@ class MessageBuilder:
         elif isinstance(typ, Void):
             self.check_void(typ, context)
         elif member == '__contains__':
-            self.fail('Unsupported right operand type for in ({})'.format(
-                self.format(typ)), context)
+            self.fail(TypeMessage(self, 'Unsupported right operand type for in ({})', typ),
+                      context)
         elif member in op_methods.values():
             # Access to a binary operator member (e.g. _add). This case does
             # not handle indexing operations.
@@ -329,38 +382,36 @@ class MessageBuilder:
                     self.unsupported_left_operand(op, typ, context)
                     break
         elif member == '__neg__':
-            self.fail('Unsupported operand type for unary - ({})'.format(
-                self.format(typ)), context)
+            self.fail(TypeMessage(self, 'Unsupported operand type for unary - ({})', typ),
+                      context)
         elif member == '__pos__':
-            self.fail('Unsupported operand type for unary + ({})'.format(
-                self.format(typ)), context)
+            self.fail(TypeMessage(self, 'Unsupported operand type for unary + ({})', typ),
+                      context)
         elif member == '__invert__':
-            self.fail('Unsupported operand type for ~ ({})'.format(
-                self.format(typ)), context)
+            self.fail(TypeMessage(self, 'Unsupported operand type for ~ ({})', typ),
+                      context)
         elif member == '__getitem__':
             # Indexed get.
-            self.fail('Value of type {} is not indexable'.format(
-                self.format(typ)), context)
+            self.fail(TypeMessage(self, 'Value of type {} is not indexable', typ), context)
         elif member == '__setitem__':
             # Indexed set.
             self.fail('Unsupported target for indexed assignment', context)
         elif member == '__call__':
-            self.fail('{} not callable'.format(self.format(typ)), context)
+            self.fail(TypeMessage(self, '{} not callable', typ), context)
         else:
             # The non-special case: a missing ordinary attribute.
             if not self.disable_type_names:
-                failed = False
-                if isinstance(typ, Instance) and typ.type.names:
-                    alternatives = set(typ.type.names.keys())
-                    matches = [m for m in COMMON_MISTAKES.get(member, []) if m in alternatives]
-                    matches.extend(best_matches(member, alternatives)[:3])
-                    if matches:
-                        self.fail('{} has no attribute "{}"; maybe {}?'.format(
-                            self.format(typ), member, pretty_or(matches)), context)
-                        failed = True
-                if not failed:
-                    self.fail('{} has no attribute "{}"'.format(self.format(typ),
-                                                                member), context)
+                def suggestion() -> str:
+                    if isinstance(typ, Instance) and typ.type.names:
+                        alternatives = set(typ.type.names.keys())
+                        matches = [m for m in COMMON_MISTAKES.get(member, [])
+                                   if m in alternatives]
+                        matches.extend(best_matches(member, alternatives)[:3])
+                        if matches:
+                            return '; maybe {}?'.format(pretty_or(matches))
+                    return ''
+                self.fail(TypeMessage(self, '{} has no attribute "{}"{}', typ, member, suggestion),
+                          context)
             else:
                 self.fail('Some element of union has no attribute "{}"'.format(
                     member), context)
@@ -376,40 +427,28 @@ class MessageBuilder:
             self.check_void(left_type, context)
             self.check_void(right_type, context)
             return
-        left_str = ''
-        if isinstance(left_type, str):
-            left_str = left_type
-        else:
-            left_str = self.format(left_type)
-
-        right_str = ''
-        if isinstance(right_type, str):
-            right_str = right_type
-        else:
-            right_str = self.format(right_type)
-
         if self.disable_type_names:
             msg = 'Unsupported operand types for {} (likely involving Union)'.format(op)
+            self.fail(msg, context)
         else:
-            msg = 'Unsupported operand types for {} ({} and {})'.format(
-                op, left_str, right_str)
-        self.fail(msg, context)
+            self.fail(TypeMessage(self, 'Unsupported operand types for {} ({} and {})',
+                                  op, left_type, right_type), context)
 
     def unsupported_left_operand(self, op: str, typ: Type,
                                  context: Context) -> None:
         if not self.check_void(typ, context):
             if self.disable_type_names:
-                msg = 'Unsupported left operand type for {} (some union)'.format(op)
+                self.fail('Unsupported left operand type for {} (some union)'.format(op),
+                          context)
             else:
-                msg = 'Unsupported left operand type for {} ({})'.format(
-                    op, self.format(typ))
-            self.fail(msg, context)
+                self.fail(TypeMessage(self, 'Unsupported left operand type for {} ({})',
+                                      op, typ), context)
 
     def type_expected_as_right_operand_of_is(self, context: Context) -> None:
         self.fail('Type expected as right operand of "is"', context)
 
     def not_callable(self, typ: Type, context: Context) -> Type:
-        self.fail('{} not callable'.format(self.format(typ)), context)
+        self.fail(TypeMessage(self, '{} not callable', typ), context)
         return AnyType()
 
     def untyped_function_call(self, callee: CallableType, context: Context) -> Type:
@@ -451,55 +490,51 @@ class MessageBuilder:
                 if n == 1:
                     self.invalid_index_type(arg_type, base, context)
                 else:
-                    msg = '{} (expression has type {}, target has type {})'
-                    arg_type_str, callee_type_str = self.format_distinctly(arg_type,
-                                                                           callee.arg_types[n - 1])
-                    self.fail(msg.format(INCOMPATIBLE_TYPES_IN_ASSIGNMENT,
-                                         arg_type_str, callee_type_str),
+                    arg_type_str, callee_type_str = self.lazy_format_distinctly(
+                        arg_type, callee.arg_types[n - 1])
+                    self.fail(TypeMessage(self, '{} (expression has type {}, target has type {})',
+                                          INCOMPATIBLE_TYPES_IN_ASSIGNMENT,
+                                          arg_type_str, callee_type_str),
                               context)
                 return
 
             target = 'to {} '.format(name)
 
-        msg = ''
         if callee.name == '<list>':
             name = callee.name[1:-1]
             n -= 1
-            msg = '{} item {} has incompatible type {}'.format(
-                name[0].upper() + name[1:], n, self.format_simple(arg_type))
+            msg = TypeMessage(self, '{} item {} has incompatible type {}',
+                              name[0].upper() + name[1:], n,
+                              lambda: self.format_simple(arg_type))
         elif callee.name == '<list-comprehension>':
-            msg = 'List comprehension has incompatible type List[{}]'.format(
-                strip_quotes(self.format(arg_type)))
+            msg = TypeMessage(self, 'List comprehension has incompatible type List[{}]',
+                              lambda: strip_quotes(self.format(arg_type)))
         elif callee.name == '<set-comprehension>':
-            msg = 'Set comprehension has incompatible type Set[{}]'.format(
-                strip_quotes(self.format(arg_type)))
+            msg = TypeMessage(self, 'Set comprehension has incompatible type Set[{}]',
+                              lambda: strip_quotes(self.format(arg_type)))
         elif callee.name == '<dictionary-comprehension>':
-            msg = ('{} expression in dictionary comprehension has incompatible type {}; '
-                   'expected type {}').format(
-                'Key' if n == 1 else 'Value',
-                self.format(arg_type),
-                self.format(callee.arg_types[n - 1]))
+            msg = TypeMessage(self, '{} expression in dictionary comprehension has incompatible '
+                              'type {}; expected type {}',
+                              'Key' if n == 1 else 'Value', arg_type, callee.arg_types[n - 1])
         elif callee.name == '<generator>':
-            msg = 'Generator has incompatible item type {}'.format(
-                self.format_simple(arg_type))
+            msg = TypeMessage(self, 'Generator has incompatible item type {}',
+                              lambda: self.format_simple(arg_type))
         else:
             try:
                 expected_type = callee.arg_types[m - 1]
             except IndexError:  # Varargs callees
                 expected_type = callee.arg_types[-1]
-            arg_type_str, expected_type_str = self.format_distinctly(arg_type, expected_type)
-            if arg_kind == ARG_STAR:
-                arg_type_str = '*' + arg_type_str
-            elif arg_kind == ARG_STAR2:
-                arg_type_str = '**' + arg_type_str
-            msg = 'Argument {} {}has incompatible type {}; expected {}'.format(
-                n, target, arg_type_str, expected_type_str)
+            arg_type_str, expected_type_str = self.lazy_format_distinctly(arg_type,
+                                                                          expected_type)
+            prefix = {ARG_STAR: '*', ARG_STAR2: '**'}.get(arg_kind, '')
+            msg = TypeMessage(self, 'Argument {} {}has incompatible type {}{}; expected {}',
+                              n, target, prefix, arg_type_str, expected_type_str)
         self.fail(msg, context)
 
     def invalid_index_type(self, index_type: Type, base_str: str,
                            context: Context) -> None:
-        self.fail('Invalid index type {} for {}'.format(
-            self.format(index_type), base_str), context)
+        self.fail(TypeMessage(self, 'Invalid index type {} for {}', index_type, base_str),
+                  context)
 
     def too_few_arguments(self, callee: CallableType, context: Context,
                           argument_names: List[str]) -> None:
@@ -585,11 +620,13 @@ class MessageBuilder:
 
     def no_variant_matches_arguments(self, overload: Overloaded, arg_types: List[Type],
                                      context: Context) -> None:
+        # The argument types are converted to strings only when the message is rendered.
         if overload.name():
-            self.fail('No overload variant of {} matches argument types {}'
-                      .format(overload.name(), arg_types), context)
+            self.fail(TypeMessage(self, 'No overload variant of {} matches argument types {}',
+                                  overload.name(), lambda: str(arg_types)), context)
         else:
-            self.fail('No overload variant matches argument types {}'.format(arg_types), context)
+            self.fail(TypeMessage(self, 'No overload variant matches argument types {}',
+                                  lambda: str(arg_types)), context)
 
     def function_variants_overlap(self, n1: int, n2: int,
                                   context: Context) -> None:
@@ -599,8 +636,8 @@ class MessageBuilder:
     def invalid_cast(self, target_type: Type, source_type: Type,
                      context: Context) -> None:
         if not self.check_void(source_type, context):
-            self.fail('Cannot cast from {} to {}'.format(
-                self.format(source_type), self.format(target_type)), context)
+            self.fail(TypeMessage(self, 'Cannot cast from {} to {}', source_type, target_type),
+                      context)
 
     def wrong_number_values_to_unpack(self, provided: int, expected: int,
                                       context: Context) -> None:
@@ -684,8 +721,8 @@ class MessageBuilder:
 
     def incompatible_array_item_type(self, typ: Type, index: int,
                                      context: Context) -> None:
-        self.fail('Array item {} has incompatible type {}'.format(
-            index, self.format(typ)), context)
+        self.fail(TypeMessage(self, 'Array item {} has incompatible type {}', index, typ),
+                  context)
 
     def could_not_infer_type_arguments(self, callee_type: CallableType, n: int,
                                        context: Context) -> None:
@@ -792,8 +829,8 @@ class MessageBuilder:
 
     def incompatible_typevar_value(self, callee: CallableType, index: int,
                                    type: Type, context: Context) -> None:
-        self.fail('Type argument {} of {} has incompatible value {}'.format(
-            index, callable_name(callee), self.format(type)), context)
+        self.fail(TypeMessage(self, 'Type argument {} of {} has incompatible value {}',
+                              index, callable_name(callee), type), context)
 
     def overloaded_signatures_overlap(self, index1: int, index2: int,
                                       context: Context) -> None:
@@ -841,10 +878,10 @@ class MessageBuilder:
         self.fail('Revealed type is \'{}\''.format(typ), context)
 
     def unsupported_type_type(self, item: Type, context: Context) -> None:
-        self.fail('Unsupported type Type[{}]'.format(self.format(item)), context)
+        self.fail(TypeMessage(self, 'Unsupported type Type[{}]', item), context)
 
     def redundant_cast(self, typ: Type, context: Context) -> None:
-        self.note('Redundant cast to {}'.format(self.format(typ)), context)
+        self.note(TypeMessage(self, 'Redundant cast to {}', typ), context)
 
 
 def capitalize(s: str) -> str:
@@ -16,6 +16,9 @@ from mypy.util import dump_tagged, short_type
 
 class Context:
     """Base type for objects that are valid as error message locations."""
+
+    __slots__ = ()
+
     @abstractmethod
     def get_line(self) -> int: pass
 
@@ -91,10 +94,13 @@ reverse_type_aliases = dict((name.replace('__builtins__', 'builtins'), alias)
 class Node(Context):
     """Common base class for all non-type parse tree nodes."""
 
-    line = -1
+    __slots__ = ('line', 'literal', 'literal_hash')
 
-    literal = LITERAL_NO
-    literal_hash = None  # type: Any
+    def __init__(self) -> None:
+        super().__init__()
+        self.line = -1
+        self.literal = LITERAL_NO
+        self.literal_hash = None  # type: Any
 
     def __str__(self) -> str:
         ans = self.accept(mypy.strconv.StrConv())
@@ -125,6 +131,8 @@ Expression = Node
 
 
 class SymbolNode(Node):
+    __slots__ = ()
+
     # Nodes that can be stored in a symbol table.
 
     # TODO do not use methods for these
@@ -154,25 +162,9 @@ class SymbolNode(Node):
 class MypyFile(SymbolNode, Statement):
     """The abstract syntax tree of a single source file."""
 
-    # Module name ('__main__' for initial file)
-    _name = None      # type: str
-    # Fully qualified module name
-    _fullname = None  # type: str
-    # Path to the file (None if not known)
-    path = ''
-    # Top-level definitions and statements
-    defs = None  # type: List[Statement]
-    # Is there a UTF-8 BOM at the start?
-    is_bom = False
-    names = None  # type: SymbolTable
-    # All import nodes within the file (also ones within functions etc.)
-    imports = None  # type: List[ImportBase]
-    # Lines to ignore when checking
-    ignored_lines = None  # type: Set[int]
-    # Is this file represented by a stub file (.pyi)?
-    is_stub = False
-    # Do weak typing globally in the file?
-    weak_opts = None  # type: Set[str]
+    __slots__ = (
+        '_name', '_fullname', 'path', 'defs', 'is_bom', 'names', 'imports', 'ignored_lines',
+        'is_stub', 'weak_opts')
 
     def __init__(self,
                  defs: List[Statement],
@@ -180,11 +172,27 @@ class MypyFile(SymbolNode, Statement):
                  is_bom: bool = False,
                  ignored_lines: Set[int] = None,
                  weak_opts: Set[str] = None) -> None:
-        self.defs = defs
+        super().__init__()
+        # Module name ('__main__' for initial file)
+        self._name = None  # type: str
+        # Fully qualified module name
+        self._fullname = None  # type: str
+        # Path to the file (None if not known)
+        self.path = ''
+        self.names = None  # type: SymbolTable
+        # Lines to ignore when checking
+        self.ignored_lines = None  # type: Set[int]
+        # Is this file represented by a stub file (.pyi)?
+        self.is_stub = False
+        # Top-level definitions and statements
+        self.defs = defs  # type: List[Statement]
         self.line = 1  # Dummy line number
-        self.imports = imports
+        # All import nodes within the file (also ones within functions etc.)
+        self.imports = imports  # type: List[ImportBase]
+        # Is there a UTF-8 BOM at the start?
         self.is_bom = is_bom
-        self.weak_opts = weak_opts
+        # Do weak typing globally in the file?
+        self.weak_opts = weak_opts  # type: Set[str]
         if ignored_lines:
             self.ignored_lines = ignored_lines
         else:
@@ -226,28 +234,30 @@ class MypyFile(SymbolNode, Statement):
 
 class ImportBase(Statement):
     """Base class for all import statements."""
-    is_unreachable = False
-    is_top_level = False  # Set by semanal.FirstPass
-    # If an import replaces existing definitions, we construct dummy assignment
-    # statements that assign the imported names to the names in the current scope,
-    # for type checking purposes. Example:
-    #
-    #     x = 1
-    #     from m import x   <-- add assignment representing "x = m.x"
-    assignments = None  # type: List[AssignmentStmt]
+
+    __slots__ = ('is_unreachable', 'is_top_level', 'assignments')
 
     def __init__(self) -> None:
-        self.assignments = []
+        super().__init__()
+        self.is_unreachable = False
+        self.is_top_level = False  # Set by semanal.FirstPass
+        # If an import replaces existing definitions, we construct dummy assignment
+        # statements that assign the imported names to the names in the current scope,
+        # for type checking purposes. Example:
+        #
+        #     x = 1
+        #     from m import x   <-- add assignment representing "x = m.x"
+        self.assignments = []  # type: List[AssignmentStmt]
 
 
 class Import(ImportBase):
     """import m [as n]"""
 
-    ids = None  # type: List[Tuple[str, Optional[str]]]     # (module id, as id)
+    __slots__ = ('ids',)
 
     def __init__(self, ids: List[Tuple[str, Optional[str]]]) -> None:
         super().__init__()
-        self.ids = ids
+        self.ids = ids  # type: List[Tuple[str, Optional[str]]]  # (module id, as id)
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_import(self)
@@ -256,12 +266,12 @@ class Import(ImportBase):
 class ImportFrom(ImportBase):
     """from m import x [as y], ..."""
 
-    names = None  # type: List[Tuple[str, Optional[str]]]  # Tuples (name, as name)
+    __slots__ = ('names', 'id', 'relative')
 
     def __init__(self, id: str, relative: int, names: List[Tuple[str, Optional[str]]]) -> None:
         super().__init__()
         self.id = id
-        self.names = names
+        self.names = names  # type: List[Tuple[str, Optional[str]]]  # Tuples (name, as name)
         self.relative = relative
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
@@ -271,6 +281,8 @@ class ImportFrom(ImportBase):
 class ImportAll(ImportBase):
     """from m import *"""
 
+    __slots__ = ('id', 'relative')
+
     def __init__(self, id: str, relative: int) -> None:
         super().__init__()
         self.id = id
@@ -283,13 +295,17 @@ class ImportAll(ImportBase):
 class FuncBase(SymbolNode):
     """Abstract base class for function-like nodes"""
 
-    # Type signature. This is usually CallableType or Overloaded, but it can be something else for
-    # decorated functions/
-    type = None  # type: mypy.types.Type
-    # If method, reference to TypeInfo
-    info = None  # type: TypeInfo
-    is_property = False
-    _fullname = None  # type: str       # Name with module prefix
+    __slots__ = ('type', 'info', 'is_property', '_fullname')
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Type signature. This is usually CallableType or Overloaded, but it can be
+        # something else for decorated functions/
+        self.type = None  # type: mypy.types.Type
+        # If method, reference to TypeInfo
+        self.info = None  # type: TypeInfo
+        self.is_property = False
+        self._fullname = None  # type: str  # Name with module prefix
 
     @abstractmethod
     def name(self) -> str: pass
@@ -308,10 +324,11 @@ class OverloadedFuncDef(FuncBase, Statement):
     Overloaded variants must be consecutive in the source file.
     """
 
-    items = None  # type: List[Decorator]
+    __slots__ = ('items',)
 
     def __init__(self, items: List['Decorator']) -> None:
-        self.items = items
+        super().__init__()
+        self.items = items  # type: List[Decorator]
         self.set_line(items[0].line)
 
     def name(self) -> str:
@@ -343,25 +360,25 @@ class OverloadedFuncDef(FuncBase, Statement):
 class Argument(Node):
     """A single argument in a FuncItem."""
 
-    variable = None  # type: Var
-    type_annotation = None  # type: Optional[mypy.types.Type]
-    initializater = None  # type: Optional[Expression]
-    kind = None  # type: int
-    initialization_statement = None  # type: Optional[AssignmentStmt]
+    __slots__ = (
+        'variable', 'type_annotation', 'initializater', 'kind', 'initialization_statement',
+        'initializer')
 
     def __init__(self, variable: 'Var', type_annotation: 'Optional[mypy.types.Type]',
             initializer: Optional[Expression], kind: int,
             initialization_statement: Optional['AssignmentStmt'] = None) -> None:
-        self.variable = variable
+        super().__init__()
+        self.initializater = None  # type: Optional[Expression]
+        self.variable = variable  # type: Var
 
-        self.type_annotation = type_annotation
+        self.type_annotation = type_annotation  # type: Optional[mypy.types.Type]
         self.initializer = initializer
 
-        self.initialization_statement = initialization_statement
+        self.initialization_statement = initialization_statement  # type: Optional[AssignmentStmt]
         if not self.initialization_statement:
             self.initialization_statement = self._initialization_statement()
 
-        self.kind = kind
+        self.kind = kind  # type: int
 
     def _initialization_statement(self) -> Optional['AssignmentStmt']:
         """Convert the initializer into an assignment statement.
@@ -407,29 +424,26 @@ class Argument(Node):
 
 
 class FuncItem(FuncBase):
-    arguments = []  # type: List[Argument]
-    # Minimum number of arguments
-    min_args = 0
-    # Maximum number of positional arguments, -1 if no explicit limit (*args not included)
-    max_pos = 0
-    body = None  # type: Block
-    # Is this an overload variant of function with more than one overload variant?
-    is_overload = False
-    is_generator = False   # Contains a yield statement?
-    is_static = False      # Uses @staticmethod?
-    is_class = False       # Uses @classmethod?
-    # Variants of function with type variables with values expanded
-    expanded = None  # type: List[FuncItem]
+    __slots__ = (
+        'arguments', 'min_args', 'max_pos', 'body', 'is_overload', 'is_generator', 'is_static',
+        'is_class')
 
     def __init__(self, arguments: List[Argument], body: 'Block',
                  typ: 'mypy.types.FunctionLike' = None) -> None:
-        self.arguments = arguments
+        super().__init__()
+        # Is this an overload variant of function with more than one overload variant?
+        self.is_overload = False
+        self.is_generator = False  # Contains a yield statement?
+        self.is_static = False  # Uses @staticmethod?
+        self.is_class = False  # Uses @classmethod?
+        self.arguments = arguments  # type: List[Argument]
         arg_kinds = [arg.kind for arg in self.arguments]
+        # Maximum number of positional arguments, -1 if no explicit limit (*args not included)
         self.max_pos = arg_kinds.count(ARG_POS) + arg_kinds.count(ARG_OPT)
-        self.body = body
+        self.body = body  # type: Block
         self.type = typ
-        self.expanded = []
 
+        # Minimum number of arguments
         self.min_args = 0
         for i in range(len(self.arguments)):
             if self.arguments[i] is None and i < self.max_fixed_argc():
@@ -454,11 +468,7 @@ class FuncDef(FuncItem, Statement):
     This is a non-lambda function defined using 'def'.
     """
 
-    is_decorated = False
-    is_conditional = False             # Defined conditionally (within block)?
-    is_abstract = False
-    is_property = False
-    original_def = None  # type: Union[None, FuncDef, Var]  # Original conditional definition
+    __slots__ = ('is_decorated', 'is_conditional', 'is_abstract', 'original_def', '_name')
 
     def __init__(self,
                  name: str,              # Function name
@@ -466,6 +476,12 @@ class FuncDef(FuncItem, Statement):
                  body: 'Block',
                  typ: 'mypy.types.FunctionLike' = None) -> None:
         super().__init__(arguments, body, typ)
+        self.is_decorated = False
+        self.is_conditional = False  # Defined conditionally (within block)?
+        self.is_abstract = False
+        self.is_property = False
+        # Original conditional definition
+        self.original_def = None  # type: Union[None, FuncDef, Var]
         self._name = name
 
     def name(self) -> str:
@@ -491,7 +507,7 @@ class FuncDef(FuncItem, Statement):
                 'is_decorated': self.is_decorated,
                 'is_conditional': self.is_conditional,
                 'is_abstract': self.is_abstract,
-                # TODO: Do we need expanded, original_def?
+                # TODO: Do we need original_def?
                 }
 
     @classmethod
@@ -522,16 +538,15 @@ class Decorator(SymbolNode, Statement):
     A single Decorator object can include any number of function decorators.
     """
 
-    func = None  # type: FuncDef                # Decorated function
-    decorators = None  # type: List[Expression] # Decorators, at least one  # XXX Not true
-    var = None  # type: Var                     # Represents the decorated function obj
-    is_overload = False
+    __slots__ = ('func', 'decorators', 'var', 'is_overload')
 
     def __init__(self, func: FuncDef, decorators: List[Expression],
                  var: 'Var') -> None:
-        self.func = func
-        self.decorators = decorators
-        self.var = var
+        super().__init__()
+        self.func = func  # type: FuncDef  # Decorated function
+        # Decorators, at least one  # XXX Not true
+        self.decorators = decorators  # type: List[Expression]
+        self.var = var  # type: Var  # Represents the decorated function obj
         self.is_overload = False
 
     def name(self) -> str:
@@ -566,25 +581,24 @@ class Var(SymbolNode, Statement):
     It can refer to global/local variable or a data attribute.
     """
 
-    _name = None      # type: str   # Name without module prefix
-    _fullname = None  # type: str   # Name with module prefix
-    info = None  # type: TypeInfo   # Defining class (for member variables)
-    type = None  # type: mypy.types.Type # Declared or inferred type, or None
-    # Is this the first argument to an ordinary method (usually "self")?
-    is_self = False
-    is_ready = False  # If inferred, is the inferred type available?
-    # Is this initialized explicitly to a non-None value in class body?
-    is_initialized_in_class = False
-    is_staticmethod = False
-    is_classmethod = False
-    is_property = False
-    is_settable_property = False
+    __slots__ = (
+        '_name', '_fullname', 'info', 'type', 'is_self', 'is_ready', 'is_initialized_in_class',
+        'is_staticmethod', 'is_classmethod', 'is_property', 'is_settable_property')
 
     def __init__(self, name: str, type: 'mypy.types.Type' = None) -> None:
-        self._name = name
-        self.type = type
+        super().__init__()
+        self._fullname = None  # type: str  # Name with module prefix
+        self.info = None  # type: TypeInfo  # Defining class (for member variables)
+        self.is_staticmethod = False
+        self.is_classmethod = False
+        self.is_property = False
+        self.is_settable_property = False
+        self._name = name  # type: str  # Name without module prefix
+        self.type = type  # type: mypy.types.Type  # Declared or inferred type, or None
+        # Is this the first argument to an ordinary method (usually "self")?
         self.is_self = False
         self.is_ready = True
+        # Is this initialized explicitly to a non-None value in class body?
         self.is_initialized_in_class = False
 
     def name(self) -> str:
@@ -631,17 +645,9 @@ class Var(SymbolNode, Statement):
 class ClassDef(Statement):
     """Class definition"""
 
-    name = None  # type: str       # Name of the class without module prefix
-    fullname = None  # type: str   # Fully qualified name of the class
-    defs = None  # type: Block
-    type_vars = None  # type: List[mypy.types.TypeVarDef]
-    # Base class expressions (not semantically analyzed -- can be arbitrary expressions)
-    base_type_exprs = None  # type: List[Expression]
-    info = None  # type: TypeInfo  # Related TypeInfo
-    metaclass = ''
-    decorators = None  # type: List[Expression]
-    # Built-in/extension class? (single implementation inheritance only)
-    is_builtinclass = False
+    __slots__ = (
+        'name', 'fullname', 'defs', 'type_vars', 'base_type_exprs', 'info', 'metaclass',
+        'decorators', 'is_builtinclass')
 
     def __init__(self,
                  name: str,
@@ -649,12 +655,18 @@ class ClassDef(Statement):
                  type_vars: List['mypy.types.TypeVarDef'] = None,
                  base_type_exprs: List[Expression] = None,
                  metaclass: str = None) -> None:
-        self.name = name
-        self.defs = defs
-        self.type_vars = type_vars or []
-        self.base_type_exprs = base_type_exprs or []
+        super().__init__()
+        self.fullname = None  # type: str  # Fully qualified name of the class
+        self.info = None  # type: TypeInfo  # Related TypeInfo
+        # Built-in/extension class? (single implementation inheritance only)
+        self.is_builtinclass = False
+        self.name = name  # type: str  # Name of the class without module prefix
+        self.defs = defs  # type: Block
+        self.type_vars = type_vars or []  # type: List[mypy.types.TypeVarDef]
+        # Base class expressions (not semantically analyzed -- can be arbitrary expressions)
+        self.base_type_exprs = base_type_exprs or []  # type: List[Expression]
         self.metaclass = metaclass
-        self.decorators = []
+        self.decorators = []  # type: List[Expression]
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_class_def(self)
@@ -688,10 +700,11 @@ class ClassDef(Statement):
 class GlobalDecl(Statement):
     """Declaration global x, y, ..."""
 
-    names = None  # type: List[str]
+    __slots__ = ('names',)
 
     def __init__(self, names: List[str]) -> None:
-        self.names = names
+        super().__init__()
+        self.names = names  # type: List[str]
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_global_decl(self)
@@ -700,24 +713,26 @@ class GlobalDecl(Statement):
 class NonlocalDecl(Statement):
     """Declaration nonlocal x, y, ..."""
 
-    names = None  # type: List[str]
+    __slots__ = ('names',)
 
     def __init__(self, names: List[str]) -> None:
-        self.names = names
+        super().__init__()
+        self.names = names  # type: List[str]
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_nonlocal_decl(self)
 
 
 class Block(Statement):
-    body = None  # type: List[Statement]
-    # True if we can determine that this block is not executed. For example,
-    # this applies to blocks that are protected by something like "if PY3:"
-    # when using Python 2.
-    is_unreachable = False
+    __slots__ = ('body', 'is_unreachable')
 
     def __init__(self, body: List[Statement]) -> None:
-        self.body = body
+        super().__init__()
+        # True if we can determine that this block is not executed. For example,
+        # this applies to blocks that are protected by something like "if PY3:"
+        # when using Python 2.
+        self.is_unreachable = False
+        self.body = body  # type: List[Statement]
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_block(self)
@@ -728,10 +743,12 @@ class Block(Statement):
 
 class ExpressionStmt(Statement):
     """An expression as a statement, such as print(s)."""
-    expr = None  # type: Expression
+
+    __slots__ = ('expr',)
 
     def __init__(self, expr: Expression) -> None:
-        self.expr = expr
+        super().__init__()
+        self.expr = expr  # type: Expression
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_expression_stmt(self)
@@ -746,16 +763,15 @@ class AssignmentStmt(Statement):
     An lvalue can be NameExpr, TupleExpr, ListExpr, MemberExpr, IndexExpr.
     """
 
-    lvalues = None  # type: List[Expression]
-    rvalue = None  # type: Expression
-    # Declared type in a comment, may be None.
-    type = None  # type: mypy.types.Type
+    __slots__ = ('lvalues', 'rvalue', 'type')
 
     def __init__(self, lvalues: List[Expression], rvalue: Expression,
                  type: 'mypy.types.Type' = None) -> None:
-        self.lvalues = lvalues
-        self.rvalue = rvalue
-        self.type = type
+        super().__init__()
+        self.lvalues = lvalues  # type: List[Expression]
+        self.rvalue = rvalue  # type: Expression
+        # Declared type in a comment, may be None.
+        self.type = type  # type: mypy.types.Type
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_assignment_stmt(self)
@@ -764,156 +780,155 @@ class AssignmentStmt(Statement):
 class OperatorAssignmentStmt(Statement):
     """Operator assignment statement such as x += 1"""
 
-    op = ''
-    lvalue = None  # type: Expression
-    rvalue = None  # type: Expression
+    __slots__ = ('op', 'lvalue', 'rvalue')
 
     def __init__(self, op: str, lvalue: Expression, rvalue: Expression) -> None:
+        super().__init__()
         self.op = op
-        self.lvalue = lvalue
-        self.rvalue = rvalue
+        self.lvalue = lvalue  # type: Expression
+        self.rvalue = rvalue  # type: Expression
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_operator_assignment_stmt(self)
 
 
 class WhileStmt(Statement):
-    expr = None  # type: Expression
-    body = None  # type: Block
-    else_body = None  # type: Block
+    __slots__ = ('expr', 'body', 'else_body')
 
     def __init__(self, expr: Expression, body: Block, else_body: Block) -> None:
-        self.expr = expr
-        self.body = body
-        self.else_body = else_body
+        super().__init__()
+        self.expr = expr  # type: Expression
+        self.body = body  # type: Block
+        self.else_body = else_body  # type: Block
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_while_stmt(self)
 
 
 class ForStmt(Statement):
-    # Index variables
-    index = None  # type: Expression
-    # Expression to iterate
-    expr = None  # type: Expression
-    body = None  # type: Block
-    else_body = None  # type: Block
+    __slots__ = ('index', 'expr', 'body', 'else_body')
 
     def __init__(self, index: Expression, expr: Expression, body: Block,
                  else_body: Block) -> None:
-        self.index = index
-        self.expr = expr
-        self.body = body
-        self.else_body = else_body
+        super().__init__()
+        # Index variables
+        self.index = index  # type: Expression
+        # Expression to iterate
+        self.expr = expr  # type: Expression
+        self.body = body  # type: Block
+        self.else_body = else_body  # type: Block
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_for_stmt(self)
 
 
 class ReturnStmt(Statement):
-    expr = None  # type: Optional[Expression]
+    __slots__ = ('expr',)
 
     def __init__(self, expr: Optional[Expression]) -> None:
-        self.expr = expr
+        super().__init__()
+        self.expr = expr  # type: Optional[Expression]
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_return_stmt(self)
 
 
 class AssertStmt(Statement):
-    expr = None  # type: Expression
+    __slots__ = ('expr',)
 
     def __init__(self, expr: Expression) -> None:
-        self.expr = expr
+        super().__init__()
+        self.expr = expr  # type: Expression
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_assert_stmt(self)
 
 
 class DelStmt(Statement):
-    expr = None  # type: Expression
+    __slots__ = ('expr',)
 
     def __init__(self, expr: Expression) -> None:
-        self.expr = expr
+        super().__init__()
+        self.expr = expr  # type: Expression
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_del_stmt(self)
 
 
 class BreakStmt(Statement):
+    __slots__ = ()
+
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_break_stmt(self)
 
 
 class ContinueStmt(Statement):
+    __slots__ = ()
+
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_continue_stmt(self)
 
 
 class PassStmt(Statement):
+    __slots__ = ()
+
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_pass_stmt(self)
 
 
 class IfStmt(Statement):
-    expr = None  # type: List[Expression]
-    body = None  # type: List[Block]
-    else_body = None  # type: Block
+    __slots__ = ('expr', 'body', 'else_body')
 
     def __init__(self, expr: List[Expression], body: List[Block],
                  else_body: Block) -> None:
-        self.expr = expr
-        self.body = body
-        self.else_body = else_body
+        super().__init__()
+        self.expr = expr  # type: List[Expression]
+        self.body = body  # type: List[Block]
+        self.else_body = else_body  # type: Block
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_if_stmt(self)
 
 
 class RaiseStmt(Statement):
-    expr = None  # type: Expression
-    from_expr = None  # type: Expression
+    __slots__ = ('expr', 'from_expr')
 
     def __init__(self, expr: Expression, from_expr: Expression = None) -> None:
-        self.expr = expr
-        self.from_expr = from_expr
+        super().__init__()
+        self.expr = expr  # type: Expression
+        self.from_expr = from_expr  # type: Expression
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_raise_stmt(self)
 
 
 class TryStmt(Statement):
-    body = None  # type: Block                # Try body
-    types = None  # type: List[Expression]    # Except type expressions
-    vars = None  # type: List[NameExpr]     # Except variable names
-    handlers = None  # type: List[Block]      # Except bodies
-    else_body = None  # type: Block
-    finally_body = None  # type: Block
+    __slots__ = ('body', 'types', 'vars', 'handlers', 'else_body', 'finally_body')
 
     def __init__(self, body: Block, vars: List['NameExpr'], types: List[Expression],
                  handlers: List[Block], else_body: Block,
                  finally_body: Block) -> None:
-        self.body = body
-        self.vars = vars
-        self.types = types
-        self.handlers = handlers
-        self.else_body = else_body
-        self.finally_body = finally_body
+        super().__init__()
+        self.body = body  # type: Block  # Try body
+        self.vars = vars  # type: List[NameExpr]  # Except variable names
+        self.types = types  # type: List[Expression]  # Except type expressions
+        self.handlers = handlers  # type: List[Block]  # Except bodies
+        self.else_body = else_body  # type: Block
+        self.finally_body = finally_body  # type: Block
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_try_stmt(self)
 
 
 class WithStmt(Statement):
-    expr = None  # type: List[Expression]
-    target = None  # type: List[Expression]
-    body = None  # type: Block
+    __slots__ = ('expr', 'target', 'body')
 
     def __init__(self, expr: List[Expression], target: List[Expression],
                  body: Block) -> None:
-        self.expr = expr
-        self.target = target
-        self.body = body
+        super().__init__()
+        self.expr = expr  # type: List[Expression]
+        self.target = target  # type: List[Expression]
+        self.body = body  # type: Block
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_with_stmt(self)
@@ -922,15 +937,14 @@ class WithStmt(Statement):
 class PrintStmt(Statement):
     """Python 2 print statement"""
 
-    args = None  # type: List[Expression]
-    newline = False
-    # The file-like target object (given using >>).
-    target = None  # type: Optional[Expression]
+    __slots__ = ('args', 'newline', 'target')
 
     def __init__(self, args: List[Expression], newline: bool, target: Expression = None) -> None:
-        self.args = args
+        super().__init__()
+        self.args = args  # type: List[Expression]
         self.newline = newline
-        self.target = target
+        # The file-like target object (given using >>).
+        self.target = target  # type: Optional[Expression]
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_print_stmt(self)
@@ -939,16 +953,15 @@ class PrintStmt(Statement):
 class ExecStmt(Statement):
     """Python 2 exec statement"""
 
-    expr = None  # type: Expression
-    variables1 = None  # type: Optional[Expression]
-    variables2 = None  # type: Optional[Expression]
+    __slots__ = ('expr', 'variables1', 'variables2')
 
     def __init__(self, expr: Expression,
                  variables1: Optional[Expression],
                  variables2: Optional[Expression]) -> None:
-        self.expr = expr
-        self.variables1 = variables1
-        self.variables2 = variables2
+        super().__init__()
+        self.expr = expr  # type: Expression
+        self.variables1 = variables1  # type: Optional[Expression]
+        self.variables2 = variables2  # type: Optional[Expression]
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_exec_stmt(self)
@@ -960,10 +973,11 @@ class ExecStmt(Statement):
 class IntExpr(Expression):
     """Integer literal"""
 
-    value = 0
-    literal = LITERAL_YES
+    __slots__ = ('value',)
 
     def __init__(self, value: int) -> None:
+        super().__init__()
+        self.literal = LITERAL_YES
         self.value = value
         self.literal_hash = value
 
@@ -985,10 +999,11 @@ class IntExpr(Expression):
 class StrExpr(Expression):
     """String literal"""
 
-    value = ''
-    literal = LITERAL_YES
+    __slots__ = ('value',)
 
     def __init__(self, value: str) -> None:
+        super().__init__()
+        self.literal = LITERAL_YES
         self.value = value
         self.literal_hash = value
 
@@ -999,10 +1014,11 @@ class StrExpr(Expression):
 class BytesExpr(Expression):
     """Bytes literal"""
 
-    value = ''  # TODO use bytes
-    literal = LITERAL_YES
+    __slots__ = ('value',)
 
     def __init__(self, value: str) -> None:
+        super().__init__()
+        self.literal = LITERAL_YES
         self.value = value
         self.literal_hash = value
 
@@ -1013,10 +1029,11 @@ class BytesExpr(Expression):
 class UnicodeExpr(Expression):
     """Unicode literal (Python 2.x)"""
 
-    value = ''  # TODO use bytes
-    literal = LITERAL_YES
+    __slots__ = ('value',)
 
     def __init__(self, value: str) -> None:
+        super().__init__()
+        self.literal = LITERAL_YES
         self.value = value
         self.literal_hash = value
 
@@ -1027,10 +1044,11 @@ class UnicodeExpr(Expression):
 class FloatExpr(Expression):
     """Float literal"""
 
-    value = 0.0
-    literal = LITERAL_YES
+    __slots__ = ('value',)
 
     def __init__(self, value: float) -> None:
+        super().__init__()
+        self.literal = LITERAL_YES
         self.value = value
         self.literal_hash = value
 
@@ -1041,10 +1059,11 @@ class FloatExpr(Expression):
 class ComplexExpr(Expression):
     """Complex literal"""
 
-    value = 0.0j
-    literal = LITERAL_YES
+    __slots__ = ('value',)
 
     def __init__(self, value: complex) -> None:
+        super().__init__()
+        self.literal = LITERAL_YES
         self.value = value
         self.literal_hash = value
 
@@ -1055,6 +1074,8 @@ class ComplexExpr(Expression):
 class EllipsisExpr(Expression):
     """Ellipsis (...)"""
 
+    __slots__ = ()
+
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_ellipsis(self)
 
@@ -1062,10 +1083,11 @@ class EllipsisExpr(Expression):
 class StarExpr(Expression):
     """Star expression"""
 
-    expr = None  # type: Expression
+    __slots__ = ('expr', 'valid')
 
     def __init__(self, expr: Expression) -> None:
-        self.expr = expr
+        super().__init__()
+        self.expr = expr  # type: Expression
         self.literal = self.expr.literal
         self.literal_hash = ('Star', expr.literal_hash,)
 
@@ -1079,15 +1101,18 @@ class StarExpr(Expression):
 class RefExpr(Expression):
     """Abstract base class for name-like constructs"""
 
-    kind = None  # type: int      # LDEF/GDEF/MDEF/... (None if not available)
-    node = None  # type: SymbolNode  # Var, FuncDef or TypeInfo that describes this
-    fullname = None  # type: str  # Fully qualified name (or name if not global)
+    __slots__ = ('kind', 'node', 'fullname', 'is_def')
 
-    # Does this define a new name with inferred type?
-    #
-    # For members, after semantic analysis, this does not take base
-    # classes into consideration at all; the type checker deals with these.
-    is_def = False
+    def __init__(self) -> None:
+        super().__init__()
+        self.kind = None  # type: int  # LDEF/GDEF/MDEF/... (None if not available)
+        self.node = None  # type: SymbolNode  # Var, FuncDef or TypeInfo that describes this
+        self.fullname = None  # type: str  # Fully qualified name (or name if not global)
+        # Does this define a new name with inferred type?
+        #
+        # For members, after semantic analysis, this does not take base
+        # classes into consideration at all; the type checker deals with these.
+        self.is_def = False
 
 
 class NameExpr(RefExpr):
@@ -1096,14 +1121,14 @@ class NameExpr(RefExpr):
     This refers to a local name, global name or a module.
     """
 
-    name = None  # type: str      # Name referred to (may be qualified)
-    # TypeInfo of class surrounding expression (may be None)
-    info = None  # type: TypeInfo
-
-    literal = LITERAL_TYPE
+    __slots__ = ('name', 'info')
 
     def __init__(self, name: str) -> None:
-        self.name = name
+        super().__init__()
+        # TypeInfo of class surrounding expression (may be None)
+        self.info = None  # type: TypeInfo
+        self.literal = LITERAL_TYPE
+        self.name = name  # type: str  # Name referred to (may be qualified)
         self.literal_hash = ('Var', name,)
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
@@ -1136,14 +1161,14 @@ class NameExpr(RefExpr):
 class MemberExpr(RefExpr):
     """Member access expression x.y"""
 
-    expr = None  # type: Expression
-    name = None  # type: str
-    # The variable node related to a definition.
-    def_var = None  # type: Var
+    __slots__ = ('expr', 'name', 'def_var')
 
     def __init__(self, expr: Expression, name: str) -> None:
-        self.expr = expr
-        self.name = name
+        super().__init__()
+        # The variable node related to a definition.
+        self.def_var = None  # type: Var
+        self.expr = expr  # type: Expression
+        self.name = name  # type: str
         self.literal = self.expr.literal
         self.literal_hash = ('Member', expr.literal_hash, name)
 
@@ -1172,44 +1197,43 @@ class CallExpr(Expression):
     such as cast(...) and None  # type: ....
     """
 
-    callee = None  # type: Expression
-    args = None  # type: List[Expression]
-    arg_kinds = None  # type: List[int]  # ARG_ constants
-    # Each name can be None if not a keyword argument.
-    arg_names = None  # type: List[str]
-    # If not None, the node that represents the meaning of the CallExpr. For
-    # cast(...) this is a CastExpr.
-    analyzed = None  # type: Optional[Expression]
+    __slots__ = ('callee', 'args', 'arg_kinds', 'arg_names', 'analyzed')
 
     def __init__(self, callee: Expression, args: List[Expression], arg_kinds: List[int],
                  arg_names: List[str] = None, analyzed: Expression = None) -> None:
+        super().__init__()
         if not arg_names:
             arg_names = [None] * len(args)
-        self.callee = callee
-        self.args = args
-        self.arg_kinds = arg_kinds
-        self.arg_names = arg_names
-        self.analyzed = analyzed
+        self.callee = callee  # type: Expression
+        self.args = args  # type: List[Expression]
+        self.arg_kinds = arg_kinds  # type: List[int]  # ARG_ constants
+        # Each name can be None if not a keyword argument.
+        self.arg_names = arg_names  # type: List[str]
+        # If not None, the node that represents the meaning of the CallExpr. For
+        # cast(...) this is a CastExpr.
+        self.analyzed = analyzed  # type: Optional[Expression]
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_call_expr(self)
 
 
 class YieldFromExpr(Expression):
-    expr = None  # type: Expression
+    __slots__ = ('expr',)
 
     def __init__(self, expr: Expression) -> None:
-        self.expr = expr
+        super().__init__()
+        self.expr = expr  # type: Expression
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_yield_from_expr(self)
 
 
 class YieldExpr(Expression):
-    expr = None  # type: Optional[Expression]
+    __slots__ = ('expr',)
 
     def __init__(self, expr: Optional[Expression]) -> None:
-        self.expr = expr
+        super().__init__()
+        self.expr = expr  # type: Optional[Expression]
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_yield_expr(self)
@@ -1221,18 +1245,17 @@ class IndexExpr(Expression):
     Also wraps type application such as List[int] as a special form.
     """
 
-    base = None  # type: Expression
-    index = None  # type: Expression
-    # Inferred __getitem__ method type
-    method_type = None  # type: mypy.types.Type
-    # If not None, this is actually semantically a type application
-    # Class[type, ...] or a type alias initializer.
-    analyzed = None  # type: Union[TypeApplication, TypeAliasExpr]
+    __slots__ = ('base', 'index', 'method_type', 'analyzed')
 
     def __init__(self, base: Expression, index: Expression) -> None:
-        self.base = base
-        self.index = index
-        self.analyzed = None
+        super().__init__()
+        # Inferred __getitem__ method type
+        self.method_type = None  # type: mypy.types.Type
+        self.base = base  # type: Expression
+        self.index = index  # type: Expression
+        # If not None, this is actually semantically a type application
+        # Class[type, ...] or a type alias initializer.
+        self.analyzed = None  # type: Union[TypeApplication, TypeAliasExpr]
         if self.index.literal == LITERAL_YES:
             self.literal = self.base.literal
             self.literal_hash = ('Member', base.literal_hash,
@@ -1245,14 +1268,14 @@ class IndexExpr(Expression):
 class UnaryExpr(Expression):
     """Unary operation"""
 
-    op = ''
-    expr = None  # type: Expression
-    # Inferred operator method type
-    method_type = None  # type: mypy.types.Type
+    __slots__ = ('op', 'expr', 'method_type')
 
     def __init__(self, op: str, expr: Expression) -> None:
+        super().__init__()
+        # Inferred operator method type
+        self.method_type = None  # type: mypy.types.Type
         self.op = op
-        self.expr = expr
+        self.expr = expr  # type: Expression
         self.literal = self.expr.literal
         self.literal_hash = ('Unary', op, expr.literal_hash)
 
@@ -1318,16 +1341,15 @@ class OpExpr(Expression):
     """Binary operation (other than . or [] or comparison operators,
     which have specific nodes)."""
 
-    op = ''
-    left = None  # type: Expression
-    right = None  # type: Expression
-    # Inferred type for the operator method type (when relevant).
-    method_type = None  # type: mypy.types.Type
+    __slots__ = ('op', 'left', 'right', 'method_type')
 
     def __init__(self, op: str, left: Expression, right: Expression) -> None:
+        super().__init__()
+        # Inferred type for the operator method type (when relevant).
+        self.method_type = None  # type: mypy.types.Type
         self.op = op
-        self.left = left
-        self.right = right
+        self.left = left  # type: Expression
+        self.right = right  # type: Expression
         self.literal = min(self.left.literal, self.right.literal)
         self.literal_hash = ('Binary', op, left.literal_hash, right.literal_hash)
 
@@ -1338,15 +1360,14 @@ class OpExpr(Expression):
 class ComparisonExpr(Expression):
     """Comparison expression (e.g. a < b > c < d)."""
 
-    operators = None  # type: List[str]
-    operands = None  # type: List[Expression]
-    # Inferred type for the operator methods (when relevant; None for 'is').
-    method_types = None  # type: List[mypy.types.Type]
+    __slots__ = ('operators', 'operands', 'method_types')
 
     def __init__(self, operators: List[str], operands: List[Expression]) -> None:
-        self.operators = operators
-        self.operands = operands
-        self.method_types = []
+        super().__init__()
+        self.operators = operators  # type: List[str]
+        self.operands = operands  # type: List[Expression]
+        # Inferred type for the operator methods (when relevant; None for 'is').
+        self.method_types = []  # type: List[mypy.types.Type]
         self.literal = min(o.literal for o in self.operands)
         self.literal_hash = (('Comparison',) + tuple(operators) +
                              tuple(o.literal_hash for o in operands))
@@ -1361,16 +1382,15 @@ class SliceExpr(Expression):
     This is only valid as index in index expressions.
     """
 
-    begin_index = None  # type: Optional[Expression]
-    end_index = None  # type: Optional[Expression]
-    stride = None  # type: Optional[Expression]
+    __slots__ = ('begin_index', 'end_index', 'stride')
 
     def __init__(self, begin_index: Optional[Expression],
                  end_index: Optional[Expression],
                  stride: Optional[Expression]) -> None:
-        self.begin_index = begin_index
-        self.end_index = end_index
-        self.stride = stride
+        super().__init__()
+        self.begin_index = begin_index  # type: Optional[Expression]
+        self.end_index = end_index  # type: Optional[Expression]
+        self.stride = stride  # type: Optional[Expression]
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_slice_expr(self)
@@ -1379,12 +1399,12 @@ class SliceExpr(Expression):
 class CastExpr(Expression):
     """Cast expression cast(type, expr)."""
 
-    expr = None  # type: Expression
-    type = None  # type: mypy.types.Type
+    __slots__ = ('expr', 'type')
 
     def __init__(self, expr: Expression, typ: 'mypy.types.Type') -> None:
-        self.expr = expr
-        self.type = typ
+        super().__init__()
+        self.expr = expr  # type: Expression
+        self.type = typ  # type: mypy.types.Type
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_cast_expr(self)
@@ -1393,10 +1413,11 @@ class CastExpr(Expression):
 class RevealTypeExpr(Expression):
     """Reveal type expression reveal_type(expr)."""
 
-    expr = None  # type: Expression
+    __slots__ = ('expr',)
 
     def __init__(self, expr: Expression) -> None:
-        self.expr = expr
+        super().__init__()
+        self.expr = expr  # type: Expression
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_reveal_type_expr(self)
@@ -1405,10 +1426,11 @@ class RevealTypeExpr(Expression):
 class SuperExpr(Expression):
     """Expression super().name"""
 
-    name = ''
-    info = None  # type: TypeInfo  # Type that contains this super expression
+    __slots__ = ('name', 'info')
 
     def __init__(self, name: str) -> None:
+        super().__init__()
+        self.info = None  # type: TypeInfo  # Type that contains this super expression
         self.name = name
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
@@ -1418,6 +1440,8 @@ class SuperExpr(Expression):
 class FuncExpr(FuncItem, Expression):
     """Lambda expression"""
 
+    __slots__ = ()
+
     def name(self) -> str:
         return '<lambda>'
 
@@ -1433,10 +1457,11 @@ class FuncExpr(FuncItem, Expression):
 class ListExpr(Expression):
     """List literal expression [...]."""
 
-    items = None  # type: List[Expression]
+    __slots__ = ('items',)
 
     def __init__(self, items: List[Expression]) -> None:
-        self.items = items
+        super().__init__()
+        self.items = items  # type: List[Expression]
         if all(x.literal == LITERAL_YES for x in items):
             self.literal = LITERAL_YES
             self.literal_hash = ('List',) + tuple(x.literal_hash for x in items)
@@ -1448,10 +1473,11 @@ class ListExpr(Expression):
 class DictExpr(Expression):
     """Dictionary literal expression {key: value, ...}."""
 
-    items = None  # type: List[Tuple[Expression, Expression]]
+    __slots__ = ('items',)
 
     def __init__(self, items: List[Tuple[Expression, Expression]]) -> None:
-        self.items = items
+        super().__init__()
+        self.items = items  # type: List[Tuple[Expression, Expression]]
         if all(x[0].literal == LITERAL_YES and x[1].literal == LITERAL_YES
                for x in items):
             self.literal = LITERAL_YES
@@ -1465,10 +1491,11 @@ class DictExpr(Expression):
 class TupleExpr(Expression):
     """Tuple literal expression (..., ...)"""
 
-    items = None  # type: List[Expression]
+    __slots__ = ('items',)
 
     def __init__(self, items: List[Expression]) -> None:
-        self.items = items
+        super().__init__()
+        self.items = items  # type: List[Expression]
         if all(x.literal == LITERAL_YES for x in items):
             self.literal = LITERAL_YES
             self.literal_hash = ('Tuple',) + tuple(x.literal_hash for x in items)
@@ -1480,10 +1507,11 @@ class TupleExpr(Expression):
 class SetExpr(Expression):
     """Set literal expression {value, ...}."""
 
-    items = None  # type: List[Expression]
+    __slots__ = ('items',)
 
     def __init__(self, items: List[Expression]) -> None:
-        self.items = items
+        super().__init__()
+        self.items = items  # type: List[Expression]
         if all(x.literal == LITERAL_YES for x in items):
             self.literal = LITERAL_YES
             self.literal_hash = ('Set',) + tuple(x.literal_hash for x in items)
@@ -1495,17 +1523,16 @@ class SetExpr(Expression):
 class GeneratorExpr(Expression):
     """Generator expression ... for ... in ... [ for ...  in ... ] [ if ... ]."""
 
-    left_expr = None  # type: Expression
-    sequences_expr = None  # type: List[Expression]
-    condlists = None  # type: List[List[Expression]]
-    indices = None  # type: List[Expression]
+    __slots__ = ('left_expr', 'sequences_expr', 'condlists', 'indices', 'sequences')
 
     def __init__(self, left_expr: Expression, indices: List[Expression],
                  sequences: List[Expression], condlists: List[List[Expression]]) -> None:
-        self.left_expr = left_expr
+        super().__init__()
+        self.sequences_expr = None  # type: List[Expression]
+        self.left_expr = left_expr  # type: Expression
         self.sequences = sequences
-        self.condlists = condlists
-        self.indices = indices
+        self.condlists = condlists  # type: List[List[Expression]]
+        self.indices = indices  # type: List[Expression]
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_generator_expr(self)
@@ -1514,10 +1541,11 @@ class GeneratorExpr(Expression):
 class ListComprehension(Expression):
     """List comprehension (e.g. [x + 1 for x in a])"""
 
-    generator = None  # type: GeneratorExpr
+    __slots__ = ('generator',)
 
     def __init__(self, generator: GeneratorExpr) -> None:
-        self.generator = generator
+        super().__init__()
+        self.generator = generator  # type: GeneratorExpr
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_list_comprehension(self)
@@ -1526,10 +1554,11 @@ class ListComprehension(Expression):
 class SetComprehension(Expression):
     """Set comprehension (e.g. {x + 1 for x in a})"""
 
-    generator = None  # type: GeneratorExpr
+    __slots__ = ('generator',)
 
     def __init__(self, generator: GeneratorExpr) -> None:
-        self.generator = generator
+        super().__init__()
+        self.generator = generator  # type: GeneratorExpr
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_set_comprehension(self)
@@ -1538,19 +1567,17 @@ class SetComprehension(Expression):
 class DictionaryComprehension(Expression):
     """Dictionary comprehension (e.g. {k: v for k, v in a}"""
 
-    key = None  # type: Expression
-    value = None  # type: Expression
-    sequences_expr = None  # type: List[Expression]
-    condlists = None  # type: List[List[Expression]]
-    indices = None  # type: List[Expression]
+    __slots__ = ('key', 'value', 'sequences_expr', 'condlists', 'indices', 'sequences')
 
     def __init__(self, key: Expression, value: Expression, indices: List[Expression],
                  sequences: List[Expression], condlists: List[List[Expression]]) -> None:
-        self.key = key
-        self.value = value
+        super().__init__()
+        self.sequences_expr = None  # type: List[Expression]
+        self.key = key  # type: Expression
+        self.value = value  # type: Expression
         self.sequences = sequences
-        self.condlists = condlists
-        self.indices = indices
+        self.condlists = condlists  # type: List[List[Expression]]
+        self.indices = indices  # type: List[Expression]
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_dictionary_comprehension(self)
@@ -1559,14 +1586,13 @@ class DictionaryComprehension(Expression):
 class ConditionalExpr(Expression):
     """Conditional expression (e.g. x if y else z)"""
 
-    cond = None  # type: Expression
-    if_expr = None  # type: Expression
-    else_expr = None  # type: Expression
+    __slots__ = ('cond', 'if_expr', 'else_expr')
 
     def __init__(self, cond: Expression, if_expr: Expression, else_expr: Expression) -> None:
-        self.cond = cond
-        self.if_expr = if_expr
-        self.else_expr = else_expr
+        super().__init__()
+        self.cond = cond  # type: Expression
+        self.if_expr = if_expr  # type: Expression
+        self.else_expr = else_expr  # type: Expression
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_conditional_expr(self)
@@ -1575,10 +1601,11 @@ class ConditionalExpr(Expression):
 class BackquoteExpr(Expression):
     """Python 2 expression `...`."""
 
-    expr = None  # type: Expression
+    __slots__ = ('expr',)
 
     def __init__(self, expr: Expression) -> None:
-        self.expr = expr
+        super().__init__()
+        self.expr = expr  # type: Expression
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_backquote_expr(self)
@@ -1587,12 +1614,12 @@ class BackquoteExpr(Expression):
 class TypeApplication(Expression):
     """Type application expr[type, ...]"""
 
-    expr = None  # type: Expression
-    types = None  # type: List[mypy.types.Type]
+    __slots__ = ('expr', 'types')
 
     def __init__(self, expr: Expression, types: List['mypy.types.Type']) -> None:
-        self.expr = expr
-        self.types = types
+        super().__init__()
+        self.expr = expr  # type: Expression
+        self.types = types  # type: List[mypy.types.Type]
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_type_application(self)
@@ -1615,28 +1642,25 @@ CONTRAVARIANT = 2  # type: int
 class TypeVarExpr(SymbolNode, Expression):
     """Type variable expression TypeVar(...)."""
 
-    _name = ''
-    _fullname = ''
-    # Value restriction: only types in the list are valid as values. If the
-    # list is empty, there is no restriction.
-    values = None  # type: List[mypy.types.Type]
-    # Upper bound: only subtypes of upper_bound are valid as values. By default
-    # this is 'object', meaning no restriction.
-    upper_bound = None  # type: mypy.types.Type
-    # Variance of the type variable. Invariant is the default.
-    # TypeVar(..., covariant=True) defines a covariant type variable.
-    # TypeVar(..., contravariant=True) defines a contravariant type
-    # variable.
-    variance = INVARIANT
+    __slots__ = ('_name', '_fullname', 'values', 'upper_bound', 'variance')
 
     def __init__(self, name: str, fullname: str,
                  values: List['mypy.types.Type'],
                  upper_bound: 'mypy.types.Type',
                  variance: int=INVARIANT) -> None:
+        super().__init__()
         self._name = name
         self._fullname = fullname
-        self.values = values
-        self.upper_bound = upper_bound
+        # Value restriction: only types in the list are valid as values. If the
+        # list is empty, there is no restriction.
+        self.values = values  # type: List[mypy.types.Type]
+        # Upper bound: only subtypes of upper_bound are valid as values. By default
+        # this is 'object', meaning no restriction.
+        self.upper_bound = upper_bound  # type: mypy.types.Type
+        # Variance of the type variable. Invariant is the default.
+        # TypeVar(..., covariant=True) defines a covariant type variable.
+        # TypeVar(..., contravariant=True) defines a contravariant type
+        # variable.
         self.variance = variance
 
     def name(self) -> str:
@@ -1670,10 +1694,11 @@ class TypeVarExpr(SymbolNode, Expression):
 class TypeAliasExpr(Expression):
     """Type alias expression (rvalue)."""
 
-    type = None  # type: mypy.types.Type
+    __slots__ = ('type',)
 
     def __init__(self, type: 'mypy.types.Type') -> None:
-        self.type = type
+        super().__init__()
+        self.type = type  # type: mypy.types.Type
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_type_alias_expr(self)
@@ -1682,12 +1707,13 @@ class TypeAliasExpr(Expression):
 class NamedTupleExpr(Expression):
     """Named tuple expression namedtuple(...)."""
 
-    # The class representation of this named tuple (its tuple_type attribute contains
-    # the tuple item types)
-    info = None  # type: TypeInfo
+    __slots__ = ('info',)
 
     def __init__(self, info: 'TypeInfo') -> None:
-        self.info = info
+        super().__init__()
+        # The class representation of this named tuple (its tuple_type attribute contains
+        # the tuple item types)
+        self.info = info  # type: TypeInfo
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_namedtuple_expr(self)
@@ -1696,10 +1722,11 @@ class NamedTupleExpr(Expression):
 class PromoteExpr(Expression):
     """Ducktype class decorator expression _promote(...)."""
 
-    type = None  # type: mypy.types.Type
+    __slots__ = ('type',)
 
     def __init__(self, type: 'mypy.types.Type') -> None:
-        self.type = type
+        super().__init__()
+        self.type = type  # type: mypy.types.Type
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit__promote_expr(self)
@@ -1716,10 +1743,11 @@ class TempNode(Expression):
     some fixed type.
     """
 
-    type = None  # type: mypy.types.Type
+    __slots__ = ('type',)
 
     def __init__(self, typ: 'mypy.types.Type') -> None:
-        self.type = typ
+        super().__init__()
+        self.type = typ  # type: mypy.types.Type
 
     def accept(self, visitor: NodeVisitor[T]) -> T:
         return visitor.visit_temp_node(self)
@@ -1738,67 +1766,69 @@ class TypeInfo(SymbolNode):
     the appropriate number of arguments.
     """
 
-    _fullname = None  # type: str          # Fully qualified name
-    defn = None  # type: ClassDef          # Corresponding ClassDef
-    # Method Resolution Order: the order of looking up attributes. The first
-    # value always to refers to this class.
-    mro = None  # type: List[TypeInfo]
-    subtypes = None  # type: Set[TypeInfo] # Direct subclasses encountered so far
-    names = None  # type: SymbolTable      # Names defined directly in this type
-    is_abstract = False                    # Does the class have any abstract attributes?
-    abstract_attributes = None  # type: List[str]
-    # Classes inheriting from Enum shadow their true members with a __getattr__, so we
-    # have to treat them as a special case.
-    is_enum = False
-    # If true, any unknown attributes should have type 'Any' instead
-    # of generating a type error.  This would be true if there is a
-    # base class with type 'Any', but other use cases may be
-    # possible. This is similar to having __getattr__ that returns Any
-    # (and __setattr__), but without the __getattr__ method.
-    fallback_to_any = False
-
-    # Information related to type annotations.
-
-    # Generic type variable names
-    type_vars = None  # type: List[str]
-
-    # Direct base classes.
-    bases = None  # type: List[mypy.types.Instance]
-
-    # Another type which this type will be treated as a subtype of,
-    # even though it's not a subclass in Python.  The non-standard
-    # `@_promote` decorator introduces this, and there are also
-    # several builtin examples, in particular `int` -> `float`.
-    _promote = None  # type: mypy.types.Type
-
-    # Representation of a Tuple[...] base class, if the class has any
-    # (e.g., for named tuples). If this is not None, the actual Type
-    # object used for this class is not an Instance but a TupleType;
-    # the corresponding Instance is set as the fallback type of the
-    # tuple type.
-    tuple_type = None  # type: mypy.types.TupleType
-
-    # Is this a named tuple type?
-    is_named_tuple = False
-
-    # Is this a dummy from deserialization?
-    is_dummy = False
-
-    # Alternative to fullname() for 'anonymous' classes.
-    alt_fullname = None  # type: Optional[str]
+    __slots__ = (
+        '_fullname', 'defn', '_mro', 'subtypes', 'names', 'is_abstract', 'abstract_attributes',
+        'is_enum', 'fallback_to_any', 'type_vars', 'bases', '_promote', 'tuple_type',
+        'is_named_tuple', 'is_dummy', 'alt_fullname', '_member_index', '_member_index_mro',
+        '_member_index_generation', 'supertype_templates', 'supertype_templates_generation')
 
     def __init__(self, names: 'SymbolTable', defn: ClassDef) -> None:
         """Initialize a TypeInfo."""
-        self.names = names
-        self.defn = defn
-        self.subtypes = set()
-        self.type_vars = []
-        self.bases = []
-        # Leave self.mro uninitialized until we compute it for real,
-        # so we don't accidentally try to use it prematurely.
-        self._fullname = defn.fullname
+        super().__init__()
+        # Method Resolution Order: the order of looking up attributes. The first
+        # value always to refers to this class. Assign a new list instead of
+        # modifying it in place, so that the member index below and cached
+        # subtype checks (see mro_generation) are invalidated. Leave it
+        # uninitialized until we compute it for real, so we don't accidentally
+        # try to use it prematurely.
+        self._mro = None  # type: List[TypeInfo]
+        # Classes inheriting from Enum shadow their true members with a __getattr__, so we
+        # have to treat them as a special case.
+        self.is_enum = False
+        # If true, any unknown attributes should have type 'Any' instead
+        # of generating a type error.  This would be true if there is a
+        # base class with type 'Any', but other use cases may be
+        # possible. This is similar to having __getattr__ that returns Any
+        # (and __setattr__), but without the __getattr__ method.
+        self.fallback_to_any = False
+        # Another type which this type will be treated as a subtype of,
+        # even though it's not a subclass in Python.  The non-standard
+        # `@_promote` decorator introduces this, and there are also
+        # several builtin examples, in particular `int` -> `float`.
+        self._promote = None  # type: mypy.types.Type
+        # Representation of a Tuple[...] base class, if the class has any
+        # (e.g., for named tuples). If this is not None, the actual Type
+        # object used for this class is not an Instance but a TupleType;
+        # the corresponding Instance is set as the fallback type of the
+        # tuple type.
+        self.tuple_type = None  # type: mypy.types.TupleType
+        # Is this a named tuple type?
+        self.is_named_tuple = False
+        # Is this a dummy from deserialization?
+        self.is_dummy = False
+        # Alternative to fullname() for 'anonymous' classes.
+        self.alt_fullname = None  # type: Optional[str]
+        # Members found in the MRO by name (see lookup()), filled in lazily. This
+        # is valid only for the current MRO list and symbol table generation.
+        self._member_index = None  # type: Dict[str, Tuple[TypeInfo, SymbolTableNode]]
+        self._member_index_mro = None  # type: List[TypeInfo]
+        self._member_index_generation = -1
+        # Each base class (direct or indirect) mapped to the instance of it that this
+        # class derives from, in terms of the type variables of this class. For
+        # example, for 'class C(List[T])' Sequence maps to Sequence[T]. Filled in
+        # by mypy.maptype when needed; valid only for the mro_generation stored below.
+        self.supertype_templates = None  # type: Dict[TypeInfo, mypy.types.Instance]
+        self.supertype_templates_generation = -1
+        self.names = names  # type: SymbolTable  # Names defined directly in this type
+        self.defn = defn  # type: ClassDef  # Corresponding ClassDef
+        self.subtypes = set()  # type: Set[TypeInfo]  # Direct subclasses encountered so far
+        # Generic type variable names
+        self.type_vars = []  # type: List[str]
+        # Direct base classes.
+        self.bases = []  # type: List[mypy.types.Instance]
+        self._fullname = defn.fullname  # type: str  # Fully qualified name
         self.is_abstract = False
-        self.abstract_attributes = []
+        self.abstract_attributes = []  # type: List[str]
         if defn.type_vars:
             for vd in defn.type_vars:
                 self.type_vars.append(vd.name)
@@ -1814,12 +1844,42 @@ class TypeInfo(SymbolNode):
         """Is the type generic (i.e. does it have type variables)?"""
         return len(self.type_vars) > 0
 
-    def get(self, name: str) -> 'SymbolTableNode':
+    @property
+    def mro(self) -> List['TypeInfo']:
+        return self._mro
+
+    @mro.setter
+    def mro(self, mro: List['TypeInfo']) -> None:
+        global mro_generation
+        mro_generation += 1
+        self._mro = mro
+
+    def lookup(self, name: str) -> Tuple['TypeInfo', 'SymbolTableNode']:
+        """Find a member in the MRO.
+
+        Return the class that defines the member and its symbol table node,
+        or (None, None) if not found.
+        """
+        if (self._member_index_generation != symbol_table_generation
+                or self._member_index_mro is not self._mro):
+            self._member_index = {}
+            self._member_index_mro = self._mro
+            self._member_index_generation = symbol_table_generation
+        else:
+            result = self._member_index.get(name)
+            if result is not None:
+                return result
+        result = None, None
         for cls in self.mro:
             n = cls.names.get(name)
             if n:
-                return n
-        return None
+                result = cls, n
+                break
+        self._member_index[name] = result
+        return result
+
+    def get(self, name: str) -> 'SymbolTableNode':
+        return self.lookup(name)[1]
 
     def __getitem__(self, name: str) -> 'SymbolTableNode':
         n = self.get(name)
@@ -1847,13 +1907,9 @@ class TypeInfo(SymbolNode):
         return self.get_method(name) is not None
 
     def get_var(self, name: str) -> Var:
-        for cls in self.mro:
-            if name in cls.names:
-                node = cls.names[name].node
-                if isinstance(node, Var):
-                    return node
-                else:
-                    return None
+        n = self.get(name)
+        if n is not None and isinstance(n.node, Var):
+            return n.node
         return None
 
     def get_var_or_getter(self, name: str) -> SymbolNode:
@@ -1867,13 +1923,9 @@ class TypeInfo(SymbolNode):
     def get_method(self, name: str) -> FuncBase:
         if self.mro is None:  # Might be because of a previous error.
             return None
-        for cls in self.mro:
-            if name in cls.names:
-                node = cls.names[name].node
-                if isinstance(node, FuncBase):
-                    return node
-                else:
-                    return None
+        n = self.get(name)
+        if n is not None and isinstance(n.node, FuncBase):
+            return n.node
         return None
 
     def calculate_mro(self) -> None:
@@ -2110,7 +2162,26 @@ class SymbolTableNode:
         return stnode
 
 
+# Incremented whenever any symbol table is modified. This invalidates the
+# member indexes of all TypeInfos.
+symbol_table_generation = 0
+
+# Incremented whenever the MRO of any TypeInfo is assigned. This invalidates
+# cached subtype checks (see mypy.subtypes).
+mro_generation = 0
+
+
 class SymbolTable(Dict[str, SymbolTableNode]):
+    def __setitem__(self, key: str, value: SymbolTableNode) -> None:
+        global symbol_table_generation
+        symbol_table_generation += 1
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        global symbol_table_generation
+        symbol_table_generation += 1
+        super().__delitem__(key)
+
     def __str__(self) -> str:
         a = []  # type: List[str]
         for key, value in self.items():
@@ -54,6 +54,12 @@ class Options:
 
         # -- experimental options --
         self.fast_parser = False
+        # Find the dependencies of modules with a fast import scanner
+        # instead of parsing each module as it is discovered
+        self.scan_imports = False
+        # Don't type check the bodies of functions without annotations unless
+        # they contain something that could still be reported
+        self.skip_untyped_bodies = False
         self.incremental = False
         self.cache_dir = defaults.MYPY_CACHE
         self.suppress_error_context = False  # Suppress "note: In function "foo":" messages.
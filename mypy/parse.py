@@ -34,7 +34,8 @@ from mypy import nodes
 from mypy.errors import Errors, CompileError
 from mypy.types import Type, CallableType, AnyType, UnboundType
 from mypy.parsetype import (
-    parse_type, parse_types, parse_signature, TypeParseError, parse_str_as_signature
+    parse_type, parse_types, parse_signature, TypeParseError, parse_str_as_signature,
+    cached_type_parse
 )
 from mypy.options import Options
 
@@ -1930,26 +1931,32 @@ class Parser:
             if self.ignore_prefix_re.match(type_as_str):
                 # Actually a "# type: ignore" annotation -> not a type.
                 return None
-            tokens = lex.lex(type_as_str, token.line)[0]
-            if len(tokens) < 2:
-                # Empty annotation (only Eof token)
-                self.errors.report(token.line, 'Empty type annotation')
-                return None
-            try:
-                if not signature:
-                    type, index = parse_types(tokens, 0)
-                else:
-                    type, index = parse_signature(tokens)
-            except TypeParseError as e:
-                self.parse_error_at(e.token, skip=False, reason=e.message)
-                return None
-            if index < len(tokens) - 2:
-                self.parse_error_at(tokens[index], skip=False)
-                return None
-            return type
+            kind = 'signature' if signature else 'types'
+            return cached_type_parse(
+                kind, type_as_str, token.line,
+                lambda: self.parse_type_comment_text(type_as_str, token.line, signature))
         else:
             return None
 
+    def parse_type_comment_text(self, type_as_str: str, line: int, signature: bool) -> Type:
+        tokens = lex.lex(type_as_str, line)[0]
+        if len(tokens) < 2:
+            # Empty annotation (only Eof token)
+            self.errors.report(line, 'Empty type annotation')
+            return None
+        try:
+            if not signature:
+                type, index = parse_types(tokens, 0)
+            else:
+                type, index = parse_signature(tokens)
+        except TypeParseError as e:
+            self.parse_error_at(e.token, skip=False, reason=e.message)
+            return None
+        if index < len(tokens) - 2:
+            self.parse_error_at(tokens[index], skip=False)
+            return None
+        return type
+
 
 class ParseError(Exception): pass
 
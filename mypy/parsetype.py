@@ -1,12 +1,13 @@
 """Type parser"""
 
-from typing import List, Tuple, Union, cast, Optional
+from typing import List, Tuple, Union, cast, Optional, Callable
 
 from mypy.types import (
     Type, UnboundType, TupleType, TypeList, CallableType, StarType,
-    EllipsisType
+    EllipsisType, TypeTranslator
 )
 from mypy.lex import Token, Name, StrLit, lex
+from mypy.util import MemoTable
 from mypy import nodes
 
 
@@ -192,6 +193,11 @@ def parse_str_as_type(typestr: str, line: int) -> Type:
     """
 
     typestr = typestr.strip()
+    return cached_type_parse('str', typestr, line,
+                             lambda: _parse_str_as_type(typestr, line))
+
+
+def _parse_str_as_type(typestr: str, line: int) -> Type:
     tokens = lex(typestr, line)[0]
     result, i = parse_type(tokens, 0)
     if i < len(tokens) - 2:
@@ -261,3 +267,72 @@ def parse_signature(tokens: List[Token]) -> Tuple[CallableType, int]:
                         [None] * len(arg_types),
                         ret_type, None,
                         is_ellipsis_args=encountered_ellipsis), i
+
+
+# Unanalyzed types parsed from type comments and string literals, keyed by
+# (kind of annotation, annotation text). Generated code and stubs repeat the
+# same annotations over and over again. The type text is always lexed using
+# the default Python version, so the version is not part of the key.
+#
+# Parsed types are mutated later on (line numbers, Optional wrapping etc.),
+# so the cached type is never handed out directly; each lookup gets a copy.
+type_parse_cache = MemoTable(
+    'Type annotation', 10000)  # type: MemoTable[Tuple[str, str], Tuple[Type, int]]
+
+
+def cached_type_parse(kind: str, typestr: str, line: int, parse: Callable[[], Type]) -> Type:
+    """Parse an annotation using parse(), reusing the result for identical text.
+
+    The kind argument distinguishes annotations that are parsed differently
+    (for example, a signature vs. a type). Parse errors are not cached; parse()
+    is called again and gets to raise the error.
+    """
+    key = (kind, typestr)
+    cached = type_parse_cache.get(key)
+    if cached is not None:
+        typ, cached_line = cached
+        return typ.accept(UnanalyzedTypeCopier(line - cached_line))
+    typ = parse()
+    if typ is not None:
+        type_parse_cache.put(key, (typ.accept(UnanalyzedTypeCopier(0)), line))
+    return typ
+
+
+class UnanalyzedTypeCopier(TypeTranslator):
+    """Make a deep copy of a freshly parsed type, shifting line numbers.
+
+    Only handles the types produced by the type parsers (before semantic
+    analysis).
+    """
+
+    def __init__(self, line_delta: int) -> None:
+        self.line_delta = line_delta
+
+    def line(self, t: Type) -> int:
+        return t.line + self.line_delta if t.line >= 0 else t.line
+
+    def visit_unbound_type(self, t: UnboundType) -> Type:
+        return UnboundType(t.name, self.translate_types(t.args), self.line(t),
+                           t.optional, t.is_ret_type)
+
+    def visit_type_list(self, t: TypeList) -> Type:
+        return TypeList(self.translate_types(t.items), self.line(t))
+
+    def visit_callable_type(self, t: CallableType) -> Type:
+        return t.copy_modified(arg_types=self.translate_types(t.arg_types),
+                               arg_kinds=t.arg_kinds[:],
+                               arg_names=t.arg_names[:],
+                               ret_type=t.ret_type.accept(self),
+                               line=self.line(t))
+
+    def visit_tuple_type(self, t: TupleType) -> Type:
+        return TupleType(self.translate_types(t.items), None, self.line(t), t.implicit)
+
+    def visit_star_type(self, t: StarType) -> Type:
+        return StarType(t.type.accept(self), self.line(t))
+
+    def visit_ellipsis_type(self, t: EllipsisType) -> Type:
+        return EllipsisType(self.line(t))
+
+    def translate_types(self, types: List[Type]) -> List[Type]:
+        return [t.accept(self) if t is not None else None for t in types]
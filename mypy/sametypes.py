@@ -3,13 +3,21 @@ from typing import Sequence
 from mypy.types import (
     Type, UnboundType, ErrorType, AnyType, NoneTyp, Void, TupleType, UnionType, CallableType,
     TypeVarType, Instance, TypeVisitor, ErasedType, TypeList, Overloaded, LiteralType, PartialType,
-    DeletedType, UninhabitedType, TypeType
+    DeletedType, UninhabitedType, TypeType, same_type_key
 )
 
 
 def is_same_type(left: Type, right: Type) -> bool:
     """Is 'left' the same type as 'right'?"""
 
+    if left is right and left.interned:
+        return True
+    left_key = same_type_key(left)
+    if left_key is not None and right is not None:
+        right_key = same_type_key(right)
+        if right_key is not None:
+            # Both keys are cached, so this is cheap unless the hash values match.
+            return hash(left) == hash(right) and left_key == right_key
     if isinstance(right, UnboundType):
         # Make unbound types same as anything else to reduce the number of
         # generated spurious error messages.
@@ -120,7 +128,7 @@ class SameTypeVisitor(TypeVisitor[bool]):
 
     def visit_literal_type(self, t: LiteralType) -> bool:
         if isinstance(self.right, LiteralType):
-            return self.right.base == t.base
+            return self.right.base is t.base
         else:
             return False
 
@@ -162,6 +162,12 @@ class SemanticAnalyzer(NodeVisitor):
     nonlocal_decls = None  # type: List[Set[str]]
     # Local names of function scopes; None for non-function scopes.
     locals = None  # type: List[SymbolTable]
+    # Names visible from each scope in locals through the function scopes
+    # (innermost binding wins), so that a lookup needs a single probe.
+    # A class scope shares the mapping of its enclosing scope.
+    visible_locals = None  # type: List[Dict[str, SymbolTableNode]]
+    # Components of the dotted names looked up in the current module
+    name_parts = None  # type: Dict[str, List[str]]
     # Nested block depths of scopes
     block_depth = None  # type: List[int]
     # TypeInfo of directly enclosing class (or None)
@@ -204,6 +210,8 @@ class SemanticAnalyzer(NodeVisitor):
         using the Errors instance.
         """
         self.locals = [None]
+        self.visible_locals = [{}]
+        self.name_parts = {}
         self.imports = set()
         self.type = None
         self.type_stack = []
@@ -228,6 +236,7 @@ class SemanticAnalyzer(NodeVisitor):
         self.is_stub_file = fnam.lower().endswith('.pyi')
         self.globals = file_node.names
         self.weak_opts = file_node.weak_opts
+        self.name_parts = {}
 
         if 'builtins' in self.modules:
             self.globals['__builtins__'] = SymbolTableNode(
@@ -585,6 +594,7 @@ class SemanticAnalyzer(NodeVisitor):
         # Remember previous active class
         self.type_stack.append(self.type)
         self.locals.append(None)  # Add class scope
+        self.visible_locals.append(self.visible_locals[-1])
         self.block_depth.append(-1)  # The class body increments this to 0
         self.postpone_nested_functions_stack.append(FUNCTION_BOTH_PHASES)
         self.type = defn.info
@@ -594,6 +604,7 @@ class SemanticAnalyzer(NodeVisitor):
         self.postpone_nested_functions_stack.pop()
         self.block_depth.pop()
         self.locals.pop()
+        self.visible_locals.pop()
         self.type = self.type_stack.pop()
 
     def bind_class_type_vars(self, defn: ClassDef) -> None:
@@ -797,7 +808,7 @@ class SemanticAnalyzer(NodeVisitor):
         # If there are cyclic imports, we may be missing 'object' in
         # the MRO. Fix MRO if needed.
         if defn.info.mro and defn.info.mro[-1].fullname() != 'builtins.object':
-            defn.info.mro.append(self.object_type().type)
+            defn.info.mro = defn.info.mro + [self.object_type().type]
 
     def expr_to_analyzed_type(self, expr: Node) -> Type:
         if isinstance(expr, CallExpr):
@@ -2112,9 +2123,8 @@ class SemanticAnalyzer(NodeVisitor):
         if self.is_class_scope() and name in self.type.names:
             return self.type[name]
         # 3. Local (function) scopes
-        for table in reversed(self.locals):
-            if table is not None and name in table:
-                return table[name]
+        if name in self.visible_locals[-1]:
+            return self.visible_locals[-1][name]
         # 4. Current file global scope
         if name in self.globals:
             return self.globals[name]
@@ -2144,7 +2154,9 @@ class SemanticAnalyzer(NodeVisitor):
         if '.' not in name:
             return self.lookup(name, ctx)
         else:
-            parts = name.split('.')
+            parts = self.name_parts.get(name)
+            if parts is None:
+                parts = self.name_parts[name] = name.split('.')
             n = self.lookup(parts[0], ctx)  # type: SymbolTableNode
             if n:
                 for i in range(1, len(parts)):
@@ -2213,6 +2225,7 @@ class SemanticAnalyzer(NodeVisitor):
 
     def enter(self) -> None:
         self.locals.append(SymbolTable())
+        self.visible_locals.append(dict(self.visible_locals[-1]))
         self.global_decls.append(set())
         self.nonlocal_decls.append(set())
         # -1 since entering block will increment this to 0.
@@ -2220,6 +2233,7 @@ class SemanticAnalyzer(NodeVisitor):
 
     def leave(self) -> None:
         self.locals.pop()
+        self.visible_locals.pop()
         self.global_decls.pop()
         self.nonlocal_decls.pop()
         self.block_depth.pop()
@@ -2238,7 +2252,7 @@ class SemanticAnalyzer(NodeVisitor):
                 if not (node.kind == MODULE_REF and
                         self.locals[-1][name].node == node.node):
                     self.name_already_defined(name, context)
-            self.locals[-1][name] = node
+            self.set_local(name, node)
         elif self.type:
             self.type.names[name] = node
         else:
@@ -2267,7 +2281,11 @@ class SemanticAnalyzer(NodeVisitor):
         if name in self.locals[-1]:
             self.name_already_defined(name, ctx)
         node._fullname = name
-        self.locals[-1][name] = SymbolTableNode(LDEF, node)
+        self.set_local(name, SymbolTableNode(LDEF, node))
+
+    def set_local(self, name: str, node: SymbolTableNode) -> None:
+        self.locals[-1][name] = node
+        self.visible_locals[-1][name] = node
 
     def add_exports(self, *exps: Node) -> None:
         for exp in exps:
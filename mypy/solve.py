@@ -1,8 +1,10 @@
 """Type inference constraint solving"""
 
-from typing import List, Dict
+from typing import List, Dict, Set, Tuple
 
-from mypy.types import Type, Void, NoneTyp, AnyType, ErrorType, UninhabitedType, TypeVarId
+from mypy.types import (
+    Type, Void, NoneTyp, AnyType, ErrorType, UninhabitedType, TypeVarId
+)
 from mypy.constraints import Constraint, SUPERTYPE_OF
 from mypy.join import join_types
 from mypy.meet import meet_types
@@ -22,34 +24,42 @@ def solve_constraints(vars: List[TypeVarId], constraints: List[Constraint],
     pick NoneTyp as the value of the type variable.  If strict=False,
     pick AnyType.
     """
-    # Collect a list of constraints for each type variable.
-    cmap = {}  # type: Dict[TypeVarId, List[Constraint]]
-    for con in constraints:
-        a = cmap.get(con.type_var, [])  # type: List[Constraint]
-        a.append(con)
-        cmap[con.type_var] = a
+    # Calculate the lower and upper bounds of each type variable, processing the
+    # constraints in order. Note that we assume that the constraint targets do not
+    # have constraint references. Constraints that only repeat an earlier one
+    # (nested generic types and calls with many arguments produce lots of them)
+    # can't change the bounds, so skip them.
+    bottoms = {}  # type: Dict[TypeVarId, Type]
+    tops = {}  # type: Dict[TypeVarId, Type]
+    seen = set()  # type: Set[Tuple[TypeVarId, int, Type]]
+    wanted = set(vars)
+    for c in constraints:
+        if c.type_var not in wanted:
+            continue
+        # Types compare structurally, so they can be used in the key directly.
+        constraint_key = (c.type_var, c.op, c.target)
+        if constraint_key in seen:
+            continue
+        seen.add(constraint_key)
+        if c.op == SUPERTYPE_OF:
+            bottom = bottoms.get(c.type_var)
+            if bottom is None:
+                bottoms[c.type_var] = c.target
+            else:
+                bottoms[c.type_var] = join_types(bottom, c.target)
+        else:
+            top = tops.get(c.type_var)
+            if top is None:
+                tops[c.type_var] = c.target
+            else:
+                tops[c.type_var] = meet_types(top, c.target)
 
     res = []  # type: List[Type]
 
     # Solve each type variable separately.
     for tvar in vars:
-        bottom = None  # type: Type
-        top = None  # type: Type
-
-        # Process each constraint separately, and calculate the lower and upper
-        # bounds based on constraints. Note that we assume that the constraint
-        # targets do not have constraint references.
-        for c in cmap.get(tvar, []):
-            if c.op == SUPERTYPE_OF:
-                if bottom is None:
-                    bottom = c.target
-                else:
-                    bottom = join_types(bottom, c.target)
-            else:
-                if top is None:
-                    top = c.target
-                else:
-                    top = meet_types(top, c.target)
+        bottom = bottoms.get(tvar)
+        top = tops.get(tvar)
 
         if isinstance(top, AnyType) or isinstance(bottom, AnyType):
             res.append(AnyType())
@@ -4,7 +4,7 @@ import cgi
 import os.path
 import re
 
-from typing import Any, Dict, List, cast, Tuple
+from typing import Any, Dict, List, Set, cast, Tuple
 
 from mypy.traverser import TraverserVisitor
 from mypy.types import (
@@ -59,24 +59,24 @@ class StatisticsVisitor(TraverserVisitor):
 
     def visit_func_def(self, o: FuncDef) -> None:
         self.line = o.line
-        if len(o.expanded) > 1:
-            if o in o.expanded:
-                print('ERROR: cycle in function expansion; skipping')
-                return
-            for defn in o.expanded:
-                self.visit_func_def(cast(FuncDef, defn))
+        if o.type:
+            sig = cast(CallableType, o.type)
+            arg_types = sig.arg_types
+            if (sig.arg_names and sig.arg_names[0] == 'self' and
+                    not self.inferred):
+                arg_types = arg_types[1:]
+            for arg in arg_types:
+                self.type(arg)
+            self.type(sig.ret_type)
+        elif self.all_nodes:
+            self.record_line(self.line, TYPE_ANY)
+        if self.typemap is not None and o.is_dynamic() and o.body not in self.typemap:
+            # The type checker skipped the body (see --skip-untyped-bodies).
+            lines = StatementLines()
+            o.body.accept(lines)
+            for line in lines.lines:
+                self.record_line(line, TYPE_ANY)
         else:
-            if o.type:
-                sig = cast(CallableType, o.type)
-                arg_types = sig.arg_types
-                if (sig.arg_names and sig.arg_names[0] == 'self' and
-                        not self.inferred):
-                    arg_types = arg_types[1:]
-                for arg in arg_types:
-                    self.type(arg)
-                self.type(sig.ret_type)
-            elif self.all_nodes:
-                self.record_line(self.line, TYPE_ANY)
             super().visit_func_def(o)
 
     def visit_type_application(self, o: TypeApplication) -> None:
@@ -198,6 +198,18 @@ class StatisticsVisitor(TraverserVisitor):
                                   self.line_map.get(line, TYPE_PRECISE))
 
 
+class StatementLines(TraverserVisitor):
+    """Collect the lines of the statements within a node."""
+
+    def __init__(self) -> None:
+        self.lines = set()  # type: Set[int]
+
+    def visit_block(self, block: nodes.Block) -> None:
+        for s in block.body:
+            self.lines.add(s.line)
+        super().visit_block(block)
+
+
 def dump_type_stats(tree: Node, path: str, inferred: bool = False,
                     typemap: Dict[Node, Type] = None) -> None:
     if is_special_module(path):
@@ -1,23 +1,29 @@
-from typing import cast, List, Dict, Callable
+from typing import cast, Any, List, Dict, Callable, Optional, Tuple
 
 from mypy.types import (
     Type, AnyType, UnboundType, TypeVisitor, ErrorType, Void, NoneTyp,
     Instance, TypeVarType, CallableType, TupleType, UnionType, Overloaded, ErasedType, TypeList,
-    LiteralType, PartialType, DeletedType, UninhabitedType, TypeType, is_named_instance
+    LiteralType, PartialType, DeletedType, UninhabitedType, TypeType, is_named_instance, type_key
 )
 import mypy.applytype
 import mypy.constraints
+import mypy.nodes
 # Circular import; done in the function instead.
 # import mypy.solve
 from mypy import messages, sametypes
 from mypy.nodes import CONTRAVARIANT, COVARIANT
 from mypy.maptype import map_instance_to_supertype
+from mypy.util import MemoTable
 
 from mypy import experiments
 
 
 TypeParameterChecker = Callable[[Type, Type, int], bool]
 
+# Results of is_subtype (with the default type parameter checker) and
+# is_proper_subtype for types without type variables (see subtype_cache_key).
+subtype_cache = MemoTable('Subtype check', 100000)  # type: MemoTable[Tuple[Any, ...], bool]
+
 
 def check_type_parameter(lefta: Type, righta: Type, variance: int) -> bool:
     if variance == COVARIANT:
@@ -45,15 +51,44 @@ def is_subtype(left: Type, right: Type,
             or isinstance(right, ErasedType)):
         return True
     elif isinstance(right, UnionType) and not isinstance(left, UnionType):
-        return any(is_subtype(left, item, type_parameter_checker)
-                   for item in right.items)
+        # Only look at the items left could be a subtype of, and shortcut the
+        # check if left is one of the items. This makes comparing large unions
+        # linear instead of quadratic in common cases.
+        return right.has_item(left) or any(is_subtype(left, item, type_parameter_checker)
+                                           for item in right.possible_supertypes(left))
     elif isinstance(right, LiteralType):
         if isinstance(left, LiteralType):
             return left.base.accept(SubtypeVisitor(right.base, type_parameter_checker))
         else:
             return False
-    else:
-        return left.accept(SubtypeVisitor(right, type_parameter_checker))
+    elif type_parameter_checker is check_type_parameter:
+        key = subtype_cache_key(left, right, False)
+        if key is not None:
+            result = subtype_cache.get(key)
+            if result is None:
+                result = left.accept(SubtypeVisitor(right, type_parameter_checker))
+                subtype_cache.put(key, result)
+            return result
+    return left.accept(SubtypeVisitor(right, type_parameter_checker))
+
+
+def subtype_cache_key(left: Type, right: Type, proper: bool) -> Optional[Tuple[Any, ...]]:
+    """Return the key of a subtype check in subtype_cache, or None if it can't be cached.
+
+    Only checks where left is a compound type are worth caching. Results depend
+    on the class hierarchy, so the cache is emptied whenever the MRO of any
+    class changes.
+    """
+    if not isinstance(left, (Instance, TupleType, UnionType, CallableType, TypeType)):
+        return None
+    subtype_cache.validate(mypy.nodes.mro_generation)
+    left_key = type_key(left, type_vars=False)
+    if left_key is None:
+        return None
+    right_key = type_key(right, type_vars=False)
+    if right_key is None:
+        return None
+    return (left_key, right_key, proper, experiments.STRICT_OPTIONAL)
 
 
 def is_subtype_ignoring_tvars(left: Type, right: Type) -> bool:
@@ -372,25 +407,36 @@ def is_proper_subtype(t: Type, s: Type) -> bool:
         if isinstance(s, Instance):
             if not t.type.has_base(s.type.fullname()):
                 return False
-
-            def check_argument(left: Type, right: Type, variance: int) -> bool:
-                if variance == COVARIANT:
-                    return is_proper_subtype(left, right)
-                elif variance == CONTRAVARIANT:
-                    return is_proper_subtype(right, left)
-                else:
-                    return sametypes.is_same_type(left, right)
-
-            # Map left type to corresponding right instances.
-            t = map_instance_to_supertype(t, s.type)
-
-            return all(check_argument(ta, ra, tvar.variance) for ta, ra, tvar in
-                       zip(t.args, s.args, s.type.defn.type_vars))
+            key = subtype_cache_key(t, s, True)
+            if key is not None:
+                result = subtype_cache.get(key)
+                if result is None:
+                    result = is_proper_instance_subtype(t, s)
+                    subtype_cache.put(key, result)
+                return result
+            return is_proper_instance_subtype(t, s)
         return False
     else:
         return sametypes.is_same_type(t, s)
 
 
+def is_proper_instance_subtype(t: Instance, s: Instance) -> bool:
+    """Check if t is a proper subtype of s, assuming that t derives from s."""
+    def check_argument(left: Type, right: Type, variance: int) -> bool:
+        if variance == COVARIANT:
+            return is_proper_subtype(left, right)
+        elif variance == CONTRAVARIANT:
+            return is_proper_subtype(right, left)
+        else:
+            return sametypes.is_same_type(left, right)
+
+    # Map left type to corresponding right instances.
+    t = map_instance_to_supertype(t, s.type)
+
+    return all(check_argument(ta, ra, tvar.variance) for ta, ra, tvar in
+               zip(t.args, s.args, s.type.defn.type_vars))
+
+
 def is_more_precise(t: Type, s: Type) -> bool:
     """Check if t is a more precise type than s.
 
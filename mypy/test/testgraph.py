@@ -3,7 +3,7 @@
 from typing import AbstractSet, Dict, Set
 
 from mypy.myunit import Suite, assert_equal
-from mypy.build import BuildManager, State
+from mypy.build import BuildManager, State, parse_scanned_modules
 from mypy.build import topsort, strongly_connected_components, sorted_components, order_ascc
 from mypy.options import Options
 
@@ -31,14 +31,14 @@ class GraphSuite(Suite):
                       frozenset({'B', 'C'}),
                       frozenset({'D'})})
 
-    def _make_manager(self):
+    def _make_manager(self, options: Options = None):
         manager = BuildManager(
             data_dir='',
             lib_path=[],
             ignore_prefix='',
             source_set=None,
             reports=None,
-            options=Options())
+            options=options or Options())
         return manager
 
     def test_sorted_components(self) -> None:
@@ -63,3 +63,17 @@ class GraphSuite(Suite):
         ascc = res[0]
         scc = order_ascc(graph, ascc)
         assert_equal(scc, ['d', 'c', 'b', 'a'])
+
+    def test_parse_scanned_modules_keeps_missing_imports(self) -> None:
+        options = Options()
+        options.scan_imports = True
+        manager = self._make_manager(options)
+        manager.missing_modules.update({'m', 'n'})
+        st = State('a', None, 'import n', manager)
+        # 'n' was found missing while loading the graph.
+        st.suppressed = ['n']
+        # Simulate an import of a missing module that the scanner didn't see.
+        st.source = 'import n\nimport m'
+        parse_scanned_modules({'a': st}, manager)
+        # There is no builtins module to load in this test.
+        assert_equal(st.suppressed, ['n', 'm', 'builtins'])
@@ -0,0 +1,113 @@
+"""Test cases for the import scanner."""
+
+from typing import List, Tuple
+
+from mypy.myunit import Suite, assert_equal
+from mypy.importscan import scan_imports
+from mypy.nodes import Import, ImportFrom, ImportAll
+
+
+def describe(text: str, pyversion: Tuple[int, int] = (3, 5),
+             custom_typing_module: str = None) -> List[str]:
+    imports, _ = scan_imports(text, pyversion, custom_typing_module)
+    result = []
+    for imp in imports:
+        if isinstance(imp, Import):
+            desc = 'import %s' % ', '.join(id if as_id is None else '%s as %s' % (id, as_id)
+                                           for id, as_id in imp.ids)
+        elif isinstance(imp, ImportFrom):
+            desc = 'from %s%s import %s' % ('.' * imp.relative, imp.id,
+                                            ', '.join(name for name, _ in imp.names))
+        else:
+            assert isinstance(imp, ImportAll)
+            desc = 'from %s%s import *' % ('.' * imp.relative, imp.id)
+        flags = ''
+        if not imp.is_top_level:
+            flags += ' nested'
+        if imp.is_unreachable:
+            flags += ' unreachable'
+        result.append('%d: %s%s' % (imp.line, desc, flags))
+    return result
+
+
+class ImportScanSuite(Suite):
+
+    def test_simple_imports(self) -> None:
+        text = ('import a, b.c as d\n'
+                'from e import f, g as h\n'
+                'from . import i\n'
+                'from ..j import *\n')
+        assert_equal(describe(text), ['1: import a, b.c as d',
+                                      '2: from e import f, g',
+                                      '3: from . import i',
+                                      '4: from ..j import *'])
+
+    def test_multiline_imports(self) -> None:
+        text = ('from a import (b,\n'
+                '    c,  # comment\n'
+                ')\n'
+                'import d, \\\n'
+                '    e\n'
+                'x = 1; import f\n')
+        assert_equal(describe(text), ['1: from a import b, c',
+                                      '4: import d, e',
+                                      '6: import f'])
+
+    def test_strings_are_skipped(self) -> None:
+        text = ('"""\n'
+                'import a\n'
+                '"""\n'
+                "s = 'import b'\n"
+                'import c  # import d\n')
+        assert_equal(describe(text), ['5: import c'])
+
+    def test_nested_imports(self) -> None:
+        text = ('def f():\n'
+                '    import a\n'
+                'class C:\n'
+                '    if x:\n'
+                '        import b\n'
+                'try:\n'
+                '    import c\n'
+                'except ImportError: import d\n')
+        assert_equal(describe(text), ['2: import a nested',
+                                      '5: import b nested',
+                                      '7: import c',
+                                      '8: import d'])
+
+    def test_unreachable_imports(self) -> None:
+        text = ('import sys\n'
+                'if PY2:\n'
+                '    import a\n'
+                'elif MYPY:\n'
+                '    import b\n'
+                'else:\n'
+                '    import c\n'
+                'if not six.PY3:\n'
+                '    import d\n')
+        assert_equal(describe(text), ['1: import sys',
+                                      '3: import a unreachable',
+                                      '5: import b',
+                                      '7: import c unreachable',
+                                      '9: import d unreachable'])
+        assert_equal(describe(text, pyversion=(2, 7)), ['1: import sys',
+                                                        '3: import a',
+                                                        '5: import b unreachable',
+                                                        '7: import c unreachable',
+                                                        '9: import d'])
+
+    def test_translated_module_ids(self) -> None:
+        text = ('import __builtin__\n'
+                'import m\n'
+                'from m import x\n')
+        assert_equal(describe(text, pyversion=(2, 7), custom_typing_module='m'),
+                     ['1: import builtins as __builtin__',
+                      '2: import typing as m',
+                      '3: from typing import x'])
+
+    def test_type_ignore_lines(self) -> None:
+        text = ('import a  # type: ignore\n'
+                'x = 1\n'
+                'import b  #type:ignore\n')
+        _, ignored_lines = scan_imports(text, (3, 5))
+        assert_equal(ignored_lines, {1, 3})
@@ -430,6 +430,12 @@ class LexerSuite(Suite):
         prog = '# pass\n' * 1000
         self.assert_lex(prog, 'Eof(%s)' % repr(prog)[1:-1])
 
+    def test_names_are_interned(self):
+        toks = lex('foo_bar = 1\nfoo_bar\nif foo_bar: pass')[0]
+        names = [t.string for t in toks if t.string == 'foo_bar']
+        assert_equal(len(names), 3)
+        assert_equal(len(set(id(name) for name in names)), 1)
+
     # TODO
     #   invalid escape sequences in string literals etc.
 
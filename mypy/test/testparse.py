@@ -5,7 +5,7 @@ import os.path
 import typing
 
 from mypy import defaults
-from mypy.myunit import Suite, AssertionFailure
+from mypy.myunit import Suite, AssertionFailure, assert_equal, assert_true
 from mypy.test.helpers import assert_string_arrays_equal
 from mypy.test.data import parse_test_cases
 from mypy.test import config
@@ -77,3 +77,15 @@ def test_parse_error(testcase):
             testcase.output, e.messages,
             'Invalid compiler output ({}, line {})'.format(testcase.file,
                                                            testcase.line))
+
+
+class TypeAnnotationCacheSuite(Suite):
+    def test_repeated_type_comment(self):
+        src = 'x = None # type: List[int]\n\n\ny = None # type: List[int]\n'
+        tree = parse(bytes(src, 'ascii'), 'main', None, Options())
+        first, second = [s.type for s in tree.defs]
+        assert_equal(str(first), str(second))
+        assert_true(first is not second)
+        assert_true(first.args[0] is not second.args[0])
+        assert_equal([first.line, first.args[0].line], [1, 1])
+        assert_equal([second.line, second.args[0].line], [4, 4])
@@ -6,6 +6,7 @@ from mypy.myunit import Suite, assert_equal
 from mypy.constraints import SUPERTYPE_OF, SUBTYPE_OF, Constraint
 from mypy.solve import solve_constraints
 from mypy.typefixture import TypeFixture
+from mypy.types import Instance
 
 
 class SolveSuite(Suite):
@@ -134,6 +135,22 @@ class SolveSuite(Suite):
                            self.subc(self.fx.t, self.fx.a)],
                           [(self.fx.anyt, self.fx.anyt)])
 
+    def test_duplicate_constraints(self):
+        ga = Instance(self.fx.gi, [self.fx.a])
+        self.assert_solve(['T'],
+                          [self.supc(self.fx.t, self.fx.ga),
+                           self.supc(self.fx.t, ga),
+                           self.subc(self.fx.t, self.fx.go),
+                           self.subc(self.fx.t, self.fx.go),
+                           self.supc(self.fx.t, self.fx.ga)],
+                          [(self.fx.ga, self.fx.go)])
+        self.assert_solve(['T'],
+                          [self.supc(self.fx.t, self.fx.b),
+                           self.supc(self.fx.t, self.fx.c),
+                           self.supc(self.fx.t, self.fx.b),
+                           self.supc(self.fx.s, self.fx.d)],
+                          [(self.fx.a, self.fx.o)])
+
     def assert_solve(self, vars, constraints, results):
         res = []
         for r in results:
@@ -1,6 +1,6 @@
-from mypy.myunit import Suite, assert_true
+from mypy.myunit import Suite, assert_equal, assert_true
 from mypy.nodes import CONTRAVARIANT, INVARIANT, COVARIANT
-from mypy.subtypes import is_subtype
+from mypy.subtypes import is_subtype, is_proper_subtype, subtype_cache, subtype_cache_key
 from mypy.typefixture import TypeFixture, InterfaceTypeFixture
 
 
@@ -188,6 +188,25 @@ class SubtypingSuite(Suite):
     #  * any type
     #  * generic function types
 
+    def test_cached_subtype_checks(self):
+        subtype_cache.reset_stats()
+        self.assert_subtype(self.fx.b, self.fx.a)
+        self.assert_subtype(self.fx.b, self.fx.a)
+        assert_true(is_proper_subtype(self.fx.b, self.fx.a))
+        assert_equal((subtype_cache.hits, subtype_cache.misses), (1, 2))
+        self.assert_not_subtype(self.fx.a, self.fx.b)
+        assert_equal((subtype_cache.hits, subtype_cache.misses), (1, 3))
+
+    def test_subtype_checks_with_type_variables_are_not_cached(self):
+        assert_equal(subtype_cache_key(self.fx.gt, self.fx.ga, False), None)
+        assert_equal(subtype_cache_key(self.fx.ga, self.fx.gt, False), None)
+        assert_true(subtype_cache_key(self.fx.ga, self.fx.ga, False) is not None)
+
+    def test_subtype_cache_invalidated_by_mro_change(self):
+        self.assert_not_subtype(self.fx.d, self.fx.a)
+        self.fx.di.mro = [self.fx.di, self.fx.ai, self.fx.oi]
+        self.assert_subtype(self.fx.d, self.fx.a)
+
     def assert_subtype(self, s, t):
         assert_true(is_subtype(s, t), '{} not subtype of {}'.format(s, t))
 
@@ -2,19 +2,28 @@
 
 from typing import List
 
+import mypy.nodes
+import mypy.types
 from mypy.myunit import (
     Suite, assert_equal, assert_true, assert_false
 )
 from mypy.erasetype import erase_type
 from mypy.expandtype import expand_type
-from mypy.join import join_types
-from mypy.meet import meet_types
+from mypy.join import join_types, join_cache, type_pair_key
+from mypy.maptype import map_instance_to_supertype
+from mypy.meet import meet_types, meet_cache
 from mypy.types import (
     UnboundType, AnyType, Void, CallableType, TupleType, TypeVarDef, Type,
-    Instance, NoneTyp, ErrorType, Overloaded, TypeType,
+    Instance, NoneTyp, ErrorType, Overloaded, TypeType, UnionType, ErasedType, intern_type
+)
+from mypy.nodes import (
+    ARG_POS, ARG_OPT, ARG_STAR, CONTRAVARIANT, INVARIANT, COVARIANT, MDEF, SymbolTableNode, Var,
+    FuncDef, Block, Node
+)
+from mypy.sametypes import is_same_type
+from mypy.subtypes import (
+    is_subtype, is_more_precise, is_proper_subtype, restrict_subtype_away
 )
-from mypy.nodes import ARG_POS, ARG_OPT, ARG_STAR, CONTRAVARIANT, INVARIANT, COVARIANT
-from mypy.subtypes import is_subtype, is_more_precise, is_proper_subtype
 from mypy.typefixture import TypeFixture, InterfaceTypeFixture
 
 
@@ -92,6 +101,122 @@ class TypesSuite(Suite):
         c2 = CallableType([], [], [], Void(None), self.function, name=None, variables=v)
         assert_equal(str(c2), 'def [Y, X] ()')
 
+    def test_compact_layout(self):
+        # A subclass without __slots__ would silently bring back the per-instance __dict__.
+        for module, base in ((mypy.types, Type), (mypy.nodes, Node)):
+            for name, cls in vars(module).items():
+                if isinstance(cls, type) and issubclass(cls, base):
+                    assert_true('__slots__' in cls.__dict__, '{} has no __slots__'.format(name))
+        assert_false(hasattr(Instance(self.fx.ai, []), '__dict__'))
+        assert_false(hasattr(Var('x'), '__dict__'))
+
+
+class TypeInfoSuite(Suite):
+    def set_up(self):
+        self.fx = TypeFixture()
+
+    def test_member_lookup(self):
+        fx = self.fx
+        x = SymbolTableNode(MDEF, Var('x'))
+        fx.ai.names['x'] = x
+        assert_equal(fx.bi.lookup('x'), (fx.ai, x))
+        assert_equal(fx.bi.get_var('x'), x.node)
+        assert_equal(fx.bi.get_method('x'), None)
+        assert_equal(fx.bi.lookup('y'), (None, None))
+
+    def test_member_lookup_after_names_change(self):
+        fx = self.fx
+        fx.ai.names['x'] = SymbolTableNode(MDEF, Var('x'))
+        assert_equal(fx.bi.lookup('x')[0], fx.ai)
+        assert_equal(fx.bi.get('y'), None)
+        f = SymbolTableNode(MDEF, FuncDef('x', [], Block([])))
+        fx.bi.names['x'] = f
+        fx.ai.names['y'] = f
+        assert_equal(fx.bi.lookup('x'), (fx.bi, f))
+        assert_equal(fx.bi.get_method('x'), f.node)
+        assert_equal(fx.bi.get('y'), f)
+        del fx.bi.names['x']
+        assert_equal(fx.bi.lookup('x')[0], fx.ai)
+
+    def test_member_lookup_after_mro_change(self):
+        fx = self.fx
+        fx.ci.names['x'] = SymbolTableNode(MDEF, Var('x'))
+        assert_equal(fx.bi.get('x'), None)
+        fx.bi.mro = [fx.bi, fx.ci, fx.ai, fx.oi]
+        assert_equal(fx.bi.lookup('x')[0], fx.ci)
+
+
+class TypeInterningSuite(Suite):
+    def set_up(self):
+        self.fx = TypeFixture()
+
+    def test_intern_instance(self):
+        fx = self.fx
+        a = intern_type(Instance(fx.gi, [fx.a]))
+        assert_true(intern_type(Instance(fx.gi, [fx.a])) is a)
+        assert_false(intern_type(Instance(fx.gi, [fx.b])) is a)
+        assert_false(intern_type(Instance(fx.hi, [fx.a])) is a)
+        assert_true(is_same_type(a, a))
+
+    def test_intern_compound_types(self):
+        fx = self.fx
+        for make in (lambda: TupleType([fx.a, fx.b], fx.std_tuple),
+                     lambda: UnionType([fx.a, fx.nonet]),
+                     lambda: fx.callable(fx.a, fx.t, fx.b),
+                     lambda: TypeType(fx.a)):
+            t = intern_type(make())
+            assert_true(t.interned)
+            assert_true(intern_type(make()) is t)
+        assert_false(intern_type(fx.callable(fx.a, fx.b)) is intern_type(fx.callable(fx.b, fx.b)))
+
+    def test_types_that_are_not_interned(self):
+        fx = self.fx
+        t = Instance(fx.gi, [ErasedType()])
+        assert_true(intern_type(t) is t)
+        assert_false(t.interned)
+        assert_false(is_same_type(t, t))
+
+    def test_structural_equality(self):
+        fx = self.fx
+        ga = Instance(fx.gi, [fx.a])
+        assert_true(ga == Instance(fx.gi, [fx.a]))
+        assert_equal(hash(ga), hash(Instance(fx.gi, [fx.a])))
+        assert_true(ga != Instance(fx.gi, [fx.b]))
+        assert_equal({ga: 1}.get(Instance(fx.gi, [fx.a])), 1)
+        # Types that are the same type need not be equal, but they hash the same.
+        assert_true(AnyType() != AnyType(implicit=True))
+        assert_equal(hash(AnyType()), hash(AnyType(implicit=True)))
+        assert_true(is_same_type(AnyType(), AnyType(implicit=True)))
+        erased = Instance(fx.gi, [ErasedType()])
+        assert_true(erased == erased)
+        assert_true(erased != Instance(fx.gi, [erased.args[0]]))
+
+    def test_keys_of_instances_without_type_args_are_not_cached(self):
+        fx = self.fx
+        # Semantic analysis adds the missing type arguments later.
+        g = Instance(fx.gi, [])
+        assert_false(is_same_type(g, Instance(fx.gi, [fx.anyt])))
+        assert_false(g == Instance(fx.gi, [fx.anyt]))
+        g.args = [fx.anyt]
+        assert_true(is_same_type(g, Instance(fx.gi, [fx.anyt])))
+        assert_true(g == Instance(fx.gi, [fx.anyt]))
+        assert_equal(hash(g), hash(Instance(fx.gi, [fx.anyt])))
+
+    def test_keys_of_instances_with_wrong_number_of_type_args_are_not_cached(self):
+        fx = self.fx
+        # Semantic analysis replaces the type arguments later.
+        g = Instance(fx.gi, [fx.a, fx.b])
+        h = Instance(fx.gi, [g])
+        assert_false(is_same_type(g, Instance(fx.gi, [fx.anyt])))
+        assert_false(g == Instance(fx.gi, [fx.anyt]))
+        assert_false(h == Instance(fx.gi, [Instance(fx.gi, [fx.anyt])]))
+        g.args = [fx.anyt]
+        assert_true(is_same_type(g, Instance(fx.gi, [fx.anyt])))
+        assert_true(g == Instance(fx.gi, [fx.anyt]))
+        assert_equal(hash(g), hash(Instance(fx.gi, [fx.anyt])))
+        assert_true(h == Instance(fx.gi, [Instance(fx.gi, [fx.anyt])]))
+        assert_equal(hash(h), hash(Instance(fx.gi, [Instance(fx.gi, [fx.anyt])])))
+
 
 class TypeOpsSuite(Suite):
     def set_up(self):
@@ -116,6 +241,20 @@ class TypeOpsSuite(Suite):
     def test_expand_basic_generic_types(self):
         self.assert_expand(self.fx.gt, [(self.fx.t.id, self.fx.a)], self.fx.ga)
 
+    def test_expand_shares_subtrees_without_type_vars(self):
+        fx = self.fx
+        ga = Instance(fx.gi, [fx.a])
+        assert_true(expand_type(ga, {fx.t.id: fx.b}) is ga)
+        c = self.callable([], ga, fx.gt)
+        exp = expand_type(c, {fx.t.id: fx.b})
+        assert_true(exp.arg_types[0] is ga)
+        assert_equal(str(exp.ret_type), 'G[B*]')
+        # Unions are simplified and erased flags are dropped even without type variables.
+        u = UnionType([fx.a, fx.b])
+        assert_equal(str(expand_type(u, {})), 'A')
+        erased = Instance(fx.ai, [], erased=True)
+        assert_false(expand_type(erased, {}).erased)
+
     # IDEA: Add test cases for
     #   tuple types
     #   callable types
@@ -131,6 +270,25 @@ class TypeOpsSuite(Suite):
         # Remove erased tags (asterisks).
         assert_equal(str(exp).replace('*', ''), str(result))
 
+    # map_instance_to_supertype
+
+    def test_map_instance_to_supertype(self):
+        fx = self.fx
+        gs = Instance(fx.gsi, [fx.a, fx.b])
+        assert_true(map_instance_to_supertype(gs, fx.gsi) is gs)
+        assert_equal(str(map_instance_to_supertype(gs, fx.gi)), 'G[B*]')
+        assert_equal(str(map_instance_to_supertype(gs, fx.oi)), 'builtins.object')
+
+    def test_map_instance_to_indirect_supertype(self):
+        fx = self.fx
+        # class GSS(GS[List[T], A], Generic[T])
+        gssi = fx.make_type_info('GSS', mro=[fx.gsi, fx.gi, fx.oi], typevars=['T'],
+                                 bases=[Instance(fx.gsi, [Instance(fx.std_listi, [fx.t]), fx.a])])
+        gss = Instance(gssi, [fx.b])
+        assert_equal(str(map_instance_to_supertype(gss, fx.gsi)), 'GS[builtins.list[B*], A]')
+        assert_equal(str(map_instance_to_supertype(gss, fx.gi)), 'G[A*]')
+        assert_equal(str(gssi.supertype_templates[fx.gsi]), 'GS[builtins.list[T`1], A]')
+
     # erase_type
 
     def test_trivial_erase(self):
@@ -232,6 +390,27 @@ class TypeOpsSuite(Suite):
         assert_false(is_proper_subtype(fx.gb, fx.ga))
         assert_false(is_proper_subtype(fx.ga, fx.gb))
 
+    # Unions
+
+    def test_simplified_union(self):
+        fx = self.fx
+        make = UnionType.make_simplified_union
+        assert_equal(str(make([fx.b, fx.a, fx.c])), 'A')
+        assert_equal(str(make([fx.a, fx.d, fx.a])), 'Union[D, A]')
+        assert_equal(str(make([fx.b, UnionType([fx.d, fx.ga]), fx.gb, fx.d])),
+                     'Union[B, G[A], G[B], D]')
+        assert_equal(str(make([fx.d, fx.o, fx.ga])), 'builtins.object')
+
+    def test_subtype_of_union(self):
+        fx = self.fx
+        u = UnionType([fx.d, fx.a, fx.ga])
+        assert_true(u.has_item(fx.a))
+        assert_false(u.has_item(fx.b))
+        assert_equal([str(t) for t in u.possible_supertypes(fx.b)], ['A'])
+        assert_true(is_subtype(fx.b, u))
+        assert_false(is_subtype(fx.o, u))
+        assert_equal(str(restrict_subtype_away(u, UnionType([fx.a, fx.d]))), 'G[A]')
+
     # Helpers
 
     def tuple(self, *a):
@@ -484,6 +663,18 @@ class JoinSuite(Suite):
         self.assert_join(self.fx.type_type, self.fx.type_any, self.fx.type_type)
         self.assert_join(self.fx.type_b, self.fx.anyt, self.fx.anyt)
 
+    def test_cached_joins(self):
+        join_cache.reset_stats()
+        assert_true(join_types(self.fx.b, self.fx.c) is join_types(self.fx.b, self.fx.c))
+        assert_equal((join_cache.hits, join_cache.misses), (1, 1))
+        assert_equal(str(join_types(self.fx.c, self.fx.b)), 'A')
+        assert_equal((join_cache.hits, join_cache.misses), (1, 2))
+
+    def test_joins_with_type_variables_are_not_cached(self):
+        assert_equal(type_pair_key(self.fx.gt, self.fx.ga, join_cache), None)
+        assert_equal(type_pair_key(self.fx.ga, self.fx.t, join_cache), None)
+        assert_true(type_pair_key(self.fx.ga, self.fx.gb, join_cache) is not None)
+
     # There are additional test cases in check-inference.test.
 
     # TODO: Function types + varargs and default args.
@@ -701,6 +892,11 @@ class MeetSuite(Suite):
         self.assert_meet(self.fx.type_type, self.fx.type_any, self.fx.type_any)
         self.assert_meet(self.fx.type_b, self.fx.anyt, self.fx.type_b)
 
+    def test_cached_meets(self):
+        meet_cache.reset_stats()
+        assert_true(meet_types(self.fx.a, self.fx.b) is meet_types(self.fx.a, self.fx.b))
+        assert_equal((meet_cache.hits, meet_cache.misses), (1, 1))
+
     # FIX generic interfaces + ranges
 
     def assert_meet(self, s, t, meet):
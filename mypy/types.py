@@ -2,16 +2,18 @@
 
 from abc import abstractmethod
 from typing import (
-    Any, TypeVar, Dict, List, Tuple, cast, Generic, Set, Sequence, Optional, Union
+    Any, TypeVar, Dict, List, Tuple, cast, Generic, Set, Sequence, Optional, Union, Iterable
 )
 
 import mypy.nodes
 from mypy.nodes import INVARIANT, SymbolNode, Expression
 
 from mypy import experiments
+from mypy.util import MemoTable
 
 
 T = TypeVar('T')
+TypeT = TypeVar('TypeT', bound='Type')
 
 JsonDict = Dict[str, Any]
 
@@ -19,9 +21,21 @@ JsonDict = Dict[str, Any]
 class Type(mypy.nodes.Context):
     """Abstract base class for all types."""
 
-    line = 0
+    __slots__ = ('line', 'interned', 'expands_to_self', 'cached_key', 'cached_same_type_key',
+                 'cached_hash')
 
     def __init__(self, line: int = -1) -> None:
+        super().__init__()
+        # Is this the canonical object for the type (see intern_type)?
+        self.interned = False
+        # Is the type returned unchanged when expanding type variables? None if
+        # not known yet (see mypy.expandtype.expands_to_self).
+        self.expands_to_self = None  # type: Optional[bool]
+        # Structural keys and hash value, computed on demand (see type_key,
+        # same_type_key and __hash__).
+        self.cached_key = None  # type: Optional[Tuple[Any, ...]]
+        self.cached_same_type_key = None  # type: Optional[Tuple[Any, ...]]
+        self.cached_hash = None  # type: Optional[int]
         self.line = line
 
     def get_line(self) -> int:
@@ -33,6 +47,33 @@ class Type(mypy.nodes.Context):
     def __repr__(self) -> str:
         return self.accept(TypeStrVisitor())
 
+    def __eq__(self, other: object) -> bool:
+        # Types are equal if they are structurally identical (see type_key). Types
+        # without a key are only equal to themselves.
+        if self is other:
+            return True
+        if not isinstance(other, Type) or hash(self) != hash(other):
+            return False
+        key = type_key(self)
+        return key is not None and key == type_key(other)
+
+    def __ne__(self, other: object) -> bool:
+        return not (self == other)
+
+    def __hash__(self) -> int:
+        # Hash the same-type key if possible, so that types with different hash
+        # values are never the same type (see mypy.sametypes.is_same_type). It is
+        # coarser than the key used for equality.
+        if self.cached_hash is not None:
+            return self.cached_hash
+        key = same_type_key(self) or type_key(self)
+        if key is None:
+            return id(self)
+        if self.cached_same_type_key is not None or self.cached_key is not None:
+            self.cached_hash = hash(key)
+            return self.cached_hash
+        return hash(key)
+
     def serialize(self) -> JsonDict:
         raise NotImplementedError('Cannot serialize {} instance'.format(self.__class__.__name__))
 
@@ -101,22 +142,19 @@ class TypeVarId:
 class TypeVarDef(mypy.nodes.Context):
     """Definition of a single type variable."""
 
-    name = ''
-    id = None  # type: TypeVarId
-    values = None  # type: List[Type]  # Value restriction, empty list if no restriction
-    upper_bound = None  # type: Type
-    variance = INVARIANT  # type: int
-    line = 0
+    __slots__ = ('name', 'id', 'values', 'upper_bound', 'variance', 'line')
 
     def __init__(self, name: str, id: Union[TypeVarId, int], values: Optional[List[Type]],
                  upper_bound: Type, variance: int = INVARIANT, line: int = -1) -> None:
+        super().__init__()
         self.name = name
         if isinstance(id, int):
             id = TypeVarId(id)
-        self.id = id
-        self.values = values
-        self.upper_bound = upper_bound
-        self.variance = variance
+        self.id = id  # type: TypeVarId
+        # Value restriction, empty list if no restriction
+        self.values = values  # type: List[Type]
+        self.upper_bound = upper_bound  # type: Type
+        self.variance = variance  # type: int
         self.line = line
 
     @staticmethod
@@ -161,12 +199,7 @@ class TypeVarDef(mypy.nodes.Context):
 class UnboundType(Type):
     """Instance type that has not been bound during semantic analysis."""
 
-    name = ''
-    args = None  # type: List[Type]
-    # should this type be wrapped in an Optional?
-    optional = False
-    # is this type a return type?
-    is_ret_type = False
+    __slots__ = ('name', 'args', 'optional', 'is_ret_type')
 
     def __init__(self,
                  name: str,
@@ -177,8 +210,10 @@ class UnboundType(Type):
         if not args:
             args = []
         self.name = name
-        self.args = args
+        self.args = args  # type: List[Type]
+        # should this type be wrapped in an Optional?
         self.optional = optional
+        # is this type a return type?
         self.is_ret_type = is_ret_type
         super().__init__(line)
 
@@ -201,6 +236,8 @@ class UnboundType(Type):
 class ErrorType(Type):
     """The error type is used as the result of failed type operations."""
 
+    __slots__ = ()
+
     def accept(self, visitor: 'TypeVisitor[T]') -> T:
         return visitor.visit_error_type(self)
 
@@ -213,11 +250,11 @@ class TypeList(Type):
     but a syntactic AST construct.
     """
 
-    items = None  # type: List[Type]
+    __slots__ = ('items',)
 
     def __init__(self, items: List[Type], line: int = -1) -> None:
         super().__init__(line)
-        self.items = items
+        self.items = items  # type: List[Type]
 
     def accept(self, visitor: 'TypeVisitor[T]') -> T:
         return visitor.visit_type_list(self)
@@ -236,6 +273,8 @@ class TypeList(Type):
 class AnyType(Type):
     """The type 'Any'."""
 
+    __slots__ = ('implicit',)
+
     def __init__(self, implicit: bool = False, line: int = -1) -> None:
         super().__init__(line)
         self.implicit = implicit
@@ -259,7 +298,7 @@ class Void(Type):
     the result type of calling such callable.
     """
 
-    source = ''   # May be None; function that generated this value
+    __slots__ = ('source',)
 
     def __init__(self, source: str = None, line: int = -1) -> None:
         self.source = source
@@ -294,6 +333,8 @@ class UninhabitedType(Type):
         is_subtype(UninhabitedType, T) = True
     """
 
+    __slots__ = ()
+
     def __init__(self, line: int = -1) -> None:
         super().__init__(line)
 
@@ -327,6 +368,8 @@ class NoneTyp(Type):
         of a function, where 'None' means Void.
     """
 
+    __slots__ = ()
+
     def __init__(self, line: int = -1) -> None:
         super().__init__(line)
 
@@ -349,6 +392,8 @@ class ErasedType(Type):
     it is ignored during type inference.
     """
 
+    __slots__ = ()
+
     def accept(self, visitor: 'TypeVisitor[T]') -> T:
         return visitor.visit_erased_type(self)
 
@@ -359,7 +404,7 @@ class DeletedType(Type):
     These can be used as lvalues but not rvalues.
     """
 
-    source = ''   # May be None; name that generated this value
+    __slots__ = ('source',)
 
     def __init__(self, source: str = None, line: int = -1) -> None:
         self.source = source
@@ -384,22 +429,19 @@ class Instance(Type):
     The list of type variables may be empty.
     """
 
-    type = None  # type: mypy.nodes.TypeInfo
-    args = None  # type: List[Type]
-    erased = False      # True if result of type variable substitution
+    __slots__ = ('type', 'args', 'erased', 'type_ref')
 
     def __init__(self, typ: mypy.nodes.TypeInfo, args: List[Type],
                  line: int = -1, erased: bool = False) -> None:
-        self.type = typ
-        self.args = args
+        self.type_ref = None  # type: str
+        self.type = typ  # type: mypy.nodes.TypeInfo
+        self.args = args  # type: List[Type]
         self.erased = erased
         super().__init__(line)
 
     def accept(self, visitor: 'TypeVisitor[T]') -> T:
         return visitor.visit_instance(self)
 
-    type_ref = None  # type: str
-
     def serialize(self) -> JsonDict:
         data = {'.class': 'Instance',
                 }  # type: JsonDict
@@ -429,19 +471,16 @@ class TypeVarType(Type):
     type variable (id < 0).
     """
 
-    name = ''  # Name of the type variable (for messages and debugging)
-    id = None  # type: TypeVarId
-    values = None  # type: List[Type]  # Value restriction, empty list if no restriction
-    upper_bound = None  # type: Type   # Upper bound for values
-    # See comments in TypeVarDef for more about variance.
-    variance = INVARIANT  # type: int
+    __slots__ = ('name', 'id', 'values', 'upper_bound', 'variance')
 
     def __init__(self, binder: TypeVarDef, line: int = -1) -> None:
         self.name = binder.name
-        self.id = binder.id
-        self.values = binder.values
-        self.upper_bound = binder.upper_bound
-        self.variance = binder.variance
+        self.id = binder.id  # type: TypeVarId
+        # Value restriction, empty list if no restriction
+        self.values = binder.values  # type: List[Type]
+        self.upper_bound = binder.upper_bound  # type: Type  # Upper bound for values
+        # See comments in TypeVarDef for more about variance.
+        self.variance = binder.variance  # type: int
         super().__init__(line)
 
     def accept(self, visitor: 'TypeVisitor[T]') -> T:
@@ -477,6 +516,9 @@ class TypeVarType(Type):
 class FunctionLike(Type):
     """Abstract base class for function types."""
 
+    # Corresponding instance type (e.g. builtins.type); set by subclasses
+    __slots__ = ('fallback',)
+
     @abstractmethod
     def is_type_obj(self) -> bool: pass
 
@@ -492,9 +534,6 @@ class FunctionLike(Type):
     @abstractmethod
     def with_name(self, name: str) -> 'FunctionLike': pass
 
-    # Corresponding instance type (e.g. builtins.type)
-    fallback = None  # type: Instance
-
     @classmethod
     def deserialize(cls, data: JsonDict) -> 'FunctionLike':
         return cast(FunctionLike, super().deserialize(data))
@@ -509,6 +548,9 @@ class ConditionType(Type):
 
     A semantically analyzed type will never have ellipsis types.
     """
+
+    __slots__ = ()
+
     def __init__(self, line: int = -1) -> None:
         super().__init__(line)
 
@@ -527,30 +569,10 @@ class ConditionType(Type):
 class CallableType(FunctionLike):
     """Type of a non-overloaded callable object (function)."""
 
-    arg_types = None  # type: List[Type]  # Types of function arguments
-    arg_kinds = None  # type: List[int]   # mypy.nodes.ARG_ constants
-    arg_names = None  # type: List[str]   # None if not a keyword argument
-    min_args = 0                    # Minimum number of arguments; derived from arg_kinds
-    is_var_arg = False              # Is it a varargs function?  derived from arg_kinds
-    ret_type = None  # type: Type   # Return value type
-    name = ''                       # Name (may be None; for error messages)
-    definition = None  # type: SymbolNode # For error messages.  May be None.
-    # Type variables for a generic function
-    variables = None  # type: List[TypeVarDef]
-    # Is this Callable[..., t] (with literal '...')?
-    is_ellipsis_args = False
-    # Is this callable constructed for the benefit of a classmethod's 'cls' argument?
-    is_classmethod_class = False
-    # Was this type implicitly generated instead of explicitly specified by the user?
-    implicit = False
-    # Defined for signatures that require special handling (currently only value is 'dict'
-    # for a signature similar to 'dict')
-    special_sig = None  # type: Optional[str]
-
-    # condition for literals
-    condition = None  # type: Optional[Argument]
-
-    has_condition = False # type: bool
+    __slots__ = (
+        'arg_types', 'arg_kinds', 'arg_names', 'min_args', 'is_var_arg', 'ret_type', 'name',
+        'definition', 'variables', 'is_ellipsis_args', 'is_classmethod_class', 'implicit',
+        'special_sig', 'condition', 'has_condition')
 
     def __init__(self,
                  arg_types: List[Type],
@@ -568,6 +590,11 @@ class CallableType(FunctionLike):
                  special_sig: Optional[str] = None,
                  has_condition: Optional[bool] = None,
                  ) -> None:
+        # Is this callable constructed for the benefit of a classmethod's 'cls' argument?
+        self.is_classmethod_class = False
+        # condition for literals
+        self.condition = None  # type: Optional[Argument]
+        self.has_condition = False  # type: bool
         if variables is None:
             variables = []
         if "__condition__" in arg_names:
@@ -577,20 +604,25 @@ class CallableType(FunctionLike):
         if has_condition is not None and has_condition:
             self.has_condition = has_condition
 
-        self.arg_types = arg_types
-        self.arg_kinds = arg_kinds
-        self.arg_names = arg_names
+        self.arg_types = arg_types  # type: List[Type]  # Types of function arguments
+        self.arg_kinds = arg_kinds  # type: List[int]  # mypy.nodes.ARG_ constants
+        self.arg_names = arg_names  # type: List[str]  # None if not a keyword argument
         self.min_args = arg_kinds.count(mypy.nodes.ARG_POS)
         self.is_var_arg = mypy.nodes.ARG_STAR in arg_kinds
-        self.ret_type = ret_type
-        self.fallback = fallback
+        self.ret_type = ret_type  # type: Type  # Return value type
+        self.fallback = fallback  # type: Instance
         assert not name or '<bound method' not in name
         self.name = name
-        self.definition = definition
-        self.variables = variables
+        self.definition = definition  # type: SymbolNode  # For error messages.  May be None.
+        # Type variables for a generic function
+        self.variables = variables  # type: List[TypeVarDef]
+        # Is this Callable[..., t] (with literal '...')?
         self.is_ellipsis_args = is_ellipsis_args
+        # Was this type implicitly generated instead of explicitly specified by the user?
         self.implicit = implicit
-        self.special_sig = special_sig
+        # Defined for signatures that require special handling (currently only value is 'dict'
+        # for a signature similar to 'dict')
+        self.special_sig = special_sig  # type: Optional[str]
         super().__init__(line)
 
     def copy_modified(self,
@@ -710,11 +742,14 @@ class Overloaded(FunctionLike):
     implementation.
     """
 
-    _items = None  # type: List[CallableType]  # Must not be empty
+    __slots__ = ('_items', 'dispatch_index')
 
     def __init__(self, items: List[CallableType]) -> None:
-        self._items = items
-        self.fallback = items[0].fallback
+        self._items = items  # type: List[CallableType]  # Must not be empty
+        self.fallback = items[0].fallback  # type: Instance
+        # Items that can match calls of a given shape, computed on demand by the
+        # type checker (see mypy.checkexpr.ExpressionChecker.overload_candidates)
+        self.dispatch_index = {}  # type: Dict[Tuple[Any, ...], List[CallableType]]
         super().__init__(items[0].line)
 
     def items(self) -> List[CallableType]:
@@ -764,14 +799,12 @@ class TupleType(Type):
         implicit: if True, derived from a tuple expression (t,....) instead of Tuple[t, ...]
     """
 
-    items = None  # type: List[Type]
-    fallback = None  # type: Instance
-    implicit = False
+    __slots__ = ('items', 'fallback', 'implicit')
 
     def __init__(self, items: List[Type], fallback: Instance, line: int = -1,
                  implicit: bool = False) -> None:
-        self.items = items
-        self.fallback = fallback
+        self.items = items  # type: List[Type]
+        self.fallback = fallback  # type: Instance
         self.implicit = implicit
         super().__init__(line)
 
@@ -802,10 +835,10 @@ class StarType(Type):
     This is not a real type but a syntactic AST construct.
     """
 
-    type = None  # type: Type
+    __slots__ = ('type',)
 
     def __init__(self, type: Type, line: int = -1) -> None:
-        self.type = type
+        self.type = type  # type: Type
         super().__init__(line)
 
     def accept(self, visitor: 'TypeVisitor[T]') -> T:
@@ -815,10 +848,14 @@ class StarType(Type):
 class UnionType(Type):
     """The union type Union[T1, ..., Tn] (at least one type argument)."""
 
-    items = None  # type: List[Type]
+    __slots__ = ('items', 'item_keys', 'instance_items', 'other_items')
 
     def __init__(self, items: List[Type], line: int = -1) -> None:
-        self.items = items
+        self.items = items  # type: List[Type]
+        # Index of items, calculated on demand by index_items
+        self.item_keys = None  # type: Set[Tuple[Any, ...]]
+        self.instance_items = None  # type: Dict[str, List[Instance]]
+        self.other_items = None  # type: List[Type]
         super().__init__(line)
 
     @staticmethod
@@ -847,16 +884,78 @@ class UnionType(Type):
         if any(isinstance(typ, AnyType) for typ in items):
             return AnyType()
 
+        # Remove duplicate items first. Of identical items, the pairwise check
+        # below would keep only the last one.
+        keys = [type_key(typ) for typ in items]
+        last = {key: i for i, key in enumerate(keys)}
+        items = [typ for i, typ in enumerate(items) if keys[i] is None or last[keys[i]] == i]
+
+        # An instance can only be a subtype of an instance of one of its
+        # supertypes, so instance items are only compared with those and with
+        # items of other kinds.
+        instances = {}  # type: Dict[str, List[int]]
+        others = []  # type: List[int]
+        for i, typ in enumerate(items):
+            if isinstance(typ, Instance):
+                instances.setdefault(typ.type.fullname(), []).append(i)
+            else:
+                others.append(i)
+
         from mypy.subtypes import is_subtype
         removed = set()  # type: Set[int]
-        for i in range(len(items)):
-            if any(is_subtype(items[i], items[j]) for j in range(len(items))
+        for i, typ in enumerate(items):
+            candidates = range(len(items))  # type: Iterable[int]
+            if isinstance(typ, Instance):
+                names = supertype_names(typ.type)
+                if names is not None:
+                    candidates = others + [j for name in names for j in instances.get(name, [])]
+            if any(is_subtype(typ, items[j]) for j in candidates
                    if j not in removed and j != i):
                 removed.add(i)
 
         simplified_set = [items[i] for i in range(len(items)) if i not in removed]
         return UnionType.make_union(simplified_set)
 
+    def has_item(self, t: Type) -> bool:
+        """Is t structurally identical to an item of the union?"""
+        key = type_key(t)
+        if key is None:
+            return False
+        if self.item_keys is None:
+            self.index_items()
+        return key in self.item_keys
+
+    def possible_supertypes(self, t: Type) -> List[Type]:
+        """Return the items of the union that t may be a subtype of.
+
+        An instance can only be a subtype of instances of its supertypes (and
+        of types other than instances). For other types, return all items.
+        """
+        if isinstance(t, Instance):
+            names = supertype_names(t.type)
+            if names is not None:
+                if self.instance_items is None:
+                    self.index_items()
+                result = list(self.other_items)
+                for name in names:
+                    result.extend(self.instance_items.get(name, []))
+                return result
+        return self.items
+
+    def index_items(self) -> None:
+        """Index items by structure and by class for has_item and possible_supertypes.
+
+        The items must not be modified after this.
+        """
+        self.item_keys = set(type_key(item) for item in self.items)
+        self.instance_items = {}
+        self.other_items = []
+        for item in self.items:
+            if isinstance(item, Instance):
+                self.instance_items.setdefault(item.type.fullname(), []).append(item)
+            else:
+                self.other_items.append(item)
+
     def length(self) -> int:
         return len(self.items)
 
@@ -887,12 +986,11 @@ class UnionType(Type):
 class LiteralType(Type):
     """This is a modifier to a type to indicate an expression that is statically computable."""
 
-    base = None  # type: Type
-    value = None # type: Optional[Expression]
+    __slots__ = ('base', 'value')
 
     def __init__(self, base: Type, value=None, line: int = -1) -> None:
-        self.base = base
-        self.value = value
+        self.base = base  # type: Type
+        self.value = value  # type: Optional[Expression]
         super().__init__(line)
 
     def accept(self, visitor: 'TypeVisitor[T]'):
@@ -924,18 +1022,17 @@ class PartialType(Type):
           x = 1  # Infer actual type int for x
     """
 
-    # None for the 'None' partial type; otherwise a generic class
-    type = None  # type: Optional[mypy.nodes.TypeInfo]
-    var = None  # type: mypy.nodes.Var
-    inner_types = None  # type: List[Type]
+    __slots__ = ('type', 'var', 'inner_types')
 
     def __init__(self,
                  type: Optional['mypy.nodes.TypeInfo'],
                  var: 'mypy.nodes.Var',
                  inner_types: List[Type]) -> None:
-        self.type = type
-        self.var = var
-        self.inner_types = inner_types
+        super().__init__()
+        # None for the 'None' partial type; otherwise a generic class
+        self.type = type  # type: Optional[mypy.nodes.TypeInfo]
+        self.var = var  # type: mypy.nodes.Var
+        self.inner_types = inner_types  # type: List[Type]
 
     def accept(self, visitor: 'TypeVisitor[T]') -> T:
         return visitor.visit_partial_type(self)
@@ -949,6 +1046,8 @@ class EllipsisType(Type):
     A semantically analyzed type will never have ellipsis types.
     """
 
+    __slots__ = ()
+
     def accept(self, visitor: 'TypeVisitor[T]') -> T:
         return visitor.visit_ellipsis_type(self)
 
@@ -989,13 +1088,13 @@ class TypeType(Type):
     assumption).
     """
 
-    # This can't be everything, but it can be a class reference,
-    # a generic class instance, a union, Any, a type variable...
-    item = None  # type: Type
+    __slots__ = ('item',)
 
     def __init__(self, item: Type, *, line: int = -1) -> None:
         super().__init__(line)
-        self.item = item
+        # This can't be everything, but it can be a class reference,
+        # a generic class instance, a union, Any, a type variable...
+        self.item = item  # type: Type
 
     def accept(self, visitor: 'TypeVisitor[T]') -> T:
         return visitor.visit_type_type(self)
@@ -1464,3 +1563,248 @@ def is_named_instance(t: Type, fullname: str) -> bool:
     return (isinstance(t, Instance) and
             t.type is not None and
             t.type.fullname() == fullname)
+
+
+def supertype_names(info: mypy.nodes.TypeInfo) -> Optional[Set[str]]:
+    """Return the full names of classes that may have instances of info as subtypes.
+
+    Return None if an instance of info may be a subtype of any instance.
+    """
+    names = set()  # type: Set[str]
+    while True:
+        if info.fallback_to_any:
+            return None
+        if info.mro:
+            names.update(base.fullname() for base in info.mro)
+        names.add('builtins.object')
+        if info._promote is None:
+            return names
+        if not isinstance(info._promote, Instance):
+            return None
+        info = info._promote.type
+
+
+# Canonical type objects by structural key (see intern_type).
+interned_types = MemoTable('Interned type', 100000)  # type: MemoTable[Tuple[Any, ...], Type]
+
+
+def intern_type(t: TypeT) -> TypeT:
+    """Return the canonical object that is structurally identical to a type.
+
+    Instances, tuple types, union types and callable types (and the types
+    they are built from) can be interned. Other types are returned as such.
+    Interned types are shared, so they must not be modified, and their line
+    numbers are not meaningful.
+    """
+    if t.interned:
+        return t
+    key = type_key(t)
+    if key is None:
+        return t
+    return intern_type_by_key(t, key)
+
+
+def intern_type_var_free(t: TypeT) -> Optional[TypeT]:
+    """Like intern_type, but return None if the type can't be interned or refers to type variables.
+
+    The identity of the result can be used as a cache key for operations
+    whose results only depend on the structure of types.
+    """
+    key = type_key(t, type_vars=False)
+    if key is None:
+        return None
+    return intern_type_by_key(t, key)
+
+
+def intern_type_by_key(t: TypeT, key: Tuple[Any, ...]) -> TypeT:
+    canonical = interned_types.get(key)
+    if canonical is None:
+        t.interned = True
+        interned_types.put(key, t)
+        return t
+    return cast(TypeT, canonical)
+
+
+def type_key(t: Type, type_vars: bool = True) -> Optional[Tuple[Any, ...]]:
+    """Return a hashable key describing the structure of a type.
+
+    Return None if the type can't be interned. This is the case for types
+    that are not the same type as themselves (such as erased types) or that
+    may be modified after construction (such as partial types). If type_vars
+    is False, also return None for types that refer to type variables.
+
+    Keys that include type variables are cached in the type once it can no
+    longer change (see is_complete).
+    """
+    if not type_vars:
+        return make_type_key(t, False)
+    key = t.cached_key
+    if key is None:
+        key = make_type_key(t, True)
+        if key is not None and is_complete(t):
+            t.cached_key = key
+    return key
+
+
+def is_complete(t: Type) -> bool:
+    """Have the cached keys of all the types t is built from been computed?
+
+    Semantic analysis pass 3 replaces the type arguments of instances with
+    a wrong number of them in place, so we don't cache the keys of such
+    instances or of types that contain them.
+    """
+    if isinstance(t, Instance):
+        if len(t.args) != len(t.type.type_vars):
+            return False
+        components = list(t.args)
+    elif isinstance(t, TypeVarType):
+        components = list(t.values) + [t.upper_bound]
+    elif isinstance(t, TupleType):
+        components = list(t.items) + [t.fallback]
+    elif isinstance(t, UnionType):
+        components = list(t.items)
+    elif isinstance(t, CallableType):
+        components = list(t.arg_types) + [t.ret_type, t.fallback]
+        for tv in t.variables:
+            components.extend(tv.values)
+            components.append(tv.upper_bound)
+    elif isinstance(t, TypeType):
+        components = [t.item]
+    else:
+        components = []
+    return all(component.cached_key is not None for component in components)
+
+
+def make_type_key(t: Type, type_vars: bool) -> Optional[Tuple[Any, ...]]:
+    if isinstance(t, Instance):
+        args = type_keys(t.args, type_vars)
+        if args is None or t.type is None:
+            return None
+        return ('Instance', t.type, args, t.erased)
+    elif isinstance(t, AnyType):
+        return ('Any', t.implicit)
+    elif isinstance(t, NoneTyp):
+        return ('None',)
+    elif isinstance(t, Void):
+        return ('Void', t.source)
+    elif isinstance(t, UninhabitedType):
+        return ('Uninhabited',)
+    elif isinstance(t, TypeVarType):
+        if not type_vars:
+            return None
+        values = type_keys(t.values)
+        upper_bound = type_key(t.upper_bound)
+        if values is None or upper_bound is None:
+            return None
+        return ('TypeVar', t.name, t.id, values, upper_bound, t.variance)
+    elif isinstance(t, TupleType):
+        items = type_keys(t.items, type_vars)
+        fallback = type_key(t.fallback, type_vars)
+        if items is None or fallback is None:
+            return None
+        return ('Tuple', items, fallback, t.implicit)
+    elif isinstance(t, UnionType):
+        items = type_keys(t.items, type_vars)
+        if items is None:
+            return None
+        return ('Union', items)
+    elif isinstance(t, CallableType):
+        if t.has_condition or (t.variables and not type_vars):
+            return None
+        arg_types = type_keys(t.arg_types, type_vars)
+        ret_type = type_key(t.ret_type, type_vars)
+        fallback = type_key(t.fallback, type_vars)
+        variables = []  # type: List[Tuple[Any, ...]]
+        for tv in t.variables:
+            values = type_keys(tv.values)
+            upper_bound = type_key(tv.upper_bound)
+            if values is None or upper_bound is None:
+                return None
+            variables.append((tv.name, tv.id, values, upper_bound, tv.variance))
+        if arg_types is None or ret_type is None or fallback is None:
+            return None
+        return ('Callable', arg_types, tuple(t.arg_kinds), tuple(t.arg_names), ret_type,
+                fallback, t.name, t.definition, tuple(variables), t.is_ellipsis_args,
+                t.implicit, t.is_classmethod_class, t.special_sig)
+    elif isinstance(t, TypeType):
+        item = type_key(t.item, type_vars)
+        if item is None:
+            return None
+        return ('Type', item)
+    return None
+
+
+def type_keys(types: Sequence[Type],
+              type_vars: bool = True) -> Optional[Tuple[Tuple[Any, ...], ...]]:
+    keys = []  # type: List[Tuple[Any, ...]]
+    for t in types:
+        key = type_key(t, type_vars)
+        if key is None:
+            return None
+        keys.append(key)
+    return tuple(keys)
+
+
+def same_type_key(t: Type) -> Optional[Tuple[Any, ...]]:
+    """Return a hashable key that describes the parts of a type is_same_type compares.
+
+    Two types with keys are the same type (see mypy.sametypes.is_same_type)
+    exactly when their keys are equal. Return None for types that
+    is_same_type doesn't compare structurally, such as union types (which
+    are simplified first), unbound types (which are the same as any type)
+    and erased types (which aren't the same as any type), and for types
+    that contain them. The key is cached in the type.
+    """
+    key = t.cached_same_type_key
+    if key is not None:
+        return key
+    if isinstance(t, Instance):
+        if t.type is None or len(t.args) != len(t.type.type_vars):
+            # The type arguments may still be replaced (see is_complete).
+            return None
+        args = same_type_keys(t.args)
+        if args is None:
+            return None
+        key = ('Instance', t.type, args)
+    elif isinstance(t, (AnyType, NoneTyp, Void, UninhabitedType, DeletedType)):
+        key = (type(t).__name__,)
+    elif isinstance(t, TypeVarType):
+        key = ('TypeVar', t.id)
+    elif isinstance(t, TupleType):
+        items = same_type_keys(t.items)
+        if items is None:
+            return None
+        key = ('Tuple', items)
+    elif isinstance(t, CallableType):
+        if t.has_condition or t.fallback.type is None:
+            return None
+        arg_types = same_type_keys(t.arg_types)
+        ret_type = same_type_key(t.ret_type)
+        if arg_types is None or ret_type is None:
+            return None
+        key = ('Callable', arg_types, tuple(t.arg_kinds), tuple(t.arg_names), ret_type,
+               t.is_type_obj(), t.is_ellipsis_args)
+    elif isinstance(t, Overloaded):
+        items = same_type_keys(t.items())
+        if items is None:
+            return None
+        key = ('Overloaded', items)
+    elif isinstance(t, TypeType):
+        item = same_type_key(t.item)
+        if item is None:
+            return None
+        key = ('Type', item)
+    else:
+        return None
+    t.cached_same_type_key = key
+    return key
+
+
+def same_type_keys(types: Sequence[Type]) -> Optional[Tuple[Tuple[Any, ...], ...]]:
+    keys = []  # type: List[Tuple[Any, ...]]
+    for t in types:
+        key = same_type_key(t)
+        if key is None:
+            return None
+        keys.append(key)
+    return tuple(keys)
@@ -2,10 +2,12 @@
 
 import re
 import subprocess
-from typing import TypeVar, List, Any, Tuple, Optional
+from typing import TypeVar, List, Any, Tuple, Optional, Dict, Generic
 
 
 T = TypeVar('T')
+K = TypeVar('K')
+V = TypeVar('V')
 
 ENCODING_RE = re.compile(br'([ \t\v]*#.*(\r\n?|\n))??[ \t\v]*#.*coding[:=][ \t]*([-\w.]+)')
 
@@ -100,3 +102,59 @@ def try_find_python2_interpreter() -> Optional[str]:
         except OSError:
             pass
     return None
+
+
+class MemoTable(Generic[K, V]):
+    """A bounded memo table that counts hits and misses.
+
+    The table is simply emptied when it fills up; the typical use is
+    caching results that are cheap to recompute but requested very often.
+    All tables register themselves in memo_tables so that the build can
+    report their hit rates.
+    """
+
+    def __init__(self, name: str, max_size: int) -> None:
+        self.name = name
+        self.max_size = max_size
+        self.table = {}  # type: Dict[K, V]
+        self.hits = 0
+        self.misses = 0
+        # Generation of the data the entries were computed from (see validate)
+        self.generation = None  # type: object
+        memo_tables.append(self)
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the value stored for key, or None if there is none."""
+        value = self.table.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        if len(self.table) >= self.max_size:
+            self.table.clear()
+        self.table[key] = value
+
+    def clear(self) -> None:
+        self.table.clear()
+
+    def validate(self, generation: object) -> None:
+        """Empty the table if the entries were computed from an older generation of data."""
+        if generation != self.generation:
+            self.table.clear()
+            self.generation = generation
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> str:
+        total = self.hits + self.misses
+        rate = 100.0 * self.hits / total if total else 0.0
+        return '%s cache: %d hits, %d misses (%.1f%% hit rate), %d entries' % (
+            self.name, self.hits, self.misses, rate, len(self.table))
+
+
+memo_tables = []  # type: List[MemoTable[Any, Any]]